@@ -1,13 +1,13 @@
 """YAML configuration loader.
 
-Loads and validates configuration from YAML files. Supports default
-location (`./config/agent-core.yaml`) and environment variable override
-(`AGENT_CORE_CONFIG`).
+Loads and validates configuration from YAML files or text streams.
+Supports default location (`./config/agent-core.yaml`) and environment
+variable override (`AGENT_CORE_CONFIG`).
 """
 
 import os
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
 import yaml
 from pydantic import ValidationError
@@ -21,17 +21,18 @@ class ConfigurationError(Exception):
     pass
 
 
-def load_config(config_path: str | None = None) -> AgentCoreConfig:
-    """Load configuration from YAML file.
+def load_config(config_path: str | os.PathLike[str] | IO[str] | None = None) -> AgentCoreConfig:
+    """Load configuration from YAML file or text stream.
 
     Configuration is loaded from:
-    1. `config_path` if provided
+    1. `config_path` if provided (a path or an open text stream)
     2. `AGENT_CORE_CONFIG` environment variable if set
     3. `./config/agent-core.yaml` as default
 
     Args:
-        config_path: Optional path to configuration file. If None, uses
-            environment variable or default location.
+        config_path: Optional path to configuration file, or a readable text
+            stream containing YAML. If None, uses environment variable or
+            default location.
 
     Returns:
         Validated AgentCoreConfig instance.
@@ -46,6 +47,14 @@ def load_config(config_path: str | None = None) -> AgentCoreConfig:
         if config_path is None:
             config_path = "./config/agent-core.yaml"
 
+    # Streams are parsed directly, skipping filesystem checks
+    if not isinstance(config_path, (str, os.PathLike)):
+        try:
+            config_data = yaml.safe_load(config_path)
+        except yaml.YAMLError as e:
+            raise ConfigurationError(f"Failed to parse YAML configuration stream: {e}") from e
+        return _validate_config_data(config_data, "stream")
+
     config_path = Path(config_path)
 
     # Check if file exists
@@ -70,6 +79,22 @@ def load_config(config_path: str | None = None) -> AgentCoreConfig:
     except OSError as e:
         raise ConfigurationError(f"Failed to read configuration file {config_path}: {e}") from e
 
+    return _validate_config_data(config_data, str(config_path))
+
+
+def _validate_config_data(config_data: Any, source: str) -> AgentCoreConfig:
+    """Validate parsed YAML data against the root configuration schema.
+
+    Args:
+        config_data: Parsed YAML data (None for empty documents).
+        source: Description of where the data was loaded from (for errors).
+
+    Returns:
+        Validated AgentCoreConfig instance.
+
+    Raises:
+        ConfigurationError: If validation fails.
+    """
     # Handle empty file (yaml.safe_load returns None for empty files)
     if config_data is None:
         config_data = {}
@@ -78,7 +103,7 @@ def load_config(config_path: str | None = None) -> AgentCoreConfig:
     try:
         return AgentCoreConfig(**config_data)
     except ValidationError as e:
-        raise ConfigurationError(f"Configuration validation failed for {config_path}: {e}") from e
+        raise ConfigurationError(f"Configuration validation failed for {source}: {e}") from e
 
 
 def load_config_from_dict(config_data: dict[str, Any]) -> AgentCoreConfig:
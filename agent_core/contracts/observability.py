@@ -36,6 +36,8 @@ class CorrelationFields(BaseModel):
     audit events to enable end-to-end correlation.
     """
 
+    model_config = {"frozen": True}
+
     run_id: str = Field(
         ...,
         description="Unique identifier for a single execution lifecycle.",
@@ -70,6 +72,8 @@ class LogEvent(BaseModel):
     by default.
     """
 
+    model_config = {"frozen": True}
+
     correlation: CorrelationFields = Field(
         ...,
         description="Required correlation fields.",
@@ -123,6 +127,8 @@ class TraceSpan(BaseModel):
     correlation fields and attributes describing the operation.
     """
 
+    model_config = {"frozen": True}
+
     correlation: CorrelationFields = Field(
         ...,
         description="Required correlation fields.",
@@ -148,6 +154,8 @@ class MetricValue(BaseModel):
     high-cardinality labels (e.g., run_id must not be a label).
     """
 
+    model_config = {"frozen": True}
+
     correlation: CorrelationFields = Field(
         ...,
         description="Required correlation fields.",
@@ -177,6 +185,8 @@ class AuditEvent(BaseModel):
     side-effect-relevant actions. They cannot be disabled in production.
     """
 
+    model_config = {"frozen": True}
+
     correlation: CorrelationFields = Field(
         ...,
         description="Required correlation fields.",
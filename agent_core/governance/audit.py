@@ -14,6 +14,7 @@ from agent_core.contracts.observability import (
     CorrelationFields,
 )
 from agent_core.observability.interface import ObservabilitySink
+from agent_core.observability.noop import NOOP_SINK
 
 
 class AuditEmissionError(Exception):
@@ -68,49 +69,98 @@ class AuditEmitter:
         self.context = context
         self.sink = sink
 
-    def emit_permission_decision(
+    def _correlation(self, component_id: str) -> CorrelationFields:
+        """Build correlation fields for an audit event.
+
+        Every input is either taken from the already validated execution
+        context or fixed by this emitter, so the model is constructed
+        without re-running field validation.
+
+        Args:
+            component_id: Governance component emitting the event.
+
+        Returns:
+            CorrelationFields for the event.
+        """
+        return CorrelationFields.model_construct(
+            run_id=self.context.run_id,
+            correlation_id=self.context.correlation_id,
+            component_type=ComponentType.RUNTIME,
+            component_id=component_id,
+            component_version="1.0.0",
+            timestamp=datetime.now(timezone.utc).isoformat(),
+        )
+
+    def _emit(
         self,
+        component_id: str,
         action: str,
         target_resource: str,
         decision_outcome: str,
-        permission: str | None = None,
+        policy_or_permission: str | None,
+        decision_kind: str,
     ) -> None:
-        """Emit audit event for a permission decision.
+        """Build and emit a single audit event.
+
+        Every public emit method goes through here, so the no-op sink check
+        and error wrapping apply to all of them.
 
         Args:
-            action: Action performed (e.g., 'tool.execute').
-            target_resource: Target resource identifier (e.g., 'tool:my_tool').
-            decision_outcome: Decision outcome ('allowed' or 'denied').
-            permission: Optional permission identifier involved.
+            component_id: Governance component emitting the event.
+            action: Action performed.
+            target_resource: Target resource identifier.
+            decision_outcome: Decision outcome.
+            policy_or_permission: Optional policy or permission identifier.
+            decision_kind: Decision description used in the error message.
 
         Raises:
             AuditEmissionError: If audit emission fails.
         """
-        correlation = CorrelationFields(
-            run_id=self.context.run_id,
-            correlation_id=self.context.correlation_id,
-            component_type=ComponentType.RUNTIME,
-            component_id="governance:permissions",
-            component_version="1.0.0",
-            timestamp=datetime.now(timezone.utc).isoformat(),
-        )
+        if self.sink is NOOP_SINK:
+            # The shared no-op sink discards events; skip building them
+            return
 
         audit_event = AuditEvent(
-            correlation=correlation,
+            correlation=self._correlation(component_id),
             initiator_identity=self.context.initiator,
             action=action,
             target_resource=target_resource,
             decision_outcome=decision_outcome,
-            policy_or_permission=permission,
+            policy_or_permission=policy_or_permission,
         )
 
         try:
             self.sink.emit_audit(audit_event)
         except Exception as e:
             # Audit failures may terminate execution per audit rules
-            raise AuditEmissionError(
-                f"Failed to emit audit event for permission decision: {e}"
-            ) from e
+            raise AuditEmissionError(f"Failed to emit audit event for {decision_kind}: {e}") from e
+
+    def emit_permission_decision(
+        self,
+        action: str,
+        target_resource: str,
+        decision_outcome: str,
+        permission: str | None = None,
+    ) -> None:
+        """Emit audit event for a permission decision.
+
+        Args:
+            action: Action performed (e.g., 'tool.execute').
+            target_resource: Target resource identifier (e.g., 'tool:my_tool').
+            decision_outcome: Decision outcome ('allowed' or 'denied').
+            permission: Optional permission identifier involved.
+
+        Raises:
+            AuditEmissionError: If audit emission fails.
+        """
+        self._emit(
+            "governance:permissions",
+            action,
+            target_resource,
+            decision_outcome,
+            permission,
+            "permission decision",
+        )
 
     def emit_policy_decision(
         self,
@@ -130,30 +180,15 @@ class AuditEmitter:
         Raises:
             AuditEmissionError: If audit emission fails.
         """
-        correlation = CorrelationFields(
-            run_id=self.context.run_id,
-            correlation_id=self.context.correlation_id,
-            component_type=ComponentType.RUNTIME,
-            component_id="governance:policy",
-            component_version="1.0.0",
-            timestamp=datetime.now(timezone.utc).isoformat(),
-        )
-
-        audit_event = AuditEvent(
-            correlation=correlation,
-            initiator_identity=self.context.initiator,
-            action=action,
-            target_resource=target_resource,
-            decision_outcome=decision_outcome,
-            policy_or_permission=policy,
+        self._emit(
+            "governance:policy",
+            action,
+            target_resource,
+            decision_outcome,
+            policy,
+            "policy decision",
         )
 
-        try:
-            self.sink.emit_audit(audit_event)
-        except Exception as e:
-            # Audit failures may terminate execution per audit rules
-            raise AuditEmissionError(f"Failed to emit audit event for policy decision: {e}") from e
-
     def emit_budget_exhaustion(
         self,
         budget_type: str,
@@ -170,36 +205,15 @@ class AuditEmitter:
         Raises:
             AuditEmissionError: If audit emission fails.
         """
-        correlation = CorrelationFields(
-            run_id=self.context.run_id,
-            correlation_id=self.context.correlation_id,
-            component_type=ComponentType.RUNTIME,
-            component_id="governance:budget",
-            component_version="1.0.0",
-            timestamp=datetime.now(timezone.utc).isoformat(),
+        self._emit(
+            "governance:budget",
+            f"budget.exhausted.{budget_type}",
+            f"budget:{budget_type}",
+            "denied",
+            None,
+            "budget exhaustion",
         )
 
-        action = f"budget.exhausted.{budget_type}"
-        target_resource = f"budget:{budget_type}"
-        decision_outcome = "denied"
-
-        audit_event = AuditEvent(
-            correlation=correlation,
-            initiator_identity=self.context.initiator,
-            action=action,
-            target_resource=target_resource,
-            decision_outcome=decision_outcome,
-            policy_or_permission=None,
-        )
-
-        try:
-            self.sink.emit_audit(audit_event)
-        except Exception as e:
-            # Audit failures may terminate execution per audit rules
-            raise AuditEmissionError(
-                f"Failed to emit audit event for budget exhaustion: {e}"
-            ) from e
-
     def emit_governance_decision(
         self,
         action: str,
@@ -222,28 +236,11 @@ class AuditEmitter:
         Raises:
             AuditEmissionError: If audit emission fails.
         """
-        correlation = CorrelationFields(
-            run_id=self.context.run_id,
-            correlation_id=self.context.correlation_id,
-            component_type=ComponentType.RUNTIME,
-            component_id=component_id,
-            component_version="1.0.0",
-            timestamp=datetime.now(timezone.utc).isoformat(),
+        self._emit(
+            component_id,
+            action,
+            target_resource,
+            decision_outcome,
+            policy_or_permission,
+            "governance decision",
         )
-
-        audit_event = AuditEvent(
-            correlation=correlation,
-            initiator_identity=self.context.initiator,
-            action=action,
-            target_resource=target_resource,
-            decision_outcome=decision_outcome,
-            policy_or_permission=policy_or_permission,
-        )
-
-        try:
-            self.sink.emit_audit(audit_event)
-        except Exception as e:
-            # Audit failures may terminate execution per audit rules
-            raise AuditEmissionError(
-                f"Failed to emit audit event for governance decision: {e}"
-            ) from e
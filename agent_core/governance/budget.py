@@ -5,8 +5,10 @@ Budget exhaustion terminates execution deterministically and
 budget events are observable.
 """
 
+import logging
 import time
 from datetime import datetime, timezone
+from fractions import Fraction
 from typing import Any
 
 from agent_core.configuration.schemas import GovernanceConfig
@@ -16,6 +18,20 @@ from agent_core.contracts.observability import ComponentType, CorrelationFields
 from agent_core.observability.logging import get_logger
 from agent_core.utils.ids import generate_run_id
 
+# Budget types in enforcement order; time is reported first when several are exhausted.
+_BUDGET_TYPES = ("time", "calls", "cost")
+
+
+def _exact_cost(value: float) -> Fraction:
+    """Convert a cost or limit to an exact rational value.
+
+    Floats are converted from their shortest repr, so 0.1 is exactly 1/10
+    rather than its binary approximation and repeated costs never drift.
+    """
+    if isinstance(value, float):
+        return Fraction(repr(value))
+    return Fraction(value)
+
 
 class BudgetExhaustedError(Exception):
     """Raised when budget is exhausted.
@@ -24,6 +40,8 @@ class BudgetExhaustedError(Exception):
     and execution must terminate.
     """
 
+    __slots__ = ("budget_type", "limit", "consumed")
+
     def __init__(
         self,
         message: str,
@@ -49,9 +67,23 @@ class BudgetTracker:
     """Tracks budget consumption during execution.
 
     Maintains state for time, calls, and cost budgets.
-    Budget tracking is deterministic and observable.
+    Budget tracking is deterministic and observable. Costs are accumulated
+    exactly, so many small costs add up to the same total as one large one.
     """
 
+    __slots__ = (
+        "context",
+        "logger",
+        "call_count",
+        "call_limit",
+        "time_limit_ns",
+        "cost_limit_exact",
+        "_start_ns",
+        "_cost",
+        "_time_limit",
+        "_cost_limit",
+    )
+
     def __init__(self, context: ExecutionContext):
         """Initialize budget tracker.
 
@@ -59,9 +91,9 @@ class BudgetTracker:
             context: Execution context containing budget limits.
         """
         self.context = context
-        self.start_time = time.time()
+        self._start_ns = time.monotonic_ns()
         self.call_count = 0
-        self.cost_accumulated = 0.0
+        self._cost = Fraction(0)
 
         # Extract budget limits from context
         budget_config = context.budget
@@ -81,14 +113,25 @@ class BudgetTracker:
         self.logger = get_logger("agent_core.governance.budget", correlation)
 
         # Log budget initialization
-        self.logger.debug(
-            "Budget tracker initialized",
-            extra={
-                "time_limit": self.time_limit,
-                "call_limit": self.call_limit,
-                "cost_limit": self.cost_limit,
-            },
-        )
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Budget tracker initialized",
+                extra={
+                    "time_limit": self.time_limit,
+                    "call_limit": self.call_limit,
+                    "cost_limit": self.cost_limit,
+                },
+            )
+
+    def reset(self) -> None:
+        """Reset consumption so the tracker can be reused.
+
+        Restarts the elapsed-time clock and clears the call and cost
+        counters. Budget limits and the execution context are kept.
+        """
+        self._start_ns = time.monotonic_ns()
+        self.call_count = 0
+        self._cost = Fraction(0)
 
     def record_call(self) -> None:
         """Record a call/operation.
@@ -96,13 +139,14 @@ class BudgetTracker:
         Increments the call counter and checks if call limit is exceeded.
         """
         self.call_count += 1
-        self.logger.debug(
-            "Call recorded",
-            extra={
-                "call_count": self.call_count,
-                "call_limit": self.call_limit,
-            },
-        )
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Call recorded",
+                extra={
+                    "call_count": self.call_count,
+                    "call_limit": self.call_limit,
+                },
+            )
 
     def record_cost(self, cost: float) -> None:
         """Record cost consumption.
@@ -113,15 +157,66 @@ class BudgetTracker:
         if cost < 0:
             raise ValueError(f"Cost cannot be negative: {cost}")
 
-        self.cost_accumulated += cost
-        self.logger.debug(
-            "Cost recorded",
-            extra={
-                "cost": cost,
-                "cost_accumulated": self.cost_accumulated,
-                "cost_limit": self.cost_limit,
-            },
-        )
+        self._cost += _exact_cost(cost)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Cost recorded",
+                extra={
+                    "cost": cost,
+                    "cost_accumulated": self.cost_accumulated,
+                    "cost_limit": self.cost_limit,
+                },
+            )
+
+    @property
+    def time_limit(self) -> float | None:
+        """Time limit in seconds, or None if unlimited."""
+        return self._time_limit
+
+    @time_limit.setter
+    def time_limit(self, value: float | None) -> None:
+        self._time_limit = value
+        self.time_limit_ns = int(value * 1_000_000_000) if value is not None else None
+
+    @property
+    def cost_limit(self) -> float | None:
+        """Cost limit, or None if unlimited."""
+        return self._cost_limit
+
+    @cost_limit.setter
+    def cost_limit(self, value: float | None) -> None:
+        self._cost_limit = value
+        self.cost_limit_exact = _exact_cost(value) if value is not None else None
+
+    @property
+    def cost_accumulated(self) -> float:
+        """Total cost accumulated so far."""
+        return float(self._cost)
+
+    def get_cost_exact(self) -> Fraction:
+        """Get accumulated cost without rounding.
+
+        Returns:
+            Exact sum of all recorded costs.
+        """
+        return self._cost
+
+    @property
+    def start_time(self) -> float:
+        """Wall-clock time (seconds since the epoch) when tracking started.
+
+        Derived from the monotonic elapsed time, so it is read-only and
+        follows reset().
+        """
+        return time.time() - self.get_elapsed_time()
+
+    def get_elapsed_ns(self) -> int:
+        """Get elapsed monotonic time since tracker initialization.
+
+        Returns:
+            Elapsed time in nanoseconds.
+        """
+        return time.monotonic_ns() - self._start_ns
 
     def get_elapsed_time(self) -> float:
         """Get elapsed time since tracker initialization.
@@ -129,7 +224,7 @@ class BudgetTracker:
         Returns:
             Elapsed time in seconds.
         """
-        return time.time() - self.start_time
+        return self.get_elapsed_ns() / 1_000_000_000
 
     def get_call_count(self) -> int:
         """Get current call count.
@@ -147,6 +242,18 @@ class BudgetTracker:
         """
         return self.cost_accumulated
 
+    def has_limits(self) -> bool:
+        """Check whether any budget limit is configured.
+
+        Returns:
+            True if at least one of the time, call, or cost limits is set.
+        """
+        return (
+            self.time_limit_ns is not None
+            or self.call_limit is not None
+            or self.cost_limit_exact is not None
+        )
+
     def get_budget_status(self) -> dict[str, Any]:
         """Get current budget status.
 
@@ -170,6 +277,8 @@ class BudgetEnforcer:
     when limits are exceeded. Budget enforcement is deterministic and observable.
     """
 
+    __slots__ = ("tracker", "governance_config", "logger")
+
     def __init__(
         self,
         tracker: BudgetTracker,
@@ -204,75 +313,87 @@ class BudgetEnforcer:
         Raises:
             BudgetExhaustedError: If any budget limit is exceeded.
         """
-        # Check time limit
-        if self.tracker.time_limit is not None:
-            elapsed = self.tracker.get_elapsed_time()
-            if elapsed >= self.tracker.time_limit:
-                error_message = (
-                    f"Time budget exhausted: {elapsed:.2f}s >= {self.tracker.time_limit}s"
-                )
-                self.logger.warning(
-                    "Budget exhausted: time",
-                    extra={
-                        "budget_type": "time",
-                        "limit": self.tracker.time_limit,
-                        "consumed": elapsed,
-                    },
-                )
-                raise BudgetExhaustedError(
-                    error_message,
-                    budget_type="time",
-                    limit=self.tracker.time_limit,
-                    consumed=elapsed,
-                )
-
-        # Check call limit
-        if self.tracker.call_limit is not None:
-            call_count = self.tracker.get_call_count()
-            if call_count >= self.tracker.call_limit:
-                error_message = f"Call budget exhausted: {call_count} >= {self.tracker.call_limit}"
-                self.logger.warning(
-                    "Budget exhausted: calls",
-                    extra={
-                        "budget_type": "calls",
-                        "limit": self.tracker.call_limit,
-                        "consumed": call_count,
-                    },
-                )
-                raise BudgetExhaustedError(
-                    error_message,
-                    budget_type="calls",
-                    limit=self.tracker.call_limit,
-                    consumed=call_count,
-                )
-
-        # Check cost limit
-        if self.tracker.cost_limit is not None:
-            cost_accumulated = self.tracker.get_cost_accumulated()
-            if cost_accumulated >= self.tracker.cost_limit:
-                error_message = (
-                    f"Cost budget exhausted: {cost_accumulated:.4f} >= "
-                    f"{self.tracker.cost_limit:.4f}"
-                )
-                self.logger.warning(
-                    "Budget exhausted: cost",
-                    extra={
-                        "budget_type": "cost",
-                        "limit": self.tracker.cost_limit,
-                        "consumed": cost_accumulated,
-                    },
-                )
-                raise BudgetExhaustedError(
-                    error_message,
-                    budget_type="cost",
-                    limit=self.tracker.cost_limit,
-                    consumed=cost_accumulated,
-                )
-
-        # Log budget check passed
-        self.logger.debug(
-            "Budget check passed",
-            extra=self.tracker.get_budget_status(),
+        exhausted = self._probe()
+        if exhausted is not None:
+            raise self._exhausted(*exhausted)
+
+        # Log budget check passed (status snapshot is only built when DEBUG is enabled)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Budget check passed",
+                extra=self.tracker.get_budget_status(),
+            )
+
+    def is_within_budget(self) -> bool:
+        """Check budget limits without raising.
+
+        Useful for pre-flight checks that only need a yes/no answer.
+        Nothing is logged or raised when a limit is exceeded.
+
+        Returns:
+            True if no budget limit is exceeded, False otherwise.
+        """
+        return self._probe() is None
+
+    def _probe(self) -> tuple[str, int | Fraction] | None:
+        """Find the first exhausted budget, if any.
+
+        Returns:
+            None if all limits hold, otherwise the exhausted budget type and
+            its consumption in the exact units used for checks.
+        """
+        # Nothing to enforce when the context carries no limits
+        tracker = self.tracker
+        if not tracker.has_limits():
+            return None
+
+        # Snapshot usage and limits exactly (ns, calls, rational cost) and
+        # report the first exhausted axis; order gives time priority
+        usage = (tracker.get_elapsed_ns(), tracker.call_count, tracker.get_cost_exact())
+        limits = (tracker.time_limit_ns, tracker.call_limit, tracker.cost_limit_exact)
+        for budget_type, consumed, limit in zip(_BUDGET_TYPES, usage, limits, strict=True):
+            if limit is not None and consumed >= limit:
+                return budget_type, consumed
+        return None
+
+    def _exhausted(self, budget_type: str, consumed_units: int | Fraction) -> BudgetExhaustedError:
+        """Log and build the error for an exhausted budget.
+
+        Args:
+            budget_type: Exhausted budget type ('time', 'calls', or 'cost').
+            consumed_units: Consumption in the exact units used for checks.
+
+        Returns:
+            BudgetExhaustedError describing the exhausted budget.
+        """
+        tracker = self.tracker
+        consumed: float
+        if budget_type == "time":
+            consumed = consumed_units / 1_000_000_000
+            limit = tracker.time_limit
+            error_message = f"Time budget exhausted: {consumed:.2f}s >= {limit}s"
+        elif budget_type == "calls":
+            consumed = consumed_units
+            limit = tracker.call_limit
+            error_message = f"Call budget exhausted: {consumed} >= {limit}"
+        else:
+            consumed = float(consumed_units)
+            limit = tracker.cost_limit
+            error_message = f"Cost budget exhausted: {consumed:.4f} >= {limit:.4f}"
+
+        self.logger.warning(
+            f"Budget exhausted: {budget_type}",
+            extra={
+                "budget_type": budget_type,
+                "limit": limit,
+                "consumed": consumed,
+            },
+        )
+        return BudgetExhaustedError(
+            error_message,
+            budget_type=budget_type,
+            limit=limit,
+            consumed=consumed,
         )
 
     def to_error(
@@ -289,7 +410,8 @@ class BudgetEnforcer:
         Returns:
             Structured Error instance.
         """
-        return Error(
+        # Fields are already typed, so skip model validation
+        return Error.model_construct(
             error_id=generate_run_id(),  # Use run_id generator for error_id
             error_type=ErrorCategory.BUDGET_EXCEEDED,
             message=str(budget_error),
@@ -5,6 +5,8 @@ Permissions are resolved before execution and missing permissions
 result in immediate failure.
 """
 
+import logging
+import sys
 from datetime import datetime, timezone
 from typing import Any
 
@@ -22,6 +24,8 @@ class PermissionError(Exception):
     or insufficient for the requested action.
     """
 
+    __slots__ = ("required_permissions", "available_permissions")
+
     def __init__(
         self,
         message: str,
@@ -47,6 +51,8 @@ class PermissionEvaluator:
     Permission evaluation is deterministic and observable.
     """
 
+    __slots__ = ("context", "logger", "_granted")
+
     def __init__(self, context: ExecutionContext):
         """Initialize permission evaluator.
 
@@ -66,6 +72,9 @@ class PermissionEvaluator:
         )
         self.logger = get_logger("agent_core.governance.permissions", correlation)
 
+        # Resolve the granted permission set once; checks become set lookups
+        self._granted = self._resolve_granted_permissions(context.permissions)
+
     def check_permissions(
         self,
         required_permissions: list[str],
@@ -89,20 +98,18 @@ class PermissionEvaluator:
             # No permissions required, always allowed
             return True
 
-        available_permissions = self.context.permissions
-
-        # Check if all required permissions are present
-        missing_permissions = []
-        for perm in required_permissions:
-            # Permissions can be:
-            # 1. Boolean flags (e.g., {"read": True, "write": False})
-            # 2. List of granted permissions (e.g., {"permissions": ["read", "write"]})
-            # 3. Nested structures (e.g., {"tools": {"tool1": True}})
-
-            if not self._has_permission(perm, available_permissions):
-                missing_permissions.append(perm)
-
-        if missing_permissions:
+        # Check if all required permissions are present. Single-permission
+        # gates (the common case) need only one membership test; the missing
+        # list is built only on failure.
+        granted = self._granted
+        if len(required_permissions) == 1:
+            all_granted = required_permissions[0] in granted
+        else:
+            all_granted = granted.issuperset(required_permissions)
+
+        if not all_granted:
+            available_permissions = self.context.permissions
+            missing_permissions = [perm for perm in required_permissions if perm not in granted]
             error_message = (
                 f"Missing required permissions: {missing_permissions}. "
                 f"Available permissions: {list(available_permissions.keys())}"
@@ -127,57 +134,57 @@ class PermissionEvaluator:
             )
 
         # Log permission grant
-        self.logger.debug(
-            "Permission check passed",
-            extra={
-                "required_permissions": required_permissions,
-                "resource_id": resource_id,
-                "resource_type": resource_type,
-            },
-        )
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Permission check passed",
+                extra={
+                    "required_permissions": required_permissions,
+                    "resource_id": resource_id,
+                    "resource_type": resource_type,
+                },
+            )
 
         return True
 
-    def _has_permission(self, permission: str, available_permissions: dict[str, Any]) -> bool:
-        """Check if a specific permission is granted.
+    @staticmethod
+    def _resolve_granted_permissions(available_permissions: dict[str, Any]) -> frozenset[str]:
+        """Resolve the set of granted permissions.
 
-        Supports multiple permission formats:
-        - Boolean flags: {"read": True}
+        Supports multiple permission formats, in order of precedence:
+        - Boolean flags: {"read": True} (non-boolean values count as granted)
         - List format: {"permissions": ["read", "write"]}
-        - Nested structures: {"tools": {"tool1": True}}
+        - Nested structures: {"tools": {"tool1": True}} (only consulted when
+          no "permissions" list is present; the first nested match wins)
 
         Args:
-            permission: Permission identifier to check.
             available_permissions: Available permissions dictionary.
 
         Returns:
-            True if permission is granted, False otherwise.
+            Frozen set of granted (interned) permission identifiers.
         """
-        # Direct boolean flag
-        if permission in available_permissions:
-            value = available_permissions[permission]
-            if isinstance(value, bool):
-                return value
-            # Non-boolean values are treated as granted if present
-            return True
-
-        # Check in "permissions" list
-        if "permissions" in available_permissions:
-            perms_list = available_permissions["permissions"]
-            if isinstance(perms_list, list):
-                return permission in perms_list
-
-        # Check nested structures (e.g., {"tools": {"tool1": True}})
-        # Try to find permission as a key in nested dicts
-        for _key, value in available_permissions.items():
-            if isinstance(value, dict):
-                if permission in value:
-                    perm_value = value[permission]
-                    if isinstance(perm_value, bool):
-                        return perm_value
-                    return True
-
-        return False
+        resolved: dict[str, bool] = {}
+
+        perms_list = available_permissions.get("permissions")
+        if isinstance(perms_list, list):
+            for perm in perms_list:
+                if isinstance(perm, str):
+                    resolved[perm] = True
+        else:
+            for value in available_permissions.values():
+                if isinstance(value, dict):
+                    for perm, perm_value in value.items():
+                        if perm not in resolved:
+                            resolved[perm] = perm_value if isinstance(perm_value, bool) else True
+
+        # Top-level flags override list and nested entries
+        for perm, value in available_permissions.items():
+            resolved[perm] = value if isinstance(value, bool) else True
+
+        return frozenset(
+            sys.intern(perm) if isinstance(perm, str) else perm
+            for perm, granted in resolved.items()
+            if granted
+        )
 
     def to_error(
         self,
@@ -193,7 +200,8 @@ class PermissionEvaluator:
         Returns:
             Structured Error instance.
         """
-        return Error(
+        # Fields are already typed, so skip model validation
+        return Error.model_construct(
             error_id=generate_run_id(),  # Use run_id generator for error_id
             error_type=ErrorCategory.PERMISSION_ERROR,
             message=str(permission_error),
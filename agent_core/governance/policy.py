@@ -5,6 +5,8 @@ allow, deny, or require-approval. Policies are evaluated at
 well-defined enforcement points and outcomes are observable.
 """
 
+import logging
+import sys
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Any
@@ -27,6 +29,10 @@ class PolicyOutcome(str, Enum):
     REQUIRE_APPROVAL = "require_approval"
 
 
+# Outcome strings resolved once; evaluation is a plain dict lookup
+_OUTCOME_MAP: dict[str, PolicyOutcome] = {o.value: o for o in PolicyOutcome}
+
+
 class PolicyError(Exception):
     """Raised when policy evaluation fails.
 
@@ -44,6 +50,15 @@ class PolicyEngine:
     Policy evaluation is deterministic and observable.
     """
 
+    __slots__ = (
+        "context",
+        "governance_config",
+        "logger",
+        "_exact_policies",
+        "_prefixes",
+        "_prefix_configs",
+    )
+
     def __init__(
         self,
         context: ExecutionContext,
@@ -69,6 +84,27 @@ class PolicyEngine:
         )
         self.logger = get_logger("agent_core.governance.policy", correlation)
 
+        # Index policies once so evaluation does not rescan every pattern.
+        # Every key is eligible for an exact match; "prefix.*" keys also match
+        # any action starting with "prefix." (checked in configuration order).
+        # Keys are interned so lookups with interned action strings (such as
+        # literals in calling code) short-circuit on identity.
+        policies = self.governance_config.policies
+        self._exact_policies: dict[str, dict[str, Any]] = {
+            sys.intern(pattern): policy_config for pattern, policy_config in policies.items()
+        }
+        # Prefixes and their configs are kept in parallel tuples so a single
+        # str.startswith(tuple) call can reject actions matching no pattern.
+        prefix_policies = [
+            (pattern[:-1], policy_config)
+            for pattern, policy_config in policies.items()
+            if pattern.endswith(".*")
+        ]
+        self._prefixes: tuple[str, ...] = tuple(prefix for prefix, _ in prefix_policies)
+        self._prefix_configs: tuple[dict[str, Any], ...] = tuple(
+            policy_config for _, policy_config in prefix_policies
+        )
+
     def evaluate_policy(
         self,
         action: str,
@@ -96,54 +132,46 @@ class PolicyEngine:
         Raises:
             PolicyError: If policy evaluation fails (not a denial).
         """
-        if metadata is None:
-            metadata = {}
-
-        policies = self.governance_config.policies
-
         # If no policies configured, default to ALLOW
-        if not policies:
-            self.logger.debug(
-                "No policies configured, defaulting to ALLOW",
-                extra={
-                    "action": action,
-                    "resource_id": resource_id,
-                    "resource_type": resource_type,
-                },
-            )
+        if not self._exact_policies:
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    "No policies configured, defaulting to ALLOW",
+                    extra={
+                        "action": action,
+                        "resource_id": resource_id,
+                        "resource_type": resource_type,
+                    },
+                )
             return PolicyOutcome.ALLOW
 
-        # Evaluate policies in order
         # Policy structure: {"action_pattern": {"outcome": "allow|deny|require_approval", ...}}
-        # For now, we support simple action-based policies
-
-        # Check for exact action match
-        if action in policies:
-            policy_config = policies[action]
+        # Exact action matches take precedence over wildcard patterns
+        policy_config = self._exact_policies.get(action)
+        if policy_config is None and action.startswith(self._prefixes):
+            # Check for pattern-based policies (e.g., "tool.*" matches "tool.execute")
+            for index, prefix in enumerate(self._prefixes):
+                if action.startswith(prefix):
+                    policy_config = self._prefix_configs[index]
+                    break
+
+        if policy_config is not None:
             outcome = self._evaluate_policy_config(
                 policy_config, action, resource_id, resource_type, metadata
             )
             self._log_policy_outcome(action, resource_id, resource_type, outcome)
             return outcome
 
-        # Check for pattern-based policies (e.g., "tool.*" matches "tool.execute")
-        for policy_pattern, policy_config in policies.items():
-            if self._matches_pattern(action, policy_pattern):
-                outcome = self._evaluate_policy_config(
-                    policy_config, action, resource_id, resource_type, metadata
-                )
-                self._log_policy_outcome(action, resource_id, resource_type, outcome)
-                return outcome
-
         # No matching policy, default to ALLOW
-        self.logger.debug(
-            "No matching policy found, defaulting to ALLOW",
-            extra={
-                "action": action,
-                "resource_id": resource_id,
-                "resource_type": resource_type,
-            },
-        )
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "No matching policy found, defaulting to ALLOW",
+                extra={
+                    "action": action,
+                    "resource_id": resource_id,
+                    "resource_type": resource_type,
+                },
+            )
         return PolicyOutcome.ALLOW
 
     def _evaluate_policy_config(
@@ -152,7 +180,7 @@ class PolicyEngine:
         action: str,
         resource_id: str | None,
         resource_type: str | None,
-        metadata: dict[str, Any],
+        metadata: dict[str, Any] | None,
     ) -> PolicyOutcome:
         """Evaluate a single policy configuration.
 
@@ -161,7 +189,7 @@ class PolicyEngine:
             action: Action identifier.
             resource_id: Optional resource identifier.
             resource_type: Optional resource type.
-            metadata: Additional metadata.
+            metadata: Optional additional metadata.
 
         Returns:
             PolicyOutcome.
@@ -176,8 +204,8 @@ class PolicyEngine:
         if "outcome" in policy_config:
             outcome_str = policy_config["outcome"]
             try:
-                return PolicyOutcome(outcome_str)
-            except ValueError as e:
+                return _OUTCOME_MAP[outcome_str]
+            except (KeyError, TypeError) as e:
                 raise PolicyError(
                     f"Invalid policy outcome: {outcome_str}. "
                     f"Must be one of: {[o.value for o in PolicyOutcome]}"
@@ -186,30 +214,6 @@ class PolicyEngine:
         # Default to ALLOW if no outcome specified
         return PolicyOutcome.ALLOW
 
-    def _matches_pattern(self, action: str, pattern: str) -> bool:
-        """Check if action matches a policy pattern.
-
-        Supports simple wildcard patterns:
-        - "tool.*" matches "tool.execute", "tool.read", etc.
-        - Exact match if no wildcard
-
-        Args:
-            action: Action identifier.
-            pattern: Policy pattern.
-
-        Returns:
-            True if action matches pattern, False otherwise.
-        """
-        if pattern == action:
-            return True
-
-        # Simple wildcard support: "tool.*" matches "tool.execute"
-        if pattern.endswith(".*"):
-            prefix = pattern[:-2]
-            return action.startswith(prefix + ".")
-
-        return False
-
     def _log_policy_outcome(
         self,
         action: str,
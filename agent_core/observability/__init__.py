@@ -4,7 +4,8 @@ This package provides interfaces and implementations for emitting
 observability signals (logs, traces, metrics, audit events).
 """
 
+from agent_core.observability.binary import BinaryObservabilitySink
 from agent_core.observability.interface import ObservabilitySink
-from agent_core.observability.noop import NoOpObservabilitySink
+from agent_core.observability.noop import NOOP_SINK, NoOpObservabilitySink
 
-__all__ = ["ObservabilitySink", "NoOpObservabilitySink"]
+__all__ = ["NOOP_SINK", "BinaryObservabilitySink", "ObservabilitySink", "NoOpObservabilitySink"]
@@ -0,0 +1,106 @@
+"""Binary observability sink implementation.
+
+Provides an ObservabilitySink that encodes signals as MessagePack and
+writes them to a binary stream, for transport to another process or a
+remote collector. Human-readable JSON remains the format of the stderr
+log formatter; wire transport uses this compact binary encoding instead.
+"""
+
+import threading
+from typing import Any, BinaryIO
+
+from pydantic import BaseModel
+
+from agent_core.contracts.observability import (
+    AuditEvent,
+    LogEvent,
+    MetricValue,
+    TraceSpan,
+)
+
+# msgpack is an optional dependency; the sink requires it at construction
+try:
+    import msgpack  # type: ignore[import-not-found]
+
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+
+class BinaryObservabilitySink:
+    """Observability sink that writes MessagePack-encoded signals.
+
+    Each signal is written as one MessagePack map of the form
+    ``{"signal": <"log"|"trace"|"metric"|"audit">, "event": <event fields>}``.
+    MessagePack values are self-delimiting, so consecutive frames can be
+    read back with ``msgpack.Unpacker``.
+
+    Encoding or write failures propagate to the caller so they remain
+    detectable (for example, AuditEmitter turns them into AuditEmissionError).
+    Writes are serialized with a lock so frames from concurrent threads do
+    not interleave.
+    """
+
+    def __init__(self, stream: BinaryIO):
+        """Initialize the binary sink.
+
+        Args:
+            stream: Writable binary stream receiving encoded frames.
+
+        Raises:
+            ImportError: If msgpack is not installed.
+        """
+        if not MSGPACK_AVAILABLE:
+            raise ImportError(
+                "msgpack is not available. Install msgpack to use BinaryObservabilitySink."
+            )
+
+        self.stream = stream
+        # Values msgpack cannot encode natively (e.g. datetimes in metadata)
+        # are written as strings, matching the JSON log formatter
+        self._packer = msgpack.Packer(use_bin_type=True, default=str)
+        self._lock = threading.Lock()
+
+    def _write(self, signal: str, event: BaseModel) -> None:
+        """Encode a signal and write it to the stream.
+
+        Args:
+            signal: Signal type identifier.
+            event: Observability contract instance to encode.
+        """
+        # str-valued enums are encoded as their string values
+        frame: dict[str, Any] = {"signal": signal, "event": event.model_dump()}
+        with self._lock:
+            self.stream.write(self._packer.pack(frame))
+
+    def emit_log(self, log_event: LogEvent) -> None:
+        """Emit a structured log event.
+
+        Args:
+            log_event: Structured log event with correlation fields.
+        """
+        self._write("log", log_event)
+
+    def emit_trace(self, span: TraceSpan) -> None:
+        """Emit a trace span.
+
+        Args:
+            span: Trace span with correlation fields and attributes.
+        """
+        self._write("trace", span)
+
+    def emit_metric(self, metric: MetricValue) -> None:
+        """Emit a metric value.
+
+        Args:
+            metric: Metric value with correlation fields and labels.
+        """
+        self._write("metric", metric)
+
+    def emit_audit(self, audit_event: AuditEvent) -> None:
+        """Emit an audit event.
+
+        Args:
+            audit_event: Audit event with correlation fields and action details.
+        """
+        self._write("audit", audit_event)
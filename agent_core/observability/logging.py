@@ -5,19 +5,264 @@ formatting. Ensures correlation fields are always present and supports
 redaction hooks for sensitive data.
 """
 
+import atexit
 import json
 import logging
-from collections.abc import Callable
+import math
+import queue
+import re
+import sys
+import threading
+from collections.abc import Callable, Iterator
 from datetime import datetime, timezone
+from decimal import Decimal
+from enum import Enum
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any
 
 from agent_core.contracts.observability import (
     ComponentType,
     CorrelationFields,
-    LogEvent,
     LogLevel,
 )
 
+# orjson is an optional accelerator; stdlib json is used when it is absent
+try:
+    import orjson  # type: ignore[import-not-found]
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+if ORJSON_AVAILABLE:
+    # Datetimes and dataclasses go through _json_default, matching stdlib output
+    _ORJSON_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+
+# A float rendered by repr() with an exponent ("1e+16", "1e-07"), which the
+# C json encoder emits but orjson writes differently ("1e16", "1e-7")
+_FLOAT_EXPONENT = re.compile(r"\de[+-]\d")
+
+# Stdlib log levels mapped to serialized LogLevel values (CRITICAL folds
+# into ERROR), so formatting needs neither getLevelName nor the enum
+_LEVEL_VALUES: dict[int, str] = {
+    logging.DEBUG: LogLevel.DEBUG.value,
+    logging.INFO: LogLevel.INFO.value,
+    logging.WARNING: LogLevel.WARN.value,
+    logging.ERROR: LogLevel.ERROR.value,
+    logging.CRITICAL: LogLevel.ERROR.value,
+}
+# Custom levels without an entry are reported as INFO
+_DEFAULT_LEVEL = LogLevel.INFO.value
+
+# Serialized ComponentType values, keyed by member. str-valued enum members
+# hash and compare equal to their values, so plain strings also resolve here.
+_COMPONENT_TYPE_VALUES: dict[Any, str] = {ct: sys.intern(ct.value) for ct in ComponentType}
+
+# Correlation fields attached to every record by CorrelationLoggerAdapter
+_CORRELATION_KEYS = (
+    "run_id",
+    "correlation_id",
+    "component_type",
+    "component_id",
+    "component_version",
+    "timestamp",
+)
+
+# Record attribute holding an adapter's prebuilt correlation block. The name
+# is private and namespaced so handlers and formatters that look at public
+# record attributes do not mistake this internal cache for user data.
+_CORRELATION_BLOCK = "_agent_core_correlation_block"
+
+# Standard LogRecord attributes and correlation fields kept out of metadata.
+# Filtering iterates the record dict rather than taking a set difference so
+# metadata keeps the order in which extras were attached.
+_EXCLUDED_FIELDS = frozenset(
+    {
+        "name",
+        "msg",
+        "args",
+        "created",
+        "filename",
+        "funcName",
+        "levelname",
+        "levelno",
+        "lineno",
+        "module",
+        "msecs",
+        "message",
+        "pathname",
+        "process",
+        "processName",
+        "relativeCreated",
+        "thread",
+        "threadName",
+        "exc_info",
+        "exc_text",
+        "stack_info",
+        *_CORRELATION_KEYS,
+        _CORRELATION_BLOCK,
+    }
+)
+
+# Background listeners started for async loggers (see stop_log_listeners)
+_listeners: list[tuple[logging.Logger, QueueHandler, QueueListener]] = []
+_listeners_lock = threading.Lock()
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize values JSON has no type for.
+
+    Enums serialize as their value, as orjson does natively; anything else
+    falls back to ``str()``.
+
+    Args:
+        value: Value the JSON encoder could not serialize.
+
+    Returns:
+        JSON-serializable replacement for the value.
+    """
+    if isinstance(value, Enum):
+        return value.value
+    return str(value)
+
+
+def _format_float(value: float) -> str:
+    """Format a float the way orjson does.
+
+    Uses the shortest round-trip digits, as repr() does, but orjson's layout:
+    positional notation for decimal exponents -5 through 15, otherwise
+    ``<digits>e<exponent>`` without a plus sign or zero padding. Non-finite
+    values become ``null``.
+
+    Args:
+        value: Float to format.
+
+    Returns:
+        JSON number literal, or ``null``.
+    """
+    if not math.isfinite(value):
+        return "null"
+    if value == 0.0:
+        return repr(value)
+
+    sign, digit_tuple, exponent = Decimal(repr(value)).normalize().as_tuple()
+    digits = "".join(map(str, digit_tuple))
+    point = exponent + len(digits)  # type: ignore[operator]
+    prefix = "-" if sign else ""
+    if point > 16 or point < -4:
+        mantissa = digits[0] + (f".{digits[1:]}" if len(digits) > 1 else "")
+        return f"{prefix}{mantissa}e{point - 1}"
+    if point > 0:
+        return f"{prefix}{digits[:point].ljust(point, '0')}.{digits[point:] or '0'}"
+    return f"{prefix}0.{'0' * -point}{digits}"
+
+
+class _OrjsonCompatibleEncoder(json.JSONEncoder):
+    """JSON encoder that writes floats exactly as orjson does.
+
+    Runs the pure-Python encoder so floats go through _format_float; it is
+    only used for payloads whose floats the C encoder would render
+    differently.
+    """
+
+    def iterencode(self, o: Any, _one_shot: bool = False) -> Iterator[str]:
+        """Encode ``o`` with orjson-compatible float formatting."""
+        return json.encoder._make_iterencode(  # type: ignore[attr-defined]
+            {} if self.check_circular else None,
+            self.default,
+            json.encoder.encode_basestring,
+            self.indent,
+            _format_float,
+            self.key_separator,
+            self.item_separator,
+            self.sort_keys,
+            self.skipkeys,
+            _one_shot,
+        )(o, 0)
+
+
+def _dumps(payload: dict[str, Any]) -> str:
+    """Serialize a log payload to a JSON string.
+
+    Uses orjson when installed and falls back to stdlib json otherwise,
+    or for payloads orjson rejects (such as integers wider than 64 bits).
+    Both paths produce the same output: enums serialize as their value,
+    NaN and infinities as null, floats in orjson's notation, and non-ASCII
+    text unescaped.
+
+    Args:
+        payload: Log payload to serialize.
+
+    Returns:
+        JSON string.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(payload, default=_json_default, option=_ORJSON_OPTIONS).decode(
+                "utf-8"
+            )
+        except orjson.JSONEncodeError:
+            pass
+    # Compact separators match orjson output and avoid padding every line.
+    # The C encoder handles the common case; payloads with non-finite floats
+    # or exponent floats are re-encoded with orjson's float formatting.
+    try:
+        text = json.dumps(
+            payload,
+            default=_json_default,
+            ensure_ascii=False,
+            allow_nan=False,
+            separators=(",", ":"),
+        )
+    except ValueError:
+        text = None
+    if text is None or _FLOAT_EXPONENT.search(text):
+        text = _OrjsonCompatibleEncoder(
+            default=_json_default,
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ).encode(payload)
+    return text
+
+
+def _build_correlation(fields: dict[str, Any]) -> dict[str, Any]:
+    """Build the serialized correlation block for a log payload.
+
+    Mirrors the CorrelationFields contract without constructing the model.
+    Missing fields default to "unknown" (RUNTIME for component_type) and a
+    missing timestamp to the current time.
+
+    Args:
+        fields: Mapping holding the correlation fields, such as a record's
+            ``__dict__`` or an adapter's extra dict.
+
+    Returns:
+        Correlation dict ready for serialization.
+
+    Raises:
+        ValueError: If component_type is not a valid ComponentType.
+    """
+    # The fallback timestamp is only generated when none is present
+    timestamp = fields.get("timestamp")
+    if timestamp is None:
+        timestamp = datetime.now(timezone.utc).isoformat()
+    component_type = fields.get("component_type", ComponentType.RUNTIME)
+    component_type_value = _COMPONENT_TYPE_VALUES.get(component_type)
+    if component_type_value is None:
+        # Unknown values fail through the enum as before
+        component_type_value = ComponentType(component_type).value
+
+    return {
+        "run_id": fields.get("run_id", "unknown"),
+        "correlation_id": fields.get("correlation_id", "unknown"),
+        "component_type": component_type_value,
+        "component_id": fields.get("component_id", "unknown"),
+        "component_version": fields.get("component_version", "unknown"),
+        "timestamp": timestamp,
+    }
+
 
 class CorrelationJSONFormatter(logging.Formatter):
     """JSON formatter that includes correlation fields in all log records.
@@ -29,6 +274,8 @@ class CorrelationJSONFormatter(logging.Formatter):
     Attributes:
         redaction_hook: Optional callable that redacts sensitive data from
             log metadata. Should accept (metadata: dict[str, Any]) -> dict[str, Any].
+            The metadata dict is built fresh for each record, so the hook may
+            modify and return it in place instead of copying it.
     """
 
     def __init__(
@@ -53,91 +300,40 @@ class CorrelationJSONFormatter(logging.Formatter):
         Returns:
             JSON string containing the structured log data.
         """
-        # Extract correlation fields from record if present
-        correlation = CorrelationFields(
-            run_id=getattr(record, "run_id", "unknown"),
-            correlation_id=getattr(record, "correlation_id", "unknown"),
-            component_type=getattr(record, "component_type", ComponentType.RUNTIME),
-            component_id=getattr(record, "component_id", "unknown"),
-            component_version=getattr(record, "component_version", "unknown"),
-            timestamp=getattr(record, "timestamp", datetime.now(timezone.utc).isoformat()),
-        )
-
-        # Build metadata from record attributes (excluding standard fields)
-        metadata: dict[str, Any] = {}
-        excluded_fields = {
-            "name",
-            "msg",
-            "args",
-            "created",
-            "filename",
-            "funcName",
-            "levelname",
-            "levelno",
-            "lineno",
-            "module",
-            "msecs",
-            "message",
-            "pathname",
-            "process",
-            "processName",
-            "relativeCreated",
-            "thread",
-            "threadName",
-            "exc_info",
-            "exc_text",
-            "stack_info",
-            # Correlation fields
-            "run_id",
-            "correlation_id",
-            "component_type",
-            "component_id",
-            "component_version",
-            "timestamp",
+        # Records from CorrelationLoggerAdapter carry a correlation block
+        # built once per adapter; other records are resolved field by field
+        correlation = getattr(record, _CORRELATION_BLOCK, None)
+        if correlation is None:
+            correlation = _build_correlation(record.__dict__)
+
+        # Build metadata from record attributes (excluding standard fields).
+        # Built in a single pass and owned by this call, so the redaction
+        # hook can update it in place
+        metadata: dict[str, Any] = {
+            key: value for key, value in record.__dict__.items() if key not in _EXCLUDED_FIELDS
         }
 
-        for key, value in record.__dict__.items():
-            if key not in excluded_fields:
-                metadata[key] = value
-
         # Apply redaction hook if provided
         if self.redaction_hook is not None:
             metadata = self.redaction_hook(metadata)
 
-        # Map stdlib log levels to LogLevel enum
-        level_map = {
-            logging.DEBUG: LogLevel.DEBUG,
-            logging.INFO: LogLevel.INFO,
-            logging.WARNING: LogLevel.WARN,
-            logging.ERROR: LogLevel.ERROR,
-            logging.CRITICAL: LogLevel.ERROR,
-        }
-        log_level = level_map.get(record.levelno, LogLevel.INFO)
-
-        # Create LogEvent structure
-        log_event = LogEvent(
-            correlation=correlation,
-            level=log_level,
-            message=record.getMessage(),
-            metadata=metadata,
-        )
+        # Map stdlib log levels to LogLevel values
+        log_level = _LEVEL_VALUES.get(record.levelno, _DEFAULT_LEVEL)
 
-        # Convert to JSON
-        return json.dumps(
+        # Plain string messages without args need no %-formatting
+        message = record.msg
+        if record.args or not isinstance(message, str):
+            message = record.getMessage()
+
+        # Emit the LogEvent structure directly; the payload mirrors the
+        # LogEvent/CorrelationFields contracts without building the models
+        return _dumps(
             {
-                "correlation": {
-                    "run_id": log_event.correlation.run_id,
-                    "correlation_id": log_event.correlation.correlation_id,
-                    "component_type": log_event.correlation.component_type.value,
-                    "component_id": log_event.correlation.component_id,
-                    "component_version": log_event.correlation.component_version,
-                    "timestamp": log_event.correlation.timestamp,
-                },
-                "level": log_event.level.value,
-                "message": log_event.message,
-                "metadata": log_event.metadata,
-            },
-            default=str,
+                "correlation": correlation,
+                "level": log_level,
+                "message": message,
+                "metadata": metadata,
+            }
         )
 
 
@@ -145,12 +341,30 @@ class CorrelationLoggerAdapter(logging.LoggerAdapter):
     """Logger adapter that adds correlation fields to all log records.
 
     This adapter ensures that correlation fields are included in every
-    log record by adding them as extra attributes.
+    log record by adding them as extra attributes. Redaction is applied by
+    CorrelationJSONFormatter, not by the adapter.
     """
 
+    def __init__(self, logger: logging.Logger, extra: dict[str, Any]):
+        """Initialize the adapter.
+
+        Args:
+            logger: Underlying logger.
+            extra: Correlation fields to attach to every record.
+        """
+        super().__init__(logger, extra)
+        # Correlation fields are fixed for the adapter's lifetime, so the
+        # dict passed as ``extra`` and the serialized correlation block are
+        # built once rather than per record
+        self._correlation = {key: extra[key] for key in _CORRELATION_KEYS}
+        self._correlation[_CORRELATION_BLOCK] = _build_correlation(self._correlation)
+
     def process(self, msg: str, kwargs: dict[str, Any]) -> tuple[str, dict[str, Any]]:
         """Process log message and add correlation fields.
 
+        Only called for records that pass the level check; the caller's
+        ``extra`` dict is not modified.
+
         Args:
             msg: Log message.
             kwargs: Logging keyword arguments.
@@ -158,18 +372,8 @@ class CorrelationLoggerAdapter(logging.LoggerAdapter):
         Returns:
             Tuple of (message, kwargs) with correlation fields added to extra.
         """
-        extra = kwargs.get("extra", {})
-        extra.update(
-            {
-                "run_id": self.extra["run_id"],
-                "correlation_id": self.extra["correlation_id"],
-                "component_type": self.extra["component_type"],
-                "component_id": self.extra["component_id"],
-                "component_version": self.extra["component_version"],
-                "timestamp": self.extra["timestamp"],
-            }
-        )
-        kwargs["extra"] = extra
+        extra = kwargs.get("extra")
+        kwargs["extra"] = {**extra, **self._correlation} if extra else self._correlation
         return msg, kwargs
 
 
@@ -177,6 +381,7 @@ def get_logger(
     name: str,
     correlation: CorrelationFields,
     redaction_hook: Callable[[dict[str, Any]], dict[str, Any]] | None = None,
+    async_handler: bool = False,
 ) -> logging.LoggerAdapter:
     """Get a logger configured with correlation fields.
 
@@ -188,7 +393,12 @@ def get_logger(
         name: Logger name (typically module or component name).
         correlation: Correlation fields to include in all log records.
         redaction_hook: Optional function to redact sensitive data from
-            log metadata.
+            log metadata. It is applied by the handler's formatter only, so
+            each record is redacted exactly once.
+        async_handler: If True and the logger has no handler yet, records are
+            queued and formatted/written by a background listener thread
+            instead of on the calling thread. Call stop_log_listeners() to
+            flush pending records (also done at interpreter exit).
 
     Returns:
         LoggerAdapter instance configured with correlation fields and JSON formatting.
@@ -200,7 +410,10 @@ def get_logger(
         handler = logging.StreamHandler()
         formatter = CorrelationJSONFormatter(redaction_hook=redaction_hook)
         handler.setFormatter(formatter)
-        logger.addHandler(handler)
+        if async_handler:
+            _attach_queue_handler(logger, handler)
+        else:
+            logger.addHandler(handler)
         logger.setLevel(logging.INFO)
 
     # Create adapter with correlation fields
@@ -217,3 +430,38 @@ def get_logger(
     )
 
     return adapter
+
+
+def _attach_queue_handler(logger: logging.Logger, handler: logging.Handler) -> None:
+    """Route a logger's records through a queue drained by a listener thread.
+
+    Args:
+        logger: Logger to attach the queue handler to.
+        handler: Handler that formats and writes records on the listener thread.
+    """
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    listener.start()
+    logger.addHandler(queue_handler)
+
+    with _listeners_lock:
+        _listeners.append((logger, queue_handler, listener))
+
+
+def stop_log_listeners() -> None:
+    """Stop background log listeners started by get_logger.
+
+    Pending records are written before each listener stops, and the queue
+    handlers are detached so later records are not queued without a consumer.
+    """
+    with _listeners_lock:
+        listeners = list(_listeners)
+        _listeners.clear()
+
+    for logger, queue_handler, listener in listeners:
+        logger.removeHandler(queue_handler)
+        listener.stop()
+
+
+atexit.register(stop_log_listeners)
@@ -5,6 +5,10 @@ of cardinality rules. High-cardinality identifiers like run_id must
 not be used as metric labels.
 """
 
+from collections.abc import Callable, Iterable, Mapping
+from types import MappingProxyType
+from typing import Any
+
 from opentelemetry import metrics
 from opentelemetry.metrics import Meter
 
@@ -13,6 +17,22 @@ from agent_core.contracts.observability import (
     MetricValue,
 )
 
+# Builds the instrument for each metric type and returns its recording
+# method. Gauges in OpenTelemetry are typically created once and updated;
+# for simplicity an UpDownCounter is used as a gauge.
+_INSTRUMENT_FACTORIES: dict[str, Callable[[Meter, str], Callable[..., None]]] = {
+    "counter": lambda meter, name: meter.create_counter(name).add,
+    "histogram": lambda meter, name: meter.create_histogram(name).record,
+    "gauge": lambda meter, name: meter.create_up_down_counter(name).add,
+}
+
+# Metric types whose recordings are additive, so a batch can be summed per
+# (name, type, labels) group and recorded once
+_ADDITIVE_TYPES = frozenset({"counter", "gauge"})
+
+# Shared read-only stand-in for absent labels
+_NO_LABELS: Mapping[str, str] = MappingProxyType({})
+
 
 class MetricsHelper:
     """Helper class for emitting metrics with cardinality constraints.
@@ -28,7 +48,7 @@ class MetricsHelper:
     """
 
     # High-cardinality fields that must not be metric labels
-    FORBIDDEN_LABELS = {"run_id", "correlation_id"}
+    FORBIDDEN_LABELS = frozenset({"run_id", "correlation_id"})
 
     def __init__(self, meter: Meter | None = None):
         """Initialize the metrics helper.
@@ -38,6 +58,8 @@ class MetricsHelper:
                 default meter from the global meter provider.
         """
         self._meter = meter or metrics.get_meter(__name__)
+        # Recording methods are bound once per (metric_name, metric_type)
+        self._instruments: dict[tuple[str, str], Callable[..., None]] = {}
 
     def _validate_labels(self, labels: dict[str, str]) -> None:
         """Validate that labels do not include high-cardinality identifiers.
@@ -48,8 +70,10 @@ class MetricsHelper:
         Raises:
             ValueError: If labels contain forbidden high-cardinality identifiers.
         """
-        forbidden_found = self.FORBIDDEN_LABELS.intersection(labels.keys())
-        if forbidden_found:
+        # isdisjoint short-circuits without allocating; the offending set is
+        # only built for the error message
+        if not self.FORBIDDEN_LABELS.isdisjoint(labels):
+            forbidden_found = set(self.FORBIDDEN_LABELS.intersection(labels))
             raise ValueError(
                 f"High-cardinality identifiers cannot be metric labels: {forbidden_found}. "
                 "These belong in traces or logs, not metrics."
@@ -75,28 +99,90 @@ class MetricsHelper:
         Raises:
             ValueError: If metric_type is invalid or labels contain forbidden identifiers.
         """
-        # Validate labels do not include high-cardinality identifiers
-        if labels is None:
-            labels = {}
-        self._validate_labels(labels)
-
-        # Create metric instrument based on type
-        if metric_type == "counter":
-            counter = self._meter.create_counter(metric_name)
-            counter.add(value, labels)
-        elif metric_type == "histogram":
-            histogram = self._meter.create_histogram(metric_name)
-            histogram.record(value, labels)
-        elif metric_type == "gauge":
-            # Gauges in OpenTelemetry are typically created once and updated
-            # For simplicity, we'll use an UpDownCounter as a gauge
-            gauge = self._meter.create_up_down_counter(metric_name)
-            gauge.add(value, labels)
+        # Validate labels do not include high-cardinality identifiers. Without
+        # labels OpenTelemetry takes attributes=None, so no empty dict is built
+        if labels:
+            self._validate_labels(labels)
         else:
+            labels = None
+
+        # Record through the cached instrument method
+        record = self._instruments.get((metric_name, metric_type))
+        if record is None:
+            record = self._create_instrument(metric_name, metric_type)
+        record(value, labels)
+
+    def emit_many(
+        self,
+        records: Iterable[tuple[str, str, float, CorrelationFields, dict[str, str] | None]],
+    ) -> None:
+        """Emit a batch of metric values.
+
+        Each record is a ``(metric_name, metric_type, value, correlation,
+        labels)`` tuple, as accepted by emit_metric. Counter and gauge values
+        sharing a metric name, type and label set are summed and recorded
+        with a single call; histogram values are recorded individually so
+        their distribution is preserved. Every record is validated before
+        anything is recorded.
+
+        Args:
+            records: Metric records to emit.
+
+        Raises:
+            ValueError: If any metric_type is invalid or labels contain
+                forbidden identifiers.
+        """
+        totals: dict[tuple[str, str, frozenset[tuple[str, str]] | None], list[Any]] = {}
+        samples: list[tuple[Callable[..., None], float, dict[str, str] | None]] = []
+
+        for metric_name, metric_type, value, _correlation, labels in records:
+            if labels:
+                self._validate_labels(labels)
+            else:
+                labels = None
+
+            record = self._instruments.get((metric_name, metric_type))
+            if record is None:
+                record = self._create_instrument(metric_name, metric_type)
+
+            if metric_type in _ADDITIVE_TYPES:
+                key = (metric_name, metric_type, frozenset(labels.items()) if labels else None)
+                group = totals.get(key)
+                if group is None:
+                    totals[key] = [record, value, labels]
+                else:
+                    group[1] += value
+            else:
+                samples.append((record, value, labels))
+
+        for record, total, labels in totals.values():
+            record(total, labels)
+        for record, value, labels in samples:
+            record(value, labels)
+
+    def _create_instrument(self, metric_name: str, metric_type: str) -> Callable[..., None]:
+        """Create and cache the instrument for a metric.
+
+        Args:
+            metric_name: Name of the metric.
+            metric_type: Type of metric ('counter', 'histogram', 'gauge').
+
+        Returns:
+            Bound method that records a value on the new instrument.
+
+        Raises:
+            ValueError: If metric_type is invalid.
+        """
+        factory = _INSTRUMENT_FACTORIES.get(metric_type)
+        if factory is None:
             raise ValueError(
                 f"Invalid metric_type: {metric_type}. "
                 "Must be one of: 'counter', 'histogram', 'gauge'"
             )
+        record = factory(self._meter, metric_name)
+
+        # setdefault keeps the first instrument if two threads race here
+        return self._instruments.setdefault((metric_name, metric_type), record)
 
     def to_metric_value(
         self,
@@ -121,9 +207,12 @@ class MetricsHelper:
         Raises:
             ValueError: If labels contain forbidden identifiers.
         """
-        if labels is None:
-            labels = {}
-        self._validate_labels(labels)
+        # Empty labels cannot hold forbidden identifiers. MetricValue stores
+        # its own validated copy, so callers' dicts are never shared with it.
+        if labels:
+            self._validate_labels(labels)
+        else:
+            labels = _NO_LABELS
 
         return MetricValue(
             correlation=correlation,
@@ -6,12 +6,11 @@ do nothing, allowing the framework to run without external observability
 backends.
 """
 
-from agent_core.contracts.observability import (
-    AuditEvent,
-    LogEvent,
-    MetricValue,
-    TraceSpan,
-)
+from typing import Any
+
+
+def _discard(*args: Any, **kwargs: Any) -> None:
+    """Accept any signal and discard it."""
 
 
 class NoOpObservabilitySink:
@@ -26,38 +25,13 @@ class NoOpObservabilitySink:
     All methods are implemented as no-ops and return immediately.
     """
 
-    def emit_log(self, log_event: LogEvent) -> None:
-        """Emit a log event (no-op).
-
-        Args:
-            log_event: Structured log event (discarded).
-        """
-        pass
-
-    def emit_trace(self, span: TraceSpan) -> None:
-        """Emit a trace span (no-op).
-
-        Args:
-            span: Trace span (discarded).
-        """
-        pass
-
-    def emit_metric(self, metric: MetricValue) -> None:
-        """Emit a metric value (no-op).
-
-        Args:
-            metric: Metric value (discarded).
-        """
-        pass
+    __slots__ = ()
 
-    def emit_audit(self, audit_event: AuditEvent) -> None:
-        """Emit an audit event (no-op).
+    # All four signals share one static no-op, so emitting skips binding a
+    # method to the instance. Audit events should not use a no-op sink in
+    # production; this implementation is for testing only.
+    emit_log = emit_trace = emit_metric = emit_audit = staticmethod(_discard)
 
-        Args:
-            audit_event: Audit event (discarded).
 
-        Notes:
-            In production, audit events should not use a no-op sink.
-            This implementation is for testing only.
-        """
-        pass
+# Shared stateless instance; safe to reuse across threads and runtimes.
+NOOP_SINK = NoOpObservabilitySink()
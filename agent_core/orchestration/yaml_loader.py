@@ -12,6 +12,13 @@ from pydantic import ValidationError
 
 from agent_core.configuration.schemas import FlowConfig
 
+# Prefer the libyaml-backed loader; fall back to the pure-Python one when
+# PyYAML was built without libyaml
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 
 class FlowLoadError(Exception):
     """Raised when flow loading fails."""
@@ -41,7 +48,7 @@ def load_flow_from_yaml(yaml_path: str | Path) -> FlowConfig:
 
     try:
         with open(yaml_path, encoding="utf-8") as f:
-            flow_data = yaml.safe_load(f)
+            flow_data = yaml.load(f, Loader=_SafeLoader)
     except yaml.YAMLError as e:
         raise FlowLoadError(f"Failed to parse YAML file {yaml_path}: {e}") from e
     except OSError as e:
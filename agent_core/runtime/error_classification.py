@@ -4,6 +4,8 @@ Maps exceptions to structured Error objects conforming to the error contract.
 All errors must be classified according to the ErrorCategory enumeration.
 """
 
+import functools
+from collections.abc import Callable
 from typing import Any
 
 from agent_core.configuration.loader import ConfigurationError
@@ -43,31 +45,48 @@ class ErrorClassifier:
             - Non-retryable errors: validation_error, permission_error, budget_exceeded.
             - Potentially retryable errors: timeout, execution_failure, dependency_failure.
         """
+        handler = ErrorClassifier._handler_for(type(exception))
+        return handler(exception, source)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _handler_for(exception_type: type) -> Callable[[Any, str], Error]:
+        """Resolve the classification handler for an exception type.
+
+        The result depends only on the type, so the subclass checks run once
+        per exception type and later lookups are a cache hit.
+
+        Args:
+            exception_type: Type of the exception being classified.
+
+        Returns:
+            Handler that builds the Error for exceptions of this type.
+        """
         # Map known exception types to error categories
-        if isinstance(exception, PermissionError):
-            return ErrorClassifier._classify_permission_error(exception, source)
-        elif isinstance(exception, BudgetExhaustedError):
-            return ErrorClassifier._classify_budget_error(exception, source)
-        elif isinstance(exception, ConfigurationError):
-            return ErrorClassifier._classify_validation_error(exception, source)
-        elif isinstance(exception, RoutingError):
-            return ErrorClassifier._classify_routing_error(exception, source)
-        elif isinstance(exception, FlowLoadError):
-            return ErrorClassifier._classify_validation_error(exception, source)
-        elif isinstance(exception, FlowExecutionError):
-            return ErrorClassifier._classify_execution_failure(exception, source)
-        elif isinstance(exception, ActionExecutionError):
-            return ErrorClassifier._classify_action_execution_error(exception, source)
-        elif isinstance(exception, PolicyError):
-            return ErrorClassifier._classify_permission_error(exception, source)
-        elif isinstance(exception, AuditEmissionError):
+        if issubclass(exception_type, PermissionError):
+            return ErrorClassifier._classify_permission_error
+        elif issubclass(exception_type, BudgetExhaustedError):
+            return ErrorClassifier._classify_budget_error
+        elif issubclass(exception_type, ConfigurationError):
+            return ErrorClassifier._classify_validation_error
+        elif issubclass(exception_type, RoutingError):
+            return ErrorClassifier._classify_routing_error
+        elif issubclass(exception_type, FlowLoadError):
+            return ErrorClassifier._classify_validation_error
+        elif issubclass(exception_type, FlowExecutionError):
+            return ErrorClassifier._classify_execution_failure
+        elif issubclass(exception_type, ActionExecutionError):
+            return ErrorClassifier._classify_action_execution_error
+        elif issubclass(exception_type, PolicyError):
+            return ErrorClassifier._classify_permission_error
+        elif issubclass(exception_type, AuditEmissionError):
             # Audit errors are typically non-fatal but should be logged
-            return ErrorClassifier._classify_execution_failure(exception, source)
-        elif isinstance(exception, TimeoutError):
-            return ErrorClassifier._classify_timeout_error(exception, source)
+            return ErrorClassifier._classify_execution_failure
+        elif issubclass(exception_type, TimeoutError):
+            return ErrorClassifier._classify_timeout_error
         else:
             # Unknown exception - classify as execution_failure
-            return ErrorClassifier._classify_unknown_error(exception, source)
+            return ErrorClassifier._classify_unknown_error
 
     @staticmethod
     def _classify_permission_error(exception: PermissionError, source: str) -> Error:
@@ -4,10 +4,31 @@ Provides deterministic agent selection based on configuration and
 capabilities. No implicit LLM semantic routing is allowed.
 """
 
+import functools
+import sys
+from collections.abc import Collection, Mapping
+from types import MappingProxyType
+
 from agent_core.contracts.agent import Agent
 from agent_core.contracts.execution_context import ExecutionContext
 
 
+def _intern(capability: str) -> str:
+    """Intern a capability name, leaving non-str values unchanged.
+
+    Capabilities are declared as str, but other hashable values have always
+    been matched by equality (and simply found no match), so they must not
+    make interning raise.
+
+    Args:
+        capability: Capability name.
+
+    Returns:
+        The interned name, or the value itself if it is not a str.
+    """
+    return sys.intern(capability) if type(capability) is str else capability
+
+
 class RoutingError(Exception):
     """Raised when routing fails."""
 
@@ -24,15 +45,38 @@ class Router:
     def __init__(self, agents: dict[str, Agent]):
         """Initialize router with registered agents.
 
+        The router keeps a read-only snapshot of ``agents`` and builds its
+        capability index from it, so ID and capability lookups always agree.
+        Later changes to the passed dictionary are not seen; build a new
+        router to pick them up (Runtime.register_agent does this).
+
         Args:
             agents: Dictionary of agent_id -> Agent instances.
         """
-        self.agents = agents
+        self.agents: Mapping[str, Agent] = MappingProxyType(dict(agents))
+        # Agent IDs in selection order, sorted once rather than per lookup
+        self._sorted_ids: tuple[str, ...] = tuple(sorted(agents))
+        # Inverted index of capability -> IDs of the agents providing it, so
+        # capability lookups intersect a few small sets instead of scanning
+        # every agent
+        agents_by_capability: dict[str, set[str]] = {}
+        for agent_id, agent in agents.items():
+            for capability in agent.capabilities:
+                # Interned keys let lookups with interned names match on identity
+                agents_by_capability.setdefault(_intern(capability), set()).add(agent_id)
+        self._agents_by_capability: dict[str, frozenset[str]] = {
+            capability: frozenset(agent_ids)
+            for capability, agent_ids in agents_by_capability.items()
+        }
+        # Capability resolution is deterministic for a given router, so
+        # repeated capability sets are answered from a per-router LRU cache.
+        # A new router (built on registration) starts with an empty cache.
+        self._resolve_capabilities = functools.lru_cache(maxsize=512)(self._match_capabilities)
 
     def select_agent(
         self,
         agent_id: str | None = None,
-        required_capabilities: list[str] | None = None,
+        required_capabilities: Collection[str] | None = None,
         context: ExecutionContext | None = None,
     ) -> Agent:
         """Select an agent deterministically.
@@ -44,7 +88,9 @@ class Router:
 
         Args:
             agent_id: Optional explicit agent identifier.
-            required_capabilities: Optional list of required capabilities.
+            required_capabilities: Optional collection of required capabilities.
+                A frozenset is used as the cache key as is; other collections
+                are converted to one on each call.
             context: Optional execution context for governance checks.
 
         Returns:
@@ -55,31 +101,25 @@ class Router:
         """
         # If explicit agent_id is provided, use it
         if agent_id is not None:
-            if agent_id not in self.agents:
+            # Single dict lookup; capability matching is never reached
+            agent = self.agents.get(agent_id)
+            if agent is None:
                 raise RoutingError(f"Agent '{agent_id}' is not registered.")
-            return self.agents[agent_id]
+            return agent
 
         # If capabilities are required, find matching agents
         if required_capabilities is not None:
-            matching_agents = []
-            for agent_id_key, agent in self.agents.items():
-                agent_capabilities = set(agent.capabilities)
-                required_set = set(required_capabilities)
-                if required_set.issubset(agent_capabilities):
-                    matching_agents.append((agent_id_key, agent))
-
-            if not matching_agents:
+            if isinstance(required_capabilities, frozenset):
+                capabilities = required_capabilities
+            else:
+                capabilities = frozenset(required_capabilities)
+            matched_id = self._resolve_capabilities(capabilities)
+            if matched_id is None:
+                # Sorted (by text, as values need not be str) for a stable message
                 raise RoutingError(
-                    f"No agent found with required capabilities: {required_capabilities}"
+                    f"No agent found with required capabilities: {sorted(capabilities, key=str)}"
                 )
-
-            if len(matching_agents) > 1:
-                # Multiple agents match - resolve deterministically by agent_id (alphabetical)
-                matching_agents.sort(key=lambda x: x[0])
-                # Use first match (deterministic tie-breaking)
-                return matching_agents[0][1]
-
-            return matching_agents[0][1]
+            return self.agents[matched_id]
 
         # No selection criteria provided
         raise RoutingError(
@@ -87,13 +127,45 @@ class Router:
             "No implicit routing is allowed."
         )
 
+    def _match_capabilities(self, capabilities: frozenset[str]) -> str | None:
+        """Resolve a capability set to the ID of the agent that should handle it.
+
+        Only runs on a cache miss. Names are interned here, whatever
+        collection they arrived in, so index lookups match interned keys on
+        identity.
+
+        Args:
+            capabilities: Capabilities the agent must all provide.
+
+        Returns:
+            ID of the matching agent, or None if no agent provides them all.
+            Multiple matches are resolved deterministically by agent_id
+            (alphabetically first).
+        """
+        if capabilities:
+            candidates = []
+            for capability in capabilities:
+                agent_ids = self._agents_by_capability.get(_intern(capability))
+                if agent_ids is None:
+                    # No agent provides this capability, so none provides them all
+                    return None
+                candidates.append(agent_ids)
+
+            # Intersect smallest candidate sets first
+            candidates.sort(key=len)
+            matching_ids = candidates[0].intersection(*candidates[1:])
+            return min(matching_ids) if matching_ids else None
+
+        # No requirements: every registered agent matches
+        return self._sorted_ids[0] if self._sorted_ids else None
+
     def list_agents(self) -> list[str]:
         """List all registered agent IDs.
 
         Returns:
-            List of agent identifiers.
+            List of agent identifiers, sorted alphabetically.
         """
-        return list(self.agents.keys())
+        return list(self._sorted_ids)
 
     def get_agent(self, agent_id: str) -> Agent | None:
         """Get an agent by ID.
@@ -4,6 +4,7 @@ The runtime is the control plane of the framework, responsible for
 execution lifecycle, routing, and orchestration.
 """
 
+from collections.abc import Collection
 from datetime import datetime, timezone
 from typing import Any
 
@@ -16,7 +17,7 @@ from agent_core.contracts.tool import Tool
 from agent_core.governance.budget import BudgetTracker
 from agent_core.observability.interface import ObservabilitySink
 from agent_core.observability.logging import get_logger
-from agent_core.observability.noop import NoOpObservabilitySink
+from agent_core.observability.noop import NOOP_SINK
 from agent_core.runtime.action_execution import ActionExecutionError, ActionExecutor
 from agent_core.runtime.execution_context import create_execution_context
 from agent_core.runtime.lifecycle import LifecycleEvent, LifecycleManager, LifecycleState
@@ -48,15 +49,18 @@ class Runtime:
                 If None, tools must be registered later.
             services: Optional dictionary of service_id -> Service instances.
                 If None, services must be registered later.
-            observability_sink: Optional observability sink. If None, uses NoOpObservabilitySink.
+            observability_sink: Optional observability sink. If None, uses the shared
+                NOOP_SINK instance.
         """
         self.config = config
         self.agents: dict[str, Agent] = agents or {}
         self.tools: dict[str, Tool] = tools or {}
         self.services: dict[str, Service] = services or {}
-        self.observability_sink = observability_sink or NoOpObservabilitySink()
+        self.observability_sink = observability_sink or NOOP_SINK
         self.router = Router(self.agents)
-        self._last_lifecycle: LifecycleManager | None = None
+        # Events of the last finished execution, snapshotted once per run so
+        # get_lifecycle_events does not copy on every call
+        self._lifecycle_events: tuple[tuple[LifecycleEvent, dict[str, Any]], ...] = ()
 
         # Validate runtime config is present
         if config.runtime is None:
@@ -65,6 +69,9 @@ class Runtime:
     def register_agent(self, agent: Agent) -> None:
         """Register an agent with the runtime.
 
+        The router works from a snapshot of the registered agents and is
+        rebuilt here; agents written directly into ``agents`` are not routed.
+
         Args:
             agent: Agent instance to register.
         """
@@ -97,7 +104,7 @@ class Runtime:
         agent_id: str | None = None,
         input_data: dict[str, Any] | None = None,
         initiator: str = "system:runtime",
-        required_capabilities: list[str] | None = None,
+        required_capabilities: Collection[str] | None = None,
         context: ExecutionContext | None = None,
     ) -> AgentResult:
         """Execute an agent synchronously.
@@ -109,7 +116,7 @@ class Runtime:
             agent_id: Optional explicit agent identifier.
             input_data: Optional input data for the agent.
             initiator: Identity of the caller. Defaults to "system:runtime".
-            required_capabilities: Optional list of required capabilities.
+            required_capabilities: Optional collection of required capabilities.
             context: Optional execution context. If None, one will be created.
 
         Returns:
@@ -119,18 +126,48 @@ class Runtime:
             RoutingError: If agent selection fails.
             RuntimeError: If execution fails.
         """
-        # Create execution context if not provided
-        if context is None:
-            context = create_execution_context(
-                initiator=initiator,
-                runtime_config=self.config.runtime,
-            )
+        lifecycle: LifecycleManager | None = None
+        try:
+            # Create execution context if not provided
+            if context is None:
+                context = create_execution_context(
+                    initiator=initiator,
+                    runtime_config=self.config.runtime,
+                )
+
+            # Create lifecycle manager
+            lifecycle = LifecycleManager(context)
 
-        # Create lifecycle manager
-        lifecycle = LifecycleManager(context)
-        # Store lifecycle manager for event retrieval
-        self._last_lifecycle = lifecycle
+            return self._run_agent(lifecycle, context, agent_id, input_data, required_capabilities)
+        finally:
+            # Publish this execution's events for get_lifecycle_events however
+            # it ends, including failures while setting up observability
+            self._lifecycle_events = tuple(lifecycle.events) if lifecycle is not None else ()
 
+    def _run_agent(
+        self,
+        lifecycle: LifecycleManager,
+        context: ExecutionContext,
+        agent_id: str | None,
+        input_data: dict[str, Any] | None,
+        required_capabilities: Collection[str] | None,
+    ) -> AgentResult:
+        """Route and run an agent, driving the execution's lifecycle.
+
+        Args:
+            lifecycle: Lifecycle manager for this execution.
+            context: Execution context for this execution.
+            agent_id: Optional explicit agent identifier.
+            input_data: Optional input data for the agent.
+            required_capabilities: Optional collection of required capabilities.
+
+        Returns:
+            AgentResult from agent execution.
+
+        Raises:
+            RoutingError: If agent selection fails.
+            RuntimeError: If execution fails.
+        """
         # Create correlation for observability
         correlation = CorrelationFields(
             run_id=context.run_id,
@@ -263,16 +300,19 @@ class Runtime:
                 lifecycle.transition_to(LifecycleState.TERMINATED)
                 logger.info("Runtime execution terminated")
 
-    def get_lifecycle_events(self) -> list[tuple[LifecycleEvent, dict[str, Any]]]:
+    def get_lifecycle_events(self) -> tuple[tuple[LifecycleEvent, dict[str, Any]], ...]:
         """Get lifecycle events from last execution.
 
+        The snapshot is taken when an execution finishes, so repeated calls
+        return the same immutable tuple without copying. While an execution
+        is in progress (for example, when called from inside an agent), this
+        still returns the events of the previous finished execution.
+
         Returns:
-            List of (event, metadata) tuples from the last execution.
-            Returns empty list if no execution has occurred yet.
+            Tuple of (event, metadata) tuples from the last finished execution.
+            Returns an empty tuple if no execution has finished yet.
         """
-        if self._last_lifecycle is None:
-            return []
-        return self._last_lifecycle.get_events()
+        return self._lifecycle_events
 
     def execute_action(self, action: dict[str, Any], context: ExecutionContext) -> dict[str, Any]:
         """Execute an action using the runtime's ActionExecutor.
@@ -82,5 +82,8 @@ class BaseTool(ABC):
             - Tools should respect timeout constraints from input_data.
             - Tools should surface errors in the errors field of ToolResult.
             - Tools should record execution metrics in the metrics field.
+            - The runtime reads the result's fields without re-validating it,
+              so tools returning trusted, well-typed data on hot paths may
+              build it with ToolResult.model_construct to skip validation.
         """
         ...
@@ -14,6 +14,7 @@ from agent_core.contracts.observability import (
     TraceSpan,
 )
 from agent_core.utils.ids import generate_correlation_id, generate_run_id
+from tests.contracts.helpers import assert_schema_immutable
 
 
 class TestCorrelationFields:
@@ -40,6 +41,22 @@ class TestCorrelationFields:
         assert correlation.component_version == "1.0.0"
         assert correlation.timestamp == "2024-01-01T00:00:00Z"
 
+    def test_correlation_fields_is_immutable(self):
+        """Test that CorrelationFields and events embedding it are immutable."""
+        correlation = CorrelationFields(
+            run_id=generate_run_id(),
+            correlation_id=generate_correlation_id(),
+            component_type=ComponentType.AGENT,
+            component_id="agent:test_agent",
+            component_version="1.0.0",
+            timestamp="2024-01-01T00:00:00Z",
+        )
+        log_event = LogEvent(correlation=correlation, level=LogLevel.INFO, message="Test")
+
+        assert_schema_immutable(correlation)
+        assert_schema_immutable(log_event)
+        assert log_event.correlation is correlation
+
     def test_correlation_fields_requires_all_fields(self):
         """Test that CorrelationFields requires all mandatory fields."""
         with pytest.raises(ValidationError):
@@ -152,10 +152,10 @@ def test_lifecycle_events_tracked_per_execution():
 
 
 def test_lifecycle_events_empty_before_execution():
-    """Test that lifecycle events return empty list before execution."""
+    """Test that lifecycle events are empty before execution."""
     config = AgentCoreConfig(runtime=RuntimeConfig(runtime_id="test_runtime"))
     runtime = Runtime(config=config)
 
     # Before any execution, events should be empty
     events = runtime.get_lifecycle_events()
-    assert events == []
+    assert events == ()
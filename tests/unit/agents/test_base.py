@@ -5,7 +5,6 @@ import pytest
 from agent_core.agents.base import BaseAgent
 from agent_core.contracts.agent import AgentInput, AgentResult
 from agent_core.contracts.execution_context import ExecutionContext
-from agent_core.runtime.execution_context import create_execution_context
 
 
 class ConcreteAgent(BaseAgent):
@@ -57,13 +56,12 @@ class TestBaseAgent:
         assert agent.agent_version == "1.0.0"
         assert agent.capabilities == ["cap1", "cap2"]
 
-    def test_concrete_agent_run(self):
+    def test_concrete_agent_run(self, shared_context):
         """Test that concrete agent can execute."""
         agent = ConcreteAgent("agent1", "1.0.0", ["cap1"])
-        context = create_execution_context(initiator="user:test")
         input_data = AgentInput(payload={"test": "data"})
 
-        result = agent.run(input_data, context)
+        result = agent.run(input_data, shared_context)
 
         assert result.status == "success"
         assert result.output == {"result": "test"}
@@ -1,5 +1,6 @@
 """Unit tests for configuration loader."""
 
+import io
 import os
 
 import pytest
@@ -38,9 +39,8 @@ class TestLoadConfig:
         assert config.runtime.mode == "development"
         assert config.runtime.concurrency == 2
 
-    def test_load_config_with_all_sections(self, tmp_path):
+    def test_load_config_with_all_sections(self):
         """Test loading configuration with all sections."""
-        config_file = tmp_path / "config.yaml"
         config_data = {
             "runtime": {
                 "runtime_id": "test-runtime",
@@ -87,9 +87,8 @@ class TestLoadConfig:
                 "name": "test",
             },
         }
-        config_file.write_text(yaml.dump(config_data))
 
-        config = load_config(str(config_file))
+        config = load_config(io.StringIO(yaml.dump(config_data)))
 
         assert config.runtime is not None
         assert len(config.agents) == 1
@@ -101,17 +100,15 @@ class TestLoadConfig:
         assert config.observability is not None
         assert config.environment is not None
 
-    def test_load_config_with_defaults(self, tmp_path):
+    def test_load_config_with_defaults(self):
         """Test that configuration uses defaults for optional fields."""
-        config_file = tmp_path / "config.yaml"
         config_data = {
             "runtime": {
                 "runtime_id": "test-runtime",
             }
         }
-        config_file.write_text(yaml.dump(config_data))
 
-        config = load_config(str(config_file))
+        config = load_config(io.StringIO(yaml.dump(config_data)))
 
         assert config.runtime is not None
         assert config.runtime.mode == "development"  # default
@@ -124,33 +121,33 @@ class TestLoadConfig:
         with pytest.raises(ConfigurationError, match="Configuration file not found"):
             load_config("/nonexistent/path/config.yaml")
 
-    def test_load_config_invalid_yaml(self, tmp_path):
-        """Test that load_config raises error for invalid YAML."""
+    def test_load_config_invalid_yaml_file(self, tmp_path):
+        """Test that load_config raises error for an invalid YAML file."""
         config_file = tmp_path / "config.yaml"
         config_file.write_text("invalid: yaml: content: [unclosed")
 
         with pytest.raises(ConfigurationError, match="Failed to parse YAML"):
             load_config(str(config_file))
 
-    def test_load_config_invalid_schema(self, tmp_path):
+    def test_load_config_invalid_yaml(self):
+        """Test that load_config raises error for invalid YAML."""
+        with pytest.raises(ConfigurationError, match="Failed to parse YAML"):
+            load_config(io.StringIO("invalid: yaml: content: [unclosed"))
+
+    def test_load_config_invalid_schema(self):
         """Test that load_config raises error for invalid schema."""
-        config_file = tmp_path / "config.yaml"
         config_data = {
             "runtime": {
                 "runtime_id": 123,  # Should be string
             }
         }
-        config_file.write_text(yaml.dump(config_data))
 
         with pytest.raises(ConfigurationError, match="Configuration validation failed"):
-            load_config(str(config_file))
+            load_config(io.StringIO(yaml.dump(config_data)))
 
-    def test_load_config_empty_file(self, tmp_path):
+    def test_load_config_empty_file(self):
         """Test that load_config handles empty file."""
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text("")
-
-        config = load_config(str(config_file))
+        config = load_config(io.StringIO(""))
 
         assert isinstance(config, AgentCoreConfig)
         assert config.runtime is None
@@ -2,7 +2,8 @@
 
 import pytest
 
-from agent_core.configuration.loader import ConfigurationError, load_config_from_dict
+from agent_core.configuration.loader import ConfigurationError
+from agent_core.configuration.schemas import AgentCoreConfig
 from agent_core.configuration.validation import (
     apply_environment_overrides,
     validate_and_apply_overrides,
@@ -15,7 +16,7 @@ class TestValidateConfig:
 
     def test_validate_config_with_valid_runtime(self):
         """Test that valid configuration passes validation."""
-        config = load_config_from_dict(
+        config = AgentCoreConfig.model_validate(
             {
                 "runtime": {
                     "runtime_id": "test-runtime",
@@ -28,14 +29,14 @@ class TestValidateConfig:
 
     def test_validate_config_missing_runtime(self):
         """Test that missing runtime configuration fails validation."""
-        config = load_config_from_dict({})
+        config = AgentCoreConfig.model_validate({})
 
         with pytest.raises(ConfigurationError, match="Runtime configuration is required"):
             validate_config(config)
 
     def test_validate_config_agent_id_mismatch(self):
         """Test that agent_id mismatch fails validation."""
-        config = load_config_from_dict(
+        config = AgentCoreConfig.model_validate(
             {
                 "runtime": {"runtime_id": "test-runtime"},
                 "agents": {
@@ -52,7 +53,7 @@ class TestValidateConfig:
 
     def test_validate_config_tool_id_mismatch(self):
         """Test that tool_id mismatch fails validation."""
-        config = load_config_from_dict(
+        config = AgentCoreConfig.model_validate(
             {
                 "runtime": {"runtime_id": "test-runtime"},
                 "tools": {
@@ -69,7 +70,7 @@ class TestValidateConfig:
 
     def test_validate_config_service_id_mismatch(self):
         """Test that service_id mismatch fails validation."""
-        config = load_config_from_dict(
+        config = AgentCoreConfig.model_validate(
             {
                 "runtime": {"runtime_id": "test-runtime"},
                 "services": {
@@ -86,7 +87,7 @@ class TestValidateConfig:
 
     def test_validate_config_flow_id_mismatch(self):
         """Test that flow_id mismatch fails validation."""
-        config = load_config_from_dict(
+        config = AgentCoreConfig.model_validate(
             {
                 "runtime": {"runtime_id": "test-runtime"},
                 "flows": {
@@ -105,7 +106,7 @@ class TestValidateConfig:
 
     def test_validate_config_agent_provider_binding_without_providers(self):
         """Test that agent with provider_binding but no providers fails."""
-        config = load_config_from_dict(
+        config = AgentCoreConfig.model_validate(
             {
                 "runtime": {"runtime_id": "test-runtime"},
                 "agents": {
@@ -123,7 +124,7 @@ class TestValidateConfig:
 
     def test_validate_config_service_provider_binding_without_providers(self):
         """Test that service with provider_binding but no providers fails."""
-        config = load_config_from_dict(
+        config = AgentCoreConfig.model_validate(
             {
                 "runtime": {"runtime_id": "test-runtime"},
                 "services": {
@@ -141,7 +142,7 @@ class TestValidateConfig:
 
     def test_validate_config_flow_entrypoint_not_in_nodes(self):
         """Test that flow with entrypoint not in nodes fails."""
-        config = load_config_from_dict(
+        config = AgentCoreConfig.model_validate(
             {
                 "runtime": {"runtime_id": "test-runtime"},
                 "flows": {
@@ -160,7 +161,7 @@ class TestValidateConfig:
 
     def test_validate_config_multiple_errors(self):
         """Test that multiple validation errors are all reported."""
-        config = load_config_from_dict(
+        config = AgentCoreConfig.model_validate(
             {
                 "runtime": {"runtime_id": "test-runtime"},
                 "agents": {
@@ -191,7 +192,7 @@ class TestApplyEnvironmentOverrides:
 
     def test_apply_overrides_with_no_environment_config(self):
         """Test that config without environment config returns unchanged."""
-        config = load_config_from_dict(
+        config = AgentCoreConfig.model_validate(
             {
                 "runtime": {
                     "runtime_id": "test-runtime",
@@ -208,7 +209,7 @@ class TestApplyEnvironmentOverrides:
 
     def test_apply_overrides_with_empty_overrides(self):
         """Test that config with empty overrides returns unchanged."""
-        config = load_config_from_dict(
+        config = AgentCoreConfig.model_validate(
             {
                 "runtime": {
                     "runtime_id": "test-runtime",
@@ -228,7 +229,7 @@ class TestApplyEnvironmentOverrides:
 
     def test_apply_overrides_runtime_section(self):
         """Test that runtime section can be overridden."""
-        config = load_config_from_dict(
+        config = AgentCoreConfig.model_validate(
             {
                 "runtime": {
                     "runtime_id": "test-runtime",
@@ -253,7 +254,7 @@ class TestApplyEnvironmentOverrides:
 
     def test_apply_overrides_agents_section(self):
         """Test that agents section can be merged."""
-        config = load_config_from_dict(
+        config = AgentCoreConfig.model_validate(
             {
                 "runtime": {"runtime_id": "test-runtime"},
                 "agents": {
@@ -289,7 +290,7 @@ class TestApplyEnvironmentOverrides:
 
     def test_apply_overrides_with_explicit_environment_name(self):
         """Test that explicit environment name can be provided."""
-        config = load_config_from_dict(
+        config = AgentCoreConfig.model_validate(
             {
                 "runtime": {
                     "runtime_id": "test-runtime",
@@ -313,7 +314,7 @@ class TestApplyEnvironmentOverrides:
 
     def test_apply_overrides_validates_merged_config(self):
         """Test that merged config is validated."""
-        config = load_config_from_dict(
+        config = AgentCoreConfig.model_validate(
             {
                 "runtime": {"runtime_id": "test-runtime"},
                 "environment": {
@@ -336,7 +337,7 @@ class TestValidateAndApplyOverrides:
 
     def test_validate_and_apply_overrides_success(self):
         """Test successful validation and override application."""
-        config = load_config_from_dict(
+        config = AgentCoreConfig.model_validate(
             {
                 "runtime": {"runtime_id": "test-runtime"},
                 "environment": {
@@ -357,14 +358,14 @@ class TestValidateAndApplyOverrides:
 
     def test_validate_and_apply_overrides_fails_on_invalid_base(self):
         """Test that invalid base config fails before applying overrides."""
-        config = load_config_from_dict({})  # Missing runtime
+        config = AgentCoreConfig.model_validate({})  # Missing runtime
 
         with pytest.raises(ConfigurationError, match="Runtime configuration is required"):
             validate_and_apply_overrides(config, emit_observability=False)
 
     def test_validate_and_apply_overrides_fails_on_invalid_merged(self):
         """Test that invalid merged config fails validation."""
-        config = load_config_from_dict(
+        config = AgentCoreConfig.model_validate(
             {
                 "runtime": {"runtime_id": "test-runtime"},
                 "environment": {
@@ -386,7 +387,7 @@ class TestValidateAndApplyOverrides:
 
     def test_validate_and_apply_overrides_with_observability(self):
         """Test that observability signals are emitted when enabled."""
-        config = load_config_from_dict(
+        config = AgentCoreConfig.model_validate(
             {
                 "runtime": {"runtime_id": "test-runtime"},
             }
@@ -0,0 +1,79 @@
+"""Shared fixtures for unit tests."""
+
+import itertools
+import uuid
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from agent_core.contracts.execution_context import ExecutionContext
+from agent_core.runtime.execution_context import create_execution_context
+
+# IDs generated once per session and served round-robin, so tests that only
+# need a well-formed ID do not draw from os.urandom on every call. Tests that
+# assert on ID generation or uniqueness use the real generators instead.
+_ID_POOL_SIZE = 1024
+_ID_POOL = tuple(str(uuid.uuid4()) for _ in range(_ID_POOL_SIZE))
+_id_counter = itertools.count()
+
+
+def _pooled_id() -> str:
+    """Return the next ID from the pre-generated pool."""
+    return _ID_POOL[next(_id_counter) % _ID_POOL_SIZE]
+
+
+@pytest.fixture(scope="session")
+def fresh_id() -> Callable[[], str]:
+    """Return a callable serving valid UUID4 strings from the shared pool.
+
+    Consecutive calls return distinct IDs, but the pool wraps around, so do
+    not use it where uniqueness across a whole test session matters.
+    """
+    return _pooled_id
+
+
+@pytest.fixture(scope="session")
+def shared_context() -> ExecutionContext:
+    """Execution context shared by tests that only read it.
+
+    ExecutionContext is frozen, so sharing one instance is safe. Tests that
+    assert on ID generation or uniqueness create their own contexts.
+    """
+    return create_execution_context(initiator="user:test")
+
+
+@pytest.fixture(scope="session")
+def perm_context() -> ExecutionContext:
+    """Shared read-only context granting "read" and denying "write"."""
+    return create_execution_context(
+        initiator="user:test",
+        permissions={"read": True, "write": False},
+    )
+
+
+@pytest.fixture(scope="session")
+def make_context() -> Callable[..., ExecutionContext]:
+    """Return a factory for unvalidated ExecutionContexts used as test inputs.
+
+    Contexts are built with ``model_construct`` and pooled IDs, so tests whose
+    subject is not context creation skip validation. Keyword arguments
+    override the defaults. Tests that check creation or validation should
+    use create_execution_context instead.
+    """
+
+    def factory(**fields: Any) -> ExecutionContext:
+        values: dict[str, Any] = {
+            "run_id": _pooled_id(),
+            "correlation_id": _pooled_id(),
+            "initiator": "user:test",
+            "permissions": {},
+            "budget": {},
+            "locale": "en-US",
+            "observability": {},
+            "metadata": {},
+        }
+        values.update(fields)
+        return ExecutionContext.model_construct(**values)
+
+    return factory
@@ -0,0 +1,29 @@
+"""Shared fixtures for governance tests."""
+
+import pytest
+
+
+class FakeClock:
+    """Controllable stand-in for the ``time`` module used by budget tracking."""
+
+    def __init__(self) -> None:
+        self._now_ns = 0
+
+    def monotonic_ns(self) -> int:
+        return self._now_ns
+
+    def time(self) -> float:
+        """Wall-clock seconds, starting at 2024-01-01T00:00:00Z."""
+        return 1_704_067_200 + self._now_ns / 1_000_000_000
+
+    def advance(self, seconds: float) -> None:
+        """Move the clock forward without sleeping."""
+        self._now_ns += int(seconds * 1_000_000_000)
+
+
+@pytest.fixture
+def fake_clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    """Replace the budget module's clock with a manually advanced one."""
+    clock = FakeClock()
+    monkeypatch.setattr("agent_core.governance.budget.time", clock)
+    return clock
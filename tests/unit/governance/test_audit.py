@@ -2,10 +2,9 @@
 
 import pytest
 
-from agent_core.contracts.observability import AuditEvent
+from agent_core.contracts.observability import AuditEvent, CorrelationFields
 from agent_core.governance.audit import AuditEmissionError, AuditEmitter
-from agent_core.observability.noop import NoOpObservabilitySink
-from agent_core.runtime.execution_context import create_execution_context
+from agent_core.observability.noop import NOOP_SINK, NoOpObservabilitySink
 
 
 class FailingObservabilitySink:
@@ -28,202 +27,180 @@ class FailingObservabilitySink:
         raise RuntimeError("Audit emission failed")
 
 
-class TestAuditEmitter:
-    """Test AuditEmitter."""
+class CapturingSink(NoOpObservabilitySink):
+    """Sink that records audit events and discards other signals.
 
-    def test_emit_permission_decision_allowed(self):
-        """Test emitting audit event for allowed permission decision."""
-        context = create_execution_context(initiator="user:test")
-        sink = NoOpObservabilitySink()
-        emitter = AuditEmitter(context, sink)
+    It is a distinct instance from NOOP_SINK, so AuditEmitter builds and
+    emits every event.
+    """
 
-        # Should not raise
-        emitter.emit_permission_decision(
-            action="tool.execute",
-            target_resource="tool:my_tool",
-            decision_outcome="allowed",
-            permission="read",
-        )
+    def __init__(self) -> None:
+        self.audit_events: list[AuditEvent] = []
 
-    def test_emit_permission_decision_denied(self):
-        """Test emitting audit event for denied permission decision."""
-        context = create_execution_context(initiator="user:test")
-        sink = NoOpObservabilitySink()
-        emitter = AuditEmitter(context, sink)
+    def emit_audit(self, audit_event: AuditEvent) -> None:
+        self.audit_events.append(audit_event)
 
-        # Should not raise
-        emitter.emit_permission_decision(
-            action="tool.execute",
-            target_resource="tool:my_tool",
-            decision_outcome="denied",
-            permission="write",
-        )
 
-    def test_emit_permission_decision_without_permission(self):
-        """Test emitting audit event without permission identifier."""
-        context = create_execution_context(initiator="user:test")
-        sink = NoOpObservabilitySink()
-        emitter = AuditEmitter(context, sink)
+@pytest.fixture
+def sink():
+    """Fresh capturing sink."""
+    return CapturingSink()
 
-        # Should not raise
-        emitter.emit_permission_decision(
-            action="service.read",
-            target_resource="service:my_service",
-            decision_outcome="allowed",
-        )
 
-    def test_emit_policy_decision_allow(self):
-        """Test emitting audit event for policy decision (allow)."""
-        context = create_execution_context(initiator="user:test")
-        sink = NoOpObservabilitySink()
-        emitter = AuditEmitter(context, sink)
+@pytest.fixture
+def emitter(shared_context, sink):
+    """AuditEmitter writing to the capturing sink."""
+    return AuditEmitter(shared_context, sink)
 
-        # Should not raise
-        emitter.emit_policy_decision(
-            action="tool.execute",
-            target_resource="tool:my_tool",
-            decision_outcome="allow",
-            policy="tool.policy",
-        )
 
-    def test_emit_policy_decision_deny(self):
-        """Test emitting audit event for policy decision (deny)."""
-        context = create_execution_context(initiator="user:test")
-        sink = NoOpObservabilitySink()
-        emitter = AuditEmitter(context, sink)
+def _single_event(sink: CapturingSink) -> AuditEvent:
+    """Return the only audit event the sink received."""
+    assert len(sink.audit_events) == 1
+    return sink.audit_events[0]
 
-        # Should not raise
-        emitter.emit_policy_decision(
-            action="tool.delete",
-            target_resource="tool:my_tool",
-            decision_outcome="deny",
-            policy="tool.delete.policy",
-        )
 
-    def test_emit_policy_decision_require_approval(self):
-        """Test emitting audit event for policy decision (require_approval)."""
-        context = create_execution_context(initiator="user:test")
-        sink = NoOpObservabilitySink()
-        emitter = AuditEmitter(context, sink)
+class TestAuditEmitter:
+    """Test AuditEmitter."""
 
-        # Should not raise
-        emitter.emit_policy_decision(
-            action="service.write",
-            target_resource="service:my_service",
-            decision_outcome="require_approval",
-            policy="service.write.policy",
+    @pytest.mark.parametrize(
+        ("action", "target_resource", "decision_outcome", "permission"),
+        [
+            ("tool.execute", "tool:my_tool", "allowed", "read"),
+            ("tool.execute", "tool:my_tool", "denied", "write"),
+            ("service.read", "service:my_service", "allowed", None),
+        ],
+        ids=["allowed", "denied", "without_permission"],
+    )
+    def test_emit_permission_decision(
+        self, emitter, sink, action, target_resource, decision_outcome, permission
+    ):
+        """Test emitting audit events for permission decisions."""
+        emitter.emit_permission_decision(
+            action=action,
+            target_resource=target_resource,
+            decision_outcome=decision_outcome,
+            permission=permission,
         )
 
-    def test_emit_budget_exhaustion_time(self):
-        """Test emitting audit event for time budget exhaustion."""
-        context = create_execution_context(initiator="user:test")
-        sink = NoOpObservabilitySink()
-        emitter = AuditEmitter(context, sink)
-
-        # Should not raise
-        emitter.emit_budget_exhaustion(
-            budget_type="time",
-            limit=60.0,
-            consumed=65.0,
+        event = _single_event(sink)
+        assert event.action == action
+        assert event.target_resource == target_resource
+        assert event.decision_outcome == decision_outcome
+        assert event.policy_or_permission == permission
+        assert event.correlation.component_id == "governance:permissions"
+
+    @pytest.mark.parametrize(
+        ("action", "target_resource", "decision_outcome", "policy"),
+        [
+            ("tool.execute", "tool:my_tool", "allow", "tool.policy"),
+            ("tool.delete", "tool:my_tool", "deny", "tool.delete.policy"),
+            ("service.write", "service:my_service", "require_approval", "service.write.policy"),
+        ],
+        ids=["allow", "deny", "require_approval"],
+    )
+    def test_emit_policy_decision(
+        self, emitter, sink, action, target_resource, decision_outcome, policy
+    ):
+        """Test emitting audit events for policy decisions."""
+        emitter.emit_policy_decision(
+            action=action,
+            target_resource=target_resource,
+            decision_outcome=decision_outcome,
+            policy=policy,
         )
 
-    def test_emit_budget_exhaustion_calls(self):
-        """Test emitting audit event for call budget exhaustion."""
-        context = create_execution_context(initiator="user:test")
-        sink = NoOpObservabilitySink()
-        emitter = AuditEmitter(context, sink)
-
-        # Should not raise
-        emitter.emit_budget_exhaustion(
-            budget_type="calls",
-            limit=100,
-            consumed=101,
+        event = _single_event(sink)
+        assert event.action == action
+        assert event.target_resource == target_resource
+        assert event.decision_outcome == decision_outcome
+        assert event.policy_or_permission == policy
+        assert event.correlation.component_id == "governance:policy"
+
+    @pytest.mark.parametrize(
+        ("budget_type", "limit", "consumed"),
+        [("time", 60.0, 65.0), ("calls", 100, 101), ("cost", 10.0, 12.5)],
+        ids=["time", "calls", "cost"],
+    )
+    def test_emit_budget_exhaustion(self, emitter, sink, budget_type, limit, consumed):
+        """Test emitting audit events for budget exhaustion."""
+        emitter.emit_budget_exhaustion(budget_type=budget_type, limit=limit, consumed=consumed)
+
+        event = _single_event(sink)
+        assert event.action == f"budget.exhausted.{budget_type}"
+        assert event.target_resource == f"budget:{budget_type}"
+        assert event.decision_outcome == "denied"
+        assert event.policy_or_permission is None
+        assert event.correlation.component_id == "governance:budget"
+
+    def test_emit_governance_decision(self, emitter, sink):
+        """Test emitting audit event for general governance decision."""
+        emitter.emit_governance_decision(
+            action="custom.action",
+            target_resource="resource:custom",
+            decision_outcome="allowed",
+            policy_or_permission="custom.policy",
+            component_id="governance:custom",
         )
 
-    def test_emit_budget_exhaustion_cost(self):
-        """Test emitting audit event for cost budget exhaustion."""
-        context = create_execution_context(initiator="user:test")
-        sink = NoOpObservabilitySink()
-        emitter = AuditEmitter(context, sink)
-
-        # Should not raise
-        emitter.emit_budget_exhaustion(
-            budget_type="cost",
-            limit=10.0,
-            consumed=12.5,
-        )
+        event = _single_event(sink)
+        assert event.action == "custom.action"
+        assert event.target_resource == "resource:custom"
+        assert event.decision_outcome == "allowed"
+        assert event.policy_or_permission == "custom.policy"
+        assert event.correlation.component_id == "governance:custom"
 
-    def test_emit_governance_decision(self):
-        """Test emitting audit event for general governance decision."""
-        context = create_execution_context(initiator="user:test")
-        sink = NoOpObservabilitySink()
-        emitter = AuditEmitter(context, sink)
+    def test_noop_sink_skips_event_construction(self, shared_context, monkeypatch):
+        """Test that emitting to the shared no-op sink builds no events."""
+        emitter = AuditEmitter(shared_context, NOOP_SINK)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("audit event should not be built")
 
-        # Should not raise
+        monkeypatch.setattr("agent_core.governance.audit.AuditEvent", fail)
+
+        emitter.emit_permission_decision(
+            action="tool.execute",
+            target_resource="tool:my_tool",
+            decision_outcome="allowed",
+        )
+        emitter.emit_policy_decision(
+            action="tool.execute",
+            target_resource="tool:my_tool",
+            decision_outcome="allow",
+        )
+        emitter.emit_budget_exhaustion(budget_type="calls", limit=1, consumed=1)
         emitter.emit_governance_decision(
             action="custom.action",
             target_resource="resource:custom",
             decision_outcome="allowed",
-            policy_or_permission="custom.policy",
-            component_id="governance:custom",
         )
 
-    def test_audit_emission_failure_raises_error(self):
+    def test_audit_emission_failure_raises_error(self, shared_context):
         """Test that audit emission failure raises AuditEmissionError."""
-        context = create_execution_context(initiator="user:test")
-        sink = FailingObservabilitySink()
-        emitter = AuditEmitter(context, sink)
+        emitter = AuditEmitter(shared_context, FailingObservabilitySink())
 
-        with pytest.raises(AuditEmissionError, match="Failed to emit audit event"):
+        with pytest.raises(AuditEmissionError) as exc_info:
             emitter.emit_permission_decision(
                 action="tool.execute",
                 target_resource="tool:my_tool",
                 decision_outcome="allowed",
             )
+        assert "Failed to emit audit event" in str(exc_info.value)
 
-    def test_audit_emitter_uses_context(self):
+    def test_audit_emitter_uses_context(self, emitter, shared_context):
         """Test that emitter uses execution context."""
-        context = create_execution_context(initiator="user:test")
-        sink = NoOpObservabilitySink()
-        emitter = AuditEmitter(context, sink)
+        assert emitter.context == shared_context
 
-        assert emitter.context == context
-
-    def test_audit_emitter_uses_sink(self):
+    def test_audit_emitter_uses_sink(self, emitter, sink):
         """Test that emitter uses observability sink."""
-        context = create_execution_context(initiator="user:test")
-        sink = NoOpObservabilitySink()
-        emitter = AuditEmitter(context, sink)
-
-        assert emitter.sink == sink
+        assert emitter.sink is sink
 
 
 class TestAuditEventStructure:
     """Test that audit events are structured correctly."""
 
-    def test_permission_audit_event_structure(self):
+    def test_permission_audit_event_structure(self, emitter, sink, shared_context):
         """Test that permission audit events have correct structure."""
-        context = create_execution_context(initiator="user:test")
-        captured_events = []
-
-        class CapturingSink:
-            """Sink that captures audit events."""
-
-            def emit_log(self, log_event):
-                pass
-
-            def emit_trace(self, span):
-                pass
-
-            def emit_metric(self, metric):
-                pass
-
-            def emit_audit(self, audit_event: AuditEvent):
-                captured_events.append(audit_event)
-
-        sink = CapturingSink()
-        emitter = AuditEmitter(context, sink)
-
         emitter.emit_permission_decision(
             action="tool.execute",
             target_resource="tool:my_tool",
@@ -231,12 +208,13 @@ class TestAuditEventStructure:
             permission="read",
         )
 
-        assert len(captured_events) == 1
-        event = captured_events[0]
+        event = _single_event(sink)
         assert event.initiator_identity == "user:test"
         assert event.action == "tool.execute"
         assert event.target_resource == "tool:my_tool"
         assert event.decision_outcome == "allowed"
         assert event.policy_or_permission == "read"
-        assert event.correlation.run_id == context.run_id
-        assert event.correlation.correlation_id == context.correlation_id
+        assert event.correlation.run_id == shared_context.run_id
+        assert event.correlation.correlation_id == shared_context.correlation_id
+        assert event.correlation.component_id == "governance:permissions"
+        assert CorrelationFields.model_validate(event.correlation.model_dump()) == event.correlation
@@ -1,19 +1,17 @@
 """Unit tests for budget tracking and enforcement."""
 
-import time
-
 import pytest
 
+from agent_core.contracts.errors import Error
 from agent_core.governance.budget import BudgetEnforcer, BudgetExhaustedError, BudgetTracker
-from agent_core.runtime.execution_context import create_execution_context
 
 
 class TestBudgetTracker:
     """Test BudgetTracker."""
 
-    def test_tracker_initialization(self):
+    def test_tracker_initialization(self, make_context):
         """Test budget tracker initialization."""
-        context = create_execution_context(
+        context = make_context(
             initiator="user:test",
             budget={"time_limit_seconds": 60, "call_limit": 100, "cost_limit": 10.0},
         )
@@ -25,18 +23,18 @@ class TestBudgetTracker:
         assert tracker.call_count == 0
         assert tracker.cost_accumulated == 0.0
 
-    def test_tracker_initialization_no_limits(self):
+    def test_tracker_initialization_no_limits(self, make_context):
         """Test tracker initialization with no budget limits."""
-        context = create_execution_context(initiator="user:test", budget={})
+        context = make_context(initiator="user:test", budget={})
         tracker = BudgetTracker(context)
 
         assert tracker.time_limit is None
         assert tracker.call_limit is None
         assert tracker.cost_limit is None
 
-    def test_record_call(self):
+    def test_record_call(self, make_context):
         """Test recording calls."""
-        context = create_execution_context(
+        context = make_context(
             initiator="user:test",
             budget={"call_limit": 10},
         )
@@ -48,9 +46,9 @@ class TestBudgetTracker:
         tracker.record_call()
         assert tracker.get_call_count() == 2
 
-    def test_record_cost(self):
+    def test_record_cost(self, make_context):
         """Test recording cost."""
-        context = create_execution_context(
+        context = make_context(
             initiator="user:test",
             budget={"cost_limit": 10.0},
         )
@@ -62,33 +60,130 @@ class TestBudgetTracker:
         tracker.record_cost(2.3)
         assert tracker.get_cost_accumulated() == 3.8
 
-    def test_record_cost_negative_raises_error(self):
+    def test_record_cost_accumulates_exactly(self, make_context):
+        """Test that repeated fractional costs do not drift below the limit."""
+        context = make_context(
+            initiator="user:test",
+            budget={"cost_limit": 1.0},
+        )
+        tracker = BudgetTracker(context)
+        enforcer = BudgetEnforcer(tracker)
+
+        for _ in range(10):
+            tracker.record_cost(0.1)
+
+        assert tracker.get_cost_accumulated() == 1.0
+        with pytest.raises(BudgetExhaustedError):
+            enforcer.check_budget()
+
+    def test_record_cost_tiny_costs_are_enforced(self, make_context):
+        """Test that costs far below four decimal places still count toward the limit."""
+        context = make_context(
+            initiator="user:test",
+            budget={"cost_limit": 0.001},
+        )
+        tracker = BudgetTracker(context)
+        enforcer = BudgetEnforcer(tracker)
+
+        for _ in range(24):
+            tracker.record_cost(0.00004)
+        assert enforcer.is_within_budget() is True
+
+        tracker.record_cost(0.00004)
+        assert tracker.get_cost_accumulated() == 0.001
+        assert enforcer.is_within_budget() is False
+
+    def test_record_cost_tiny_limit(self, make_context):
+        """Test that a limit below four decimal places is not exhausted up front."""
+        context = make_context(
+            initiator="user:test",
+            budget={"cost_limit": 0.00001},
+        )
+        tracker = BudgetTracker(context)
+        enforcer = BudgetEnforcer(tracker)
+
+        enforcer.check_budget()
+        tracker.record_cost(0.000004)
+        enforcer.check_budget()
+
+        tracker.record_cost(0.000006)
+        with pytest.raises(BudgetExhaustedError) as exc_info:
+            enforcer.check_budget()
+        assert exc_info.value.consumed == 0.00001
+
+    def test_record_cost_long_run_of_fractional_costs(self, make_context):
+        """Test that many fractional costs sum to the exact total."""
+        context = make_context(
+            initiator="user:test",
+            budget={"cost_limit": 700.0},
+        )
+        tracker = BudgetTracker(context)
+        enforcer = BudgetEnforcer(tracker)
+
+        for _ in range(9_999):
+            tracker.record_cost(0.07)
+        assert tracker.get_cost_accumulated() == 699.93
+        assert enforcer.is_within_budget() is True
+
+        tracker.record_cost(0.07)
+        assert tracker.get_cost_accumulated() == 700.0
+        assert enforcer.is_within_budget() is False
+
+    def test_record_cost_negative_raises_error(self, make_context):
         """Test that negative cost raises ValueError."""
-        context = create_execution_context(initiator="user:test", budget={})
+        context = make_context(initiator="user:test", budget={})
         tracker = BudgetTracker(context)
 
-        with pytest.raises(ValueError, match="Cost cannot be negative"):
+        with pytest.raises(ValueError) as exc_info:
             tracker.record_cost(-1.0)
+        assert "Cost cannot be negative" in str(exc_info.value)
 
-    def test_get_elapsed_time(self):
+    def test_get_elapsed_time(self, make_context, fake_clock):
         """Test getting elapsed time."""
-        context = create_execution_context(initiator="user:test", budget={})
+        context = make_context(initiator="user:test", budget={})
+        tracker = BudgetTracker(context)
+
+        assert tracker.get_elapsed_time() == 0.0
+
+        fake_clock.advance(0.1)
+        assert tracker.get_elapsed_time() == 0.1
+        assert tracker.get_elapsed_ns() == 100_000_000
+
+    def test_start_time_is_read_only_wall_clock_start(self, make_context, fake_clock):
+        """Test that start_time reports the wall-clock start and cannot be assigned."""
+        context = make_context(initiator="user:test", budget={})
         tracker = BudgetTracker(context)
 
-        # Elapsed time should be very small immediately after initialization
-        elapsed = tracker.get_elapsed_time()
-        assert elapsed >= 0
-        assert elapsed < 1.0  # Should be less than 1 second
+        fake_clock.advance(5.0)
+        assert tracker.start_time == 1_704_067_200
 
-        # Wait a bit and check again
-        time.sleep(0.1)
-        elapsed_after = tracker.get_elapsed_time()
-        assert elapsed_after >= elapsed
-        assert elapsed_after >= 0.1
+        with pytest.raises(AttributeError):
+            tracker.start_time = 0.0
+
+        tracker.reset()
+        assert tracker.start_time == 1_704_067_205
+
+    def test_reset(self, make_context):
+        """Test that reset clears consumption but keeps limits."""
+        context = make_context(
+            initiator="user:test",
+            budget={"call_limit": 5, "cost_limit": 10.0},
+        )
+        tracker = BudgetTracker(context)
+
+        tracker.record_call()
+        tracker.record_cost(2.5)
+        tracker.reset()
+
+        assert tracker.get_call_count() == 0
+        assert tracker.get_cost_accumulated() == 0.0
+        assert tracker.get_elapsed_time() < 1.0
+        assert tracker.call_limit == 5
+        assert tracker.cost_limit == 10.0
 
-    def test_get_budget_status(self):
+    def test_get_budget_status(self, make_context):
         """Test getting budget status."""
-        context = create_execution_context(
+        context = make_context(
             initiator="user:test",
             budget={"time_limit_seconds": 60, "call_limit": 100, "cost_limit": 10.0},
         )
@@ -109,127 +204,145 @@ class TestBudgetTracker:
 class TestBudgetEnforcer:
     """Test BudgetEnforcer."""
 
-    def test_check_budget_no_limits(self):
+    def test_check_budget_no_limits(self, make_context):
         """Test budget check with no limits."""
-        context = create_execution_context(initiator="user:test", budget={})
+        context = make_context(initiator="user:test", budget={})
         tracker = BudgetTracker(context)
         enforcer = BudgetEnforcer(tracker)
 
         # Should not raise when no limits are set
         enforcer.check_budget()
 
-    def test_check_budget_time_exhausted(self):
+    def test_check_budget_honors_limit_set_after_construction(self, make_context):
+        """Test that limits assigned after construction are still enforced."""
+        context = make_context(initiator="user:test", budget={})
+        tracker = BudgetTracker(context)
+        enforcer = BudgetEnforcer(tracker)
+
+        assert tracker.has_limits() is False
+        tracker.cost_limit = 5.0
+        tracker.record_cost(5.0)
+        assert tracker.has_limits() is True
+
+        with pytest.raises(BudgetExhaustedError):
+            enforcer.check_budget()
+
+    def test_check_budget_time_exhausted(self, make_context, fake_clock):
         """Test budget check when time limit is exhausted."""
-        context = create_execution_context(
+        context = make_context(
             initiator="user:test",
             budget={"time_limit_seconds": 0.1},
         )
         tracker = BudgetTracker(context)
         enforcer = BudgetEnforcer(tracker)
 
-        # Wait for time limit to be exceeded
-        time.sleep(0.15)
+        # Move past the time limit
+        fake_clock.advance(0.15)
 
         with pytest.raises(BudgetExhaustedError) as exc_info:
             enforcer.check_budget()
 
         assert exc_info.value.budget_type == "time"
         assert exc_info.value.limit == 0.1
-        assert exc_info.value.consumed >= 0.1
-
-    def test_check_budget_call_exhausted(self):
-        """Test budget check when call limit is exhausted."""
-        context = create_execution_context(
-            initiator="user:test",
-            budget={"call_limit": 3},
-        )
+        assert exc_info.value.consumed == 0.15
+
+    @pytest.mark.parametrize(
+        ("budget", "calls", "cost", "budget_type", "limit", "consumed"),
+        [
+            ({"call_limit": 3}, 3, 0.0, "calls", 3, 3),
+            ({"cost_limit": 10.0}, 0, 10.0, "cost", 10.0, 10.0),
+            ({"cost_limit": 10.0}, 0, 10.5, "cost", 10.0, 10.5),
+        ],
+        ids=["call_exhausted", "cost_exhausted", "cost_exceeded"],
+    )
+    def test_check_budget_exhausted(
+        self, make_context, budget, calls, cost, budget_type, limit, consumed
+    ):
+        """Test budget check when a call or cost limit is reached or exceeded."""
+        context = make_context(initiator="user:test", budget=budget)
         tracker = BudgetTracker(context)
         enforcer = BudgetEnforcer(tracker)
 
-        # Record calls up to limit
-        tracker.record_call()
-        tracker.record_call()
-        tracker.record_call()
+        for _ in range(calls):
+            tracker.record_call()
+        if cost:
+            tracker.record_cost(cost)
 
         with pytest.raises(BudgetExhaustedError) as exc_info:
             enforcer.check_budget()
 
-        assert exc_info.value.budget_type == "calls"
-        assert exc_info.value.limit == 3
-        assert exc_info.value.consumed == 3
+        assert exc_info.value.budget_type == budget_type
+        assert exc_info.value.limit == limit
+        assert exc_info.value.consumed == consumed
 
-    def test_check_budget_cost_exhausted(self):
-        """Test budget check when cost limit is exhausted."""
-        context = create_execution_context(
+    def test_check_budget_multiple_limits(self, make_context):
+        """Test budget check with multiple limits."""
+        context = make_context(
             initiator="user:test",
-            budget={"cost_limit": 10.0},
+            budget={"time_limit_seconds": 60, "call_limit": 100, "cost_limit": 10.0},
         )
         tracker = BudgetTracker(context)
         enforcer = BudgetEnforcer(tracker)
 
-        # Record cost up to limit
-        tracker.record_cost(10.0)
-
-        with pytest.raises(BudgetExhaustedError) as exc_info:
-            enforcer.check_budget()
-
-        assert exc_info.value.budget_type == "cost"
-        assert exc_info.value.limit == 10.0
-        assert exc_info.value.consumed == 10.0
+        # Should not raise when within all limits
+        tracker.record_call()
+        tracker.record_cost(5.0)
+        enforcer.check_budget()
 
-    def test_check_budget_cost_exceeded(self):
-        """Test budget check when cost limit is exceeded."""
-        context = create_execution_context(
+    def test_check_budget_time_priority(self, make_context, fake_clock):
+        """Test that time limit is checked first."""
+        context = make_context(
             initiator="user:test",
-            budget={"cost_limit": 10.0},
+            budget={"time_limit_seconds": 0.1, "call_limit": 1},
         )
         tracker = BudgetTracker(context)
         enforcer = BudgetEnforcer(tracker)
 
-        # Record cost exceeding limit
-        tracker.record_cost(10.5)
+        # Exhaust both the call and time limits
+        tracker.record_call()
+        fake_clock.advance(0.15)
 
+        # Should raise time error, not call error
         with pytest.raises(BudgetExhaustedError) as exc_info:
             enforcer.check_budget()
 
-        assert exc_info.value.budget_type == "cost"
-        assert exc_info.value.consumed == 10.5
+        assert exc_info.value.budget_type == "time"
 
-    def test_check_budget_multiple_limits(self):
-        """Test budget check with multiple limits."""
-        context = create_execution_context(
+    def test_check_budget_call_priority_over_cost(self, make_context):
+        """Test that call limit is reported before cost limit."""
+        context = make_context(
             initiator="user:test",
-            budget={"time_limit_seconds": 60, "call_limit": 100, "cost_limit": 10.0},
+            budget={"call_limit": 1, "cost_limit": 1.0},
         )
         tracker = BudgetTracker(context)
         enforcer = BudgetEnforcer(tracker)
 
-        # Should not raise when within all limits
         tracker.record_call()
-        tracker.record_cost(5.0)
-        enforcer.check_budget()
+        tracker.record_cost(2.0)
 
-    def test_check_budget_time_priority(self):
-        """Test that time limit is checked first."""
-        context = create_execution_context(
+        with pytest.raises(BudgetExhaustedError) as exc_info:
+            enforcer.check_budget()
+
+        assert exc_info.value.budget_type == "calls"
+
+    def test_is_within_budget(self, make_context):
+        """Test non-raising budget check."""
+        context = make_context(
             initiator="user:test",
-            budget={"time_limit_seconds": 0.1, "call_limit": 1},
+            budget={"call_limit": 2},
         )
         tracker = BudgetTracker(context)
         enforcer = BudgetEnforcer(tracker)
 
-        # Wait for time limit
-        time.sleep(0.15)
-
-        # Should raise time error, not call error
-        with pytest.raises(BudgetExhaustedError) as exc_info:
-            enforcer.check_budget()
+        tracker.record_call()
+        assert enforcer.is_within_budget() is True
 
-        assert exc_info.value.budget_type == "time"
+        tracker.record_call()
+        assert enforcer.is_within_budget() is False
 
-    def test_to_error(self):
+    def test_to_error(self, make_context):
         """Test converting BudgetExhaustedError to structured Error."""
-        context = create_execution_context(
+        context = make_context(
             initiator="user:test",
             budget={"call_limit": 1},
         )
@@ -248,10 +361,11 @@ class TestBudgetEnforcer:
             assert error.metadata["budget_type"] == "calls"
             assert error.metadata["limit"] == 1
             assert error.metadata["consumed"] == 1
+            assert Error.model_validate(error.model_dump()) == error
 
-    def test_budget_enforcer_uses_tracker(self):
+    def test_budget_enforcer_uses_tracker(self, make_context):
         """Test that enforcer uses the tracker."""
-        context = create_execution_context(initiator="user:test", budget={})
+        context = make_context(initiator="user:test", budget={})
         tracker = BudgetTracker(context)
         enforcer = BudgetEnforcer(tracker)
 
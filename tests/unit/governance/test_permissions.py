@@ -2,23 +2,23 @@
 
 import pytest
 
+from agent_core.contracts.errors import Error
 from agent_core.governance.permissions import PermissionError, PermissionEvaluator
-from agent_core.runtime.execution_context import create_execution_context
 
 
 class TestPermissionEvaluator:
     """Test PermissionEvaluator."""
 
-    def test_check_permissions_no_required(self):
+    def test_check_permissions_no_required(self, make_context):
         """Test that no required permissions always passes."""
-        context = create_execution_context(initiator="user:test", permissions={})
+        context = make_context(initiator="user:test", permissions={})
         evaluator = PermissionEvaluator(context)
 
         assert evaluator.check_permissions([]) is True
 
-    def test_check_permissions_boolean_flag(self):
+    def test_check_permissions_boolean_flag(self, make_context):
         """Test permission check with boolean flags."""
-        context = create_execution_context(
+        context = make_context(
             initiator="user:test",
             permissions={"read": True, "write": False},
         )
@@ -28,12 +28,13 @@ class TestPermissionEvaluator:
         assert evaluator.check_permissions(["read"]) is True
 
         # Should fail with write permission (False)
-        with pytest.raises(PermissionError, match="Missing required permissions"):
+        with pytest.raises(PermissionError) as exc_info:
             evaluator.check_permissions(["write"])
+        assert "Missing required permissions" in str(exc_info.value)
 
-    def test_check_permissions_list_format(self):
+    def test_check_permissions_list_format(self, make_context):
         """Test permissions in list format."""
-        context = create_execution_context(
+        context = make_context(
             initiator="user:test",
             permissions={"permissions": ["read", "write", "execute"]},
         )
@@ -45,9 +46,9 @@ class TestPermissionEvaluator:
         with pytest.raises(PermissionError):
             evaluator.check_permissions(["delete"])
 
-    def test_check_permissions_nested_structure(self):
+    def test_check_permissions_nested_structure(self, make_context):
         """Test permissions in nested structure."""
-        context = create_execution_context(
+        context = make_context(
             initiator="user:test",
             permissions={"tools": {"tool1": True, "tool2": False}},
         )
@@ -64,9 +65,22 @@ class TestPermissionEvaluator:
         with pytest.raises(PermissionError):
             evaluator.check_permissions(["tool3"])
 
-    def test_check_permissions_multiple_required(self):
+    def test_check_permissions_top_level_flag_overrides_list(self, make_context):
+        """Test that a top-level False flag wins over the permissions list."""
+        context = make_context(
+            initiator="user:test",
+            permissions={"permissions": ["read", "write"], "write": False},
+        )
+        evaluator = PermissionEvaluator(context)
+
+        assert evaluator.check_permissions(["read"]) is True
+
+        with pytest.raises(PermissionError):
+            evaluator.check_permissions(["write"])
+
+    def test_check_permissions_multiple_required(self, make_context):
         """Test checking multiple required permissions."""
-        context = create_execution_context(
+        context = make_context(
             initiator="user:test",
             permissions={"read": True, "write": True, "execute": False},
         )
@@ -74,12 +88,13 @@ class TestPermissionEvaluator:
 
         assert evaluator.check_permissions(["read", "write"]) is True
 
-        with pytest.raises(PermissionError, match="Missing required permissions"):
+        with pytest.raises(PermissionError) as exc_info:
             evaluator.check_permissions(["read", "execute"])
+        assert "Missing required permissions" in str(exc_info.value)
 
-    def test_check_permissions_missing_all(self):
+    def test_check_permissions_missing_all(self, make_context):
         """Test when all required permissions are missing."""
-        context = create_execution_context(
+        context = make_context(
             initiator="user:test",
             permissions={"read": True},
         )
@@ -91,9 +106,9 @@ class TestPermissionEvaluator:
         assert "write" in exc_info.value.required_permissions
         assert "delete" in exc_info.value.required_permissions
 
-    def test_check_permissions_with_resource_info(self):
+    def test_check_permissions_with_resource_info(self, make_context):
         """Test permission check with resource information."""
-        context = create_execution_context(
+        context = make_context(
             initiator="user:test",
             permissions={"read": True},
         )
@@ -104,9 +119,9 @@ class TestPermissionEvaluator:
             evaluator.check_permissions(["read"], resource_id="tool1", resource_type="tool") is True
         )
 
-    def test_to_error(self):
+    def test_to_error(self, make_context):
         """Test converting PermissionError to structured Error."""
-        context = create_execution_context(initiator="user:test", permissions={})
+        context = make_context(initiator="user:test", permissions={})
         evaluator = PermissionEvaluator(context)
 
         try:
@@ -117,10 +132,11 @@ class TestPermissionEvaluator:
             assert error.severity.value == "high"
             assert error.retryable is False
             assert "write" in error.metadata["required_permissions"]
+            assert Error.model_validate(error.model_dump()) == error
 
-    def test_permission_evaluator_uses_context(self):
+    def test_permission_evaluator_uses_context(self, make_context):
         """Test that evaluator uses execution context."""
-        context = create_execution_context(
+        context = make_context(
             initiator="user:test",
             permissions={"read": True},
         )
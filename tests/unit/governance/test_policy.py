@@ -4,56 +4,41 @@ import pytest
 
 from agent_core.configuration.schemas import GovernanceConfig
 from agent_core.governance.policy import PolicyEngine, PolicyError, PolicyOutcome
-from agent_core.runtime.execution_context import create_execution_context
 
 
 class TestPolicyEngine:
     """Test PolicyEngine."""
 
-    def test_evaluate_policy_no_config_defaults_to_allow(self):
+    def test_evaluate_policy_no_config_defaults_to_allow(self, make_context):
         """Test that no policy config defaults to ALLOW."""
-        context = create_execution_context(initiator="user:test")
+        context = make_context(initiator="user:test")
         engine = PolicyEngine(context)
 
         outcome = engine.evaluate_policy("tool.execute", resource_id="tool1", resource_type="tool")
         assert outcome == PolicyOutcome.ALLOW
 
-    def test_evaluate_policy_exact_match_allow(self):
-        """Test policy evaluation with exact action match - ALLOW."""
-        context = create_execution_context(initiator="user:test")
+    @pytest.mark.parametrize(
+        ("outcome_str", "expected"),
+        [
+            ("allow", PolicyOutcome.ALLOW),
+            ("deny", PolicyOutcome.DENY),
+            ("require_approval", PolicyOutcome.REQUIRE_APPROVAL),
+        ],
+    )
+    def test_evaluate_policy_exact_match(self, make_context, outcome_str, expected):
+        """Test policy evaluation with exact action match for each outcome."""
+        context = make_context(initiator="user:test")
         governance_config = GovernanceConfig(
-            policies={"tool.execute": {"outcome": "allow"}},
+            policies={"tool.execute": {"outcome": outcome_str}},
         )
         engine = PolicyEngine(context, governance_config)
 
         outcome = engine.evaluate_policy("tool.execute", resource_id="tool1", resource_type="tool")
-        assert outcome == PolicyOutcome.ALLOW
-
-    def test_evaluate_policy_exact_match_deny(self):
-        """Test policy evaluation with exact action match - DENY."""
-        context = create_execution_context(initiator="user:test")
-        governance_config = GovernanceConfig(
-            policies={"tool.execute": {"outcome": "deny"}},
-        )
-        engine = PolicyEngine(context, governance_config)
-
-        outcome = engine.evaluate_policy("tool.execute", resource_id="tool1", resource_type="tool")
-        assert outcome == PolicyOutcome.DENY
-
-    def test_evaluate_policy_exact_match_require_approval(self):
-        """Test policy evaluation with exact action match - REQUIRE_APPROVAL."""
-        context = create_execution_context(initiator="user:test")
-        governance_config = GovernanceConfig(
-            policies={"tool.execute": {"outcome": "require_approval"}},
-        )
-        engine = PolicyEngine(context, governance_config)
+        assert outcome == expected
 
-        outcome = engine.evaluate_policy("tool.execute", resource_id="tool1", resource_type="tool")
-        assert outcome == PolicyOutcome.REQUIRE_APPROVAL
-
-    def test_evaluate_policy_pattern_match(self):
+    def test_evaluate_policy_pattern_match(self, make_context):
         """Test policy evaluation with pattern matching."""
-        context = create_execution_context(initiator="user:test")
+        context = make_context(initiator="user:test")
         governance_config = GovernanceConfig(
             policies={"tool.*": {"outcome": "deny"}},
         )
@@ -66,9 +51,24 @@ class TestPolicyEngine:
         outcome = engine.evaluate_policy("tool.read", resource_id="tool2", resource_type="tool")
         assert outcome == PolicyOutcome.DENY
 
-    def test_evaluate_policy_no_match_defaults_to_allow(self):
+    def test_evaluate_policy_exact_match_precedes_pattern(self, make_context):
+        """Test that an exact policy wins over an earlier wildcard pattern."""
+        context = make_context(initiator="user:test")
+        governance_config = GovernanceConfig(
+            policies={
+                "tool.*": {"outcome": "deny"},
+                "tool.read": {"outcome": "allow"},
+            },
+        )
+        engine = PolicyEngine(context, governance_config)
+
+        assert engine.evaluate_policy("tool.read") == PolicyOutcome.ALLOW
+        assert engine.evaluate_policy("tool.write") == PolicyOutcome.DENY
+        assert engine.evaluate_policy("toolbox.read") == PolicyOutcome.ALLOW
+
+    def test_evaluate_policy_no_match_defaults_to_allow(self, make_context):
         """Test that no matching policy defaults to ALLOW."""
-        context = create_execution_context(initiator="user:test")
+        context = make_context(initiator="user:test")
         governance_config = GovernanceConfig(
             policies={"service.read": {"outcome": "deny"}},
         )
@@ -78,20 +78,32 @@ class TestPolicyEngine:
         outcome = engine.evaluate_policy("tool.execute", resource_id="tool1", resource_type="tool")
         assert outcome == PolicyOutcome.ALLOW
 
-    def test_evaluate_policy_invalid_outcome_raises_error(self):
+    def test_evaluate_policy_invalid_outcome_raises_error(self, make_context):
         """Test that invalid policy outcome raises PolicyError."""
-        context = create_execution_context(initiator="user:test")
+        context = make_context(initiator="user:test")
         governance_config = GovernanceConfig(
             policies={"tool.execute": {"outcome": "invalid"}},
         )
         engine = PolicyEngine(context, governance_config)
 
-        with pytest.raises(PolicyError, match="Invalid policy outcome"):
+        with pytest.raises(PolicyError) as exc_info:
             engine.evaluate_policy("tool.execute", resource_id="tool1", resource_type="tool")
+        assert "Invalid policy outcome" in str(exc_info.value)
+
+    def test_evaluate_policy_unhashable_outcome_raises_error(self, make_context):
+        """Test that a non-string policy outcome raises PolicyError."""
+        context = make_context(initiator="user:test")
+        governance_config = GovernanceConfig(
+            policies={"tool.execute": {"outcome": ["deny"]}},
+        )
+        engine = PolicyEngine(context, governance_config)
+
+        with pytest.raises(PolicyError):
+            engine.evaluate_policy("tool.execute")
 
-    def test_evaluate_policy_no_outcome_defaults_to_allow(self):
+    def test_evaluate_policy_no_outcome_defaults_to_allow(self, make_context):
         """Test that policy config without outcome defaults to ALLOW."""
-        context = create_execution_context(initiator="user:test")
+        context = make_context(initiator="user:test")
         governance_config = GovernanceConfig(
             policies={"tool.execute": {}},
         )
@@ -100,9 +112,9 @@ class TestPolicyEngine:
         outcome = engine.evaluate_policy("tool.execute", resource_id="tool1", resource_type="tool")
         assert outcome == PolicyOutcome.ALLOW
 
-    def test_requires_approval(self):
+    def test_requires_approval(self, make_context):
         """Test requires_approval convenience method."""
-        context = create_execution_context(initiator="user:test")
+        context = make_context(initiator="user:test")
         governance_config = GovernanceConfig(
             policies={"tool.execute": {"outcome": "require_approval"}},
         )
@@ -117,9 +129,9 @@ class TestPolicyEngine:
             is False
         )
 
-    def test_is_allowed(self):
+    def test_is_allowed(self, make_context):
         """Test is_allowed convenience method."""
-        context = create_execution_context(initiator="user:test")
+        context = make_context(initiator="user:test")
         governance_config = GovernanceConfig(
             policies={
                 "tool.execute": {"outcome": "allow"},
@@ -134,16 +146,16 @@ class TestPolicyEngine:
             engine.is_allowed("tool.read", resource_id="tool3", resource_type="tool") is True
         )  # No policy, defaults to allow
 
-    def test_policy_engine_uses_context(self):
+    def test_policy_engine_uses_context(self, make_context):
         """Test that engine uses execution context."""
-        context = create_execution_context(initiator="user:test")
+        context = make_context(initiator="user:test")
         engine = PolicyEngine(context)
 
         assert engine.context == context
 
-    def test_policy_engine_uses_governance_config(self):
+    def test_policy_engine_uses_governance_config(self, make_context):
         """Test that engine uses governance configuration."""
-        context = create_execution_context(initiator="user:test")
+        context = make_context(initiator="user:test")
         governance_config = GovernanceConfig(
             policies={"tool.execute": {"outcome": "deny"}},
         )
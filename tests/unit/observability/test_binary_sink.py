@@ -0,0 +1,105 @@
+"""Unit tests for BinaryObservabilitySink."""
+
+from datetime import datetime, timezone
+from io import BytesIO
+
+import pytest
+
+from agent_core.contracts.observability import (
+    AuditEvent,
+    ComponentType,
+    CorrelationFields,
+    LogEvent,
+    LogLevel,
+    MetricValue,
+    SpanAttributes,
+    TraceSpan,
+)
+from agent_core.observability import binary
+from agent_core.observability.binary import BinaryObservabilitySink
+from agent_core.utils.ids import generate_correlation_id, generate_run_id
+
+msgpack = pytest.importorskip("msgpack")
+
+
+@pytest.fixture
+def correlation():
+    """Correlation fields shared by the emitted events."""
+    return CorrelationFields(
+        run_id=generate_run_id(),
+        correlation_id=generate_correlation_id(),
+        component_type=ComponentType.TOOL,
+        component_id="tool:test_tool",
+        component_version="1.0.0",
+        timestamp="2024-01-01T00:00:00Z",
+    )
+
+
+class TestBinaryObservabilitySink:
+    """Test BinaryObservabilitySink implementation."""
+
+    def test_emits_all_signals_as_msgpack_frames(self, correlation):
+        """Test that every signal type is written as a decodable frame."""
+        stream = BytesIO()
+        sink = BinaryObservabilitySink(stream)
+
+        sink.emit_log(LogEvent(correlation=correlation, level=LogLevel.INFO, message="hello"))
+        sink.emit_trace(
+            TraceSpan(
+                correlation=correlation,
+                span_name="tool.invoke",
+                attributes=SpanAttributes(execution_status="success", duration_ms=1.5),
+            )
+        )
+        sink.emit_metric(
+            MetricValue(
+                correlation=correlation,
+                metric_name="tool.invoke.count",
+                metric_type="counter",
+                value=1.0,
+                labels={"status": "success"},
+            )
+        )
+        sink.emit_audit(
+            AuditEvent(
+                correlation=correlation,
+                initiator_identity="user:test",
+                action="tool.execute",
+                target_resource="tool:test_tool",
+                decision_outcome="allowed",
+            )
+        )
+
+        frames = list(msgpack.Unpacker(BytesIO(stream.getvalue()), raw=False))
+
+        assert [frame["signal"] for frame in frames] == ["log", "trace", "metric", "audit"]
+        assert frames[0]["event"]["level"] == "INFO"
+        assert frames[0]["event"]["correlation"] == correlation.model_dump(mode="json")
+        assert frames[1]["event"]["attributes"]["duration_ms"] == 1.5
+        assert frames[2]["event"]["labels"] == {"status": "success"}
+        assert AuditEvent.model_validate(frames[3]["event"]).action == "tool.execute"
+
+    def test_encodes_unsupported_metadata_as_strings(self, correlation):
+        """Test that values msgpack cannot encode are written as strings."""
+        stream = BytesIO()
+        sink = BinaryObservabilitySink(stream)
+        when = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+        sink.emit_log(
+            LogEvent(
+                correlation=correlation,
+                level=LogLevel.INFO,
+                message="hello",
+                metadata={"when": when},
+            )
+        )
+
+        frame = msgpack.unpackb(stream.getvalue(), raw=False)
+        assert frame["event"]["metadata"]["when"] == str(when)
+
+    def test_requires_msgpack(self, monkeypatch):
+        """Test that construction fails clearly when msgpack is missing."""
+        monkeypatch.setattr(binary, "MSGPACK_AVAILABLE", False)
+
+        with pytest.raises(ImportError, match="msgpack is not available"):
+            BinaryObservabilitySink(BytesIO())
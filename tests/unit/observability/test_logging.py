@@ -2,20 +2,33 @@
 
 import json
 import logging
+from datetime import datetime, timezone
+from enum import Enum
 from io import StringIO
+from logging.handlers import QueueHandler
+
+import pytest
 
 from agent_core.contracts.observability import (
     ComponentType,
     CorrelationFields,
 )
+from agent_core.observability import logging as logging_module
 from agent_core.observability.logging import (
     CorrelationJSONFormatter,
     CorrelationLoggerAdapter,
     get_logger,
+    stop_log_listeners,
 )
 from agent_core.utils.ids import generate_correlation_id, generate_run_id
 
 
+class Color(Enum):
+    """Plain (non-str) enum used as log metadata."""
+
+    RED = 1
+
+
 class TestCorrelationJSONFormatter:
     """Test CorrelationJSONFormatter."""
 
@@ -70,6 +83,7 @@ class TestCorrelationJSONFormatter:
             (logging.WARNING, "WARN"),
             (logging.ERROR, "ERROR"),
             (logging.CRITICAL, "ERROR"),
+            (25, "INFO"),
         ]:
             record = logging.LogRecord(
                 name="test",
@@ -119,6 +133,25 @@ class TestCorrelationJSONFormatter:
 
         assert data["message"] == "Test log message"
 
+    def test_formatter_formats_message_args(self):
+        """Test that messages with args and non-string messages are rendered."""
+        formatter = CorrelationJSONFormatter()
+
+        record = logging.LogRecord(
+            name="test",
+            level=logging.INFO,
+            pathname="test.py",
+            lineno=1,
+            msg="Processed %d items",
+            args=(3,),
+            exc_info=None,
+        )
+        assert json.loads(formatter.format(record))["message"] == "Processed 3 items"
+
+        record.msg = ValueError("boom")
+        record.args = ()
+        assert json.loads(formatter.format(record))["message"] == "boom"
+
     def test_formatter_includes_metadata(self):
         """Test that formatter includes metadata from extra fields."""
         formatter = CorrelationJSONFormatter()
@@ -149,6 +182,112 @@ class TestCorrelationJSONFormatter:
         assert "metadata" in data
         assert data["metadata"]["custom_field"] == "custom_value"
         assert data["metadata"]["another_field"] == 42
+        assert list(data["metadata"]) == ["custom_field", "another_field"]
+
+    def test_formatter_accepts_string_component_type(self):
+        """Test that plain-string component types serialize like enum members."""
+        formatter = CorrelationJSONFormatter()
+
+        record = logging.LogRecord(
+            name="test",
+            level=logging.INFO,
+            pathname="test.py",
+            lineno=1,
+            msg="Test message",
+            args=(),
+            exc_info=None,
+        )
+        record.component_type = "service"
+
+        data = json.loads(formatter.format(record))
+
+        assert data["correlation"]["component_type"] == "service"
+
+    def test_formatter_serializes_non_json_metadata(self):
+        """Test that non-JSON metadata values are stringified consistently."""
+        formatter = CorrelationJSONFormatter()
+        when = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+        record = logging.LogRecord(
+            name="test",
+            level=logging.INFO,
+            pathname="test.py",
+            lineno=1,
+            msg="Test message",
+            args=(),
+            exc_info=None,
+        )
+        record.when = when
+        record.huge = 2**70
+        record.counts = {1: "one"}
+
+        data = json.loads(formatter.format(record))
+
+        assert data["metadata"]["when"] == str(when)
+        assert data["metadata"]["huge"] == 2**70
+        assert data["metadata"]["counts"] == {"1": "one"}
+
+    def test_formatter_output_matches_without_orjson(self, monkeypatch):
+        """Test that the stdlib json fallback produces identical output."""
+        formatter = CorrelationJSONFormatter()
+
+        record = logging.LogRecord(
+            name="test",
+            level=logging.INFO,
+            pathname="test.py",
+            lineno=1,
+            msg="Test message",
+            args=(),
+            exc_info=None,
+        )
+        record.timestamp = "2024-01-01T00:00:00Z"
+        record.when = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        record.items = [1, 2]
+
+        default_output = formatter.format(record)
+        monkeypatch.setattr(logging_module, "ORJSON_AVAILABLE", False)
+
+        assert formatter.format(record) == default_output
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            (Color.RED, "1"),
+            ({"color": Color.RED}, '{"color":1}'),
+            (float("nan"), "null"),
+            ([float("inf"), float("-inf")], "[null,null]"),
+            (1e16, "1e16"),
+            (1.5e-7, "1.5e-7"),
+            (2.5e-5, "0.000025"),
+            (1e15, "1000000000000000.0"),
+            (0.1, "0.1"),
+            (-0.0, "-0.0"),
+            ("café", '"café"'),
+        ],
+        ids=[
+            "enum",
+            "nested_enum",
+            "nan",
+            "infinities",
+            "large_exponent",
+            "small_exponent",
+            "small_positional",
+            "large_positional",
+            "plain_float",
+            "negative_zero",
+            "non_ascii",
+        ],
+    )
+    def test_dumps_orjson_and_stdlib_paths_match(self, monkeypatch, value, expected):
+        """Test that orjson and the stdlib fallback serialize values identically."""
+        pytest.importorskip("orjson")
+        payload = {"value": value}
+
+        orjson_output = logging_module._dumps(payload)
+        monkeypatch.setattr(logging_module, "ORJSON_AVAILABLE", False)
+        stdlib_output = logging_module._dumps(payload)
+
+        assert orjson_output == stdlib_output == f'{{"value":{expected}}}'
 
     def test_formatter_applies_redaction_hook(self):
         """Test that formatter applies redaction hook to metadata."""
@@ -257,6 +396,81 @@ class TestCorrelationLoggerAdapter:
         assert data["correlation"]["correlation_id"] == correlation_id
         assert data["correlation"]["component_type"] == "tool"
         assert data["correlation"]["component_id"] == "tool:test_tool"
+        assert data["correlation"]["component_version"] == "1.0.0"
+        assert data["correlation"]["timestamp"] == "2024-01-01T00:00:00Z"
+        assert data["metadata"] == {}
+
+    def test_adapter_skips_filtered_records_and_keeps_caller_extra(self):
+        """Test that filtered records skip processing and extra is not mutated."""
+        logger = logging.getLogger("test_adapter_filtered")
+        logger.setLevel(logging.INFO)
+
+        adapter = CorrelationLoggerAdapter(
+            logger,
+            {
+                "run_id": generate_run_id(),
+                "correlation_id": generate_correlation_id(),
+                "component_type": ComponentType.TOOL,
+                "component_id": "tool:test_tool",
+                "component_version": "1.0.0",
+                "timestamp": "2024-01-01T00:00:00Z",
+            },
+        )
+
+        processed = []
+        original_process = adapter.process
+
+        def tracking_process(msg, kwargs):
+            processed.append(msg)
+            return original_process(msg, kwargs)
+
+        adapter.process = tracking_process
+
+        extra = {"custom_field": "value"}
+        adapter.debug("Filtered message", extra=extra)
+        adapter.info("Emitted message", extra=extra)
+
+        assert processed == ["Emitted message"]
+        assert extra == {"custom_field": "value"}
+
+    def test_adapter_correlation_block_is_private(self):
+        """Test that other handlers and plain formatters do not see the cached block."""
+        logger = logging.getLogger("test_adapter_private_block")
+        logger.setLevel(logging.INFO)
+
+        adapter = CorrelationLoggerAdapter(
+            logger,
+            {
+                "run_id": generate_run_id(),
+                "correlation_id": generate_correlation_id(),
+                "component_type": ComponentType.TOOL,
+                "component_id": "tool:test_tool",
+                "component_version": "1.0.0",
+                "timestamp": "2024-01-01T00:00:00Z",
+            },
+        )
+
+        records = []
+
+        class RecordingHandler(logging.Handler):
+            def emit(self, record):
+                records.append(record)
+
+        stream = StringIO()
+        plain_handler = logging.StreamHandler(stream)
+        plain_handler.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+        logger.addHandler(plain_handler)
+        logger.addHandler(RecordingHandler())
+
+        adapter.info("Test message")
+
+        assert stream.getvalue() == "INFO Test message\n"
+        # "message" is set on the record by Formatter.format
+        standard = set(vars(logging.makeLogRecord({}))) | {"message"}
+        public_extras = {
+            key for key in vars(records[0]) if key not in standard and not key.startswith("_")
+        }
+        assert public_extras == set(logging_module._CORRELATION_KEYS)
 
 
 class TestGetLogger:
@@ -354,3 +568,53 @@ class TestGetLogger:
 
         assert data["metadata"]["secret_key"] == "[REDACTED]"
         assert data["metadata"]["public_field"] == "public_value"
+
+    def test_get_logger_redacts_each_record_once(self, capsys):
+        """Test that the redaction hook runs once per record, in the formatter."""
+        calls = []
+
+        def redact(metadata: dict) -> dict:
+            """Count calls and redact sensitive data."""
+            calls.append(dict(metadata))
+            metadata["secret_key"] = "[REDACTED]"
+            return metadata
+
+        correlation = CorrelationFields(
+            run_id=generate_run_id(),
+            correlation_id=generate_correlation_id(),
+            component_type=ComponentType.RUNTIME,
+            component_id="runtime:test",
+            component_version="1.0.0",
+            timestamp="2024-01-01T00:00:00Z",
+        )
+
+        logger = get_logger("test_redact_once_logger", correlation, redaction_hook=redact)
+
+        logger.info("Test message", extra={"secret_key": "value123"})
+
+        data = json.loads(capsys.readouterr().err)
+        assert data["metadata"]["secret_key"] == "[REDACTED]"
+        assert calls == [{"secret_key": "value123"}]
+
+    def test_get_logger_async_handler_writes_after_stop(self, capsys):
+        """Test that async loggers flush queued records when listeners stop."""
+        correlation = CorrelationFields(
+            run_id=generate_run_id(),
+            correlation_id=generate_correlation_id(),
+            component_type=ComponentType.RUNTIME,
+            component_id="runtime:test",
+            component_version="1.0.0",
+            timestamp="2024-01-01T00:00:00Z",
+        )
+
+        logger = get_logger("test_async_logger", correlation, async_handler=True)
+        assert isinstance(logger.logger.handlers[0], QueueHandler)
+
+        logger.info("Queued message", extra={"custom_field": "value"})
+        stop_log_listeners()
+
+        data = json.loads(capsys.readouterr().err)
+        assert data["message"] == "Queued message"
+        assert data["metadata"]["custom_field"] == "value"
+        assert data["correlation"]["component_id"] == "runtime:test"
+        assert logger.logger.handlers == []
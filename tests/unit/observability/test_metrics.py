@@ -24,6 +24,53 @@ def meter_provider():
     # Cleanup is handled by OpenTelemetry
 
 
+@pytest.fixture
+def make_correlation():
+    """Return a factory for correlation fields with fresh identifiers."""
+
+    def _make(
+        component_type: ComponentType = ComponentType.RUNTIME,
+        component_id: str = "runtime:test",
+    ) -> CorrelationFields:
+        return CorrelationFields(
+            run_id=generate_run_id(),
+            correlation_id=generate_correlation_id(),
+            component_type=component_type,
+            component_id=component_id,
+            component_version="1.0.0",
+            timestamp="2024-01-01T00:00:00Z",
+        )
+
+    return _make
+
+
+class RecordingInstrument:
+    """Instrument that records add()/record() calls on its meter."""
+
+    def __init__(self, meter, name):
+        self.meter = meter
+        self.name = name
+
+    def add(self, amount, attributes=None):
+        self.meter.recorded.append((self.name, amount, attributes))
+
+    record = add
+
+
+class RecordingMeter:
+    """Meter that records instrument creation and every recorded value."""
+
+    def __init__(self):
+        self.created = []
+        self.recorded = []
+
+    def create_counter(self, name):
+        self.created.append(name)
+        return RecordingInstrument(self, name)
+
+    create_histogram = create_up_down_counter = create_counter
+
+
 class TestMetricsHelper:
     """Test MetricsHelper implementation."""
 
@@ -31,23 +78,13 @@ class TestMetricsHelper:
         """Set up test fixtures."""
         pass
 
-    def test_emit_counter_metric(self, meter_provider):
+    def test_emit_counter_metric(self, meter_provider, make_correlation):
         """Test that counter metrics can be emitted."""
         provider, reader = meter_provider
         meter = metrics.get_meter(__name__)
         helper = MetricsHelper(meter=meter)
 
-        run_id = generate_run_id()
-        correlation_id = generate_correlation_id()
-
-        correlation = CorrelationFields(
-            run_id=run_id,
-            correlation_id=correlation_id,
-            component_type=ComponentType.RUNTIME,
-            component_id="runtime:test",
-            component_version="1.0.0",
-            timestamp="2024-01-01T00:00:00Z",
-        )
+        correlation = make_correlation()
 
         helper.emit_metric(
             "execution.count",
@@ -64,23 +101,13 @@ class TestMetricsHelper:
         # Note: InMemoryMetricReader doesn't provide direct access to metrics
         # but the emission should not raise errors
 
-    def test_emit_histogram_metric(self, meter_provider):
+    def test_emit_histogram_metric(self, meter_provider, make_correlation):
         """Test that histogram metrics can be emitted."""
         provider, reader = meter_provider
         meter = metrics.get_meter(__name__)
         helper = MetricsHelper(meter=meter)
 
-        run_id = generate_run_id()
-        correlation_id = generate_correlation_id()
-
-        correlation = CorrelationFields(
-            run_id=run_id,
-            correlation_id=correlation_id,
-            component_type=ComponentType.AGENT,
-            component_id="agent:test_agent",
-            component_version="1.0.0",
-            timestamp="2024-01-01T00:00:00Z",
-        )
+        correlation = make_correlation(ComponentType.AGENT, "agent:test_agent")
 
         helper.emit_metric(
             "latency.histogram",
@@ -92,23 +119,13 @@ class TestMetricsHelper:
 
         provider.force_flush()
 
-    def test_emit_gauge_metric(self, meter_provider):
+    def test_emit_gauge_metric(self, meter_provider, make_correlation):
         """Test that gauge metrics can be emitted."""
         provider, reader = meter_provider
         meter = metrics.get_meter(__name__)
         helper = MetricsHelper(meter=meter)
 
-        run_id = generate_run_id()
-        correlation_id = generate_correlation_id()
-
-        correlation = CorrelationFields(
-            run_id=run_id,
-            correlation_id=correlation_id,
-            component_type=ComponentType.TOOL,
-            component_id="tool:test_tool",
-            component_version="1.0.0",
-            timestamp="2024-01-01T00:00:00Z",
-        )
+        correlation = make_correlation(ComponentType.TOOL, "tool:test_tool")
 
         helper.emit_metric(
             "budget.remaining",
@@ -120,23 +137,13 @@ class TestMetricsHelper:
 
         provider.force_flush()
 
-    def test_emit_metric_rejects_run_id_in_labels(self, meter_provider):
+    def test_emit_metric_rejects_run_id_in_labels(self, meter_provider, make_correlation):
         """Test that emit_metric rejects run_id as a label."""
         provider, reader = meter_provider
         meter = metrics.get_meter(__name__)
         helper = MetricsHelper(meter=meter)
 
-        run_id = generate_run_id()
-        correlation_id = generate_correlation_id()
-
-        correlation = CorrelationFields(
-            run_id=run_id,
-            correlation_id=correlation_id,
-            component_type=ComponentType.RUNTIME,
-            component_id="runtime:test",
-            component_version="1.0.0",
-            timestamp="2024-01-01T00:00:00Z",
-        )
+        correlation = make_correlation()
 
         with pytest.raises(ValueError, match="High-cardinality identifiers"):
             helper.emit_metric(
@@ -144,26 +151,16 @@ class TestMetricsHelper:
                 "counter",
                 1.0,
                 correlation,
-                labels={"run_id": run_id},
+                labels={"run_id": correlation.run_id},
             )
 
-    def test_emit_metric_rejects_correlation_id_in_labels(self, meter_provider):
+    def test_emit_metric_rejects_correlation_id_in_labels(self, meter_provider, make_correlation):
         """Test that emit_metric rejects correlation_id as a label."""
         provider, reader = meter_provider
         meter = metrics.get_meter(__name__)
         helper = MetricsHelper(meter=meter)
 
-        run_id = generate_run_id()
-        correlation_id = generate_correlation_id()
-
-        correlation = CorrelationFields(
-            run_id=run_id,
-            correlation_id=correlation_id,
-            component_type=ComponentType.RUNTIME,
-            component_id="runtime:test",
-            component_version="1.0.0",
-            timestamp="2024-01-01T00:00:00Z",
-        )
+        correlation = make_correlation()
 
         with pytest.raises(ValueError, match="High-cardinality identifiers"):
             helper.emit_metric(
@@ -171,26 +168,16 @@ class TestMetricsHelper:
                 "counter",
                 1.0,
                 correlation,
-                labels={"correlation_id": correlation_id},
+                labels={"correlation_id": correlation.correlation_id},
             )
 
-    def test_emit_metric_rejects_invalid_metric_type(self, meter_provider):
+    def test_emit_metric_rejects_invalid_metric_type(self, meter_provider, make_correlation):
         """Test that emit_metric rejects invalid metric types."""
         provider, reader = meter_provider
         meter = metrics.get_meter(__name__)
         helper = MetricsHelper(meter=meter)
 
-        run_id = generate_run_id()
-        correlation_id = generate_correlation_id()
-
-        correlation = CorrelationFields(
-            run_id=run_id,
-            correlation_id=correlation_id,
-            component_type=ComponentType.RUNTIME,
-            component_id="runtime:test",
-            component_version="1.0.0",
-            timestamp="2024-01-01T00:00:00Z",
-        )
+        correlation = make_correlation()
 
         with pytest.raises(ValueError, match="Invalid metric_type"):
             helper.emit_metric(
@@ -200,23 +187,13 @@ class TestMetricsHelper:
                 correlation,
             )
 
-    def test_to_metric_value_creates_contract(self, meter_provider):
+    def test_to_metric_value_creates_contract(self, meter_provider, make_correlation):
         """Test that to_metric_value creates MetricValue contract."""
         provider, reader = meter_provider
         meter = metrics.get_meter(__name__)
         helper = MetricsHelper(meter=meter)
 
-        run_id = generate_run_id()
-        correlation_id = generate_correlation_id()
-
-        correlation = CorrelationFields(
-            run_id=run_id,
-            correlation_id=correlation_id,
-            component_type=ComponentType.SERVICE,
-            component_id="service:test_service",
-            component_version="1.0.0",
-            timestamp="2024-01-01T00:00:00Z",
-        )
+        correlation = make_correlation(ComponentType.SERVICE, "service:test_service")
 
         metric_value = helper.to_metric_value(
             "service.access.count",
@@ -230,25 +207,29 @@ class TestMetricsHelper:
         assert metric_value.metric_type == "counter"
         assert metric_value.value == 1.0
         assert metric_value.labels == {"service_type": "database"}
-        assert metric_value.correlation.run_id == run_id
+        assert metric_value.correlation == correlation
+
+    def test_to_metric_value_labels_are_independent(self, meter_provider, make_correlation):
+        """Test that MetricValue labels do not alias the caller's dict."""
+        helper = MetricsHelper(meter=metrics.get_meter(__name__))
+        correlation = make_correlation()
+
+        labels = {"status": "success"}
+        metric_value = helper.to_metric_value("test.metric", "counter", 1.0, correlation, labels)
+        labels["status"] = "failure"
+        assert metric_value.labels == {"status": "success"}
+
+        unlabelled = helper.to_metric_value("test.metric", "counter", 1.0, correlation)
+        assert unlabelled.labels == {}
+        assert isinstance(unlabelled.labels, dict)
 
-    def test_to_metric_value_rejects_run_id_in_labels(self, meter_provider):
+    def test_to_metric_value_rejects_run_id_in_labels(self, meter_provider, make_correlation):
         """Test that to_metric_value rejects run_id as a label."""
         provider, reader = meter_provider
         meter = metrics.get_meter(__name__)
         helper = MetricsHelper(meter=meter)
 
-        run_id = generate_run_id()
-        correlation_id = generate_correlation_id()
-
-        correlation = CorrelationFields(
-            run_id=run_id,
-            correlation_id=correlation_id,
-            component_type=ComponentType.RUNTIME,
-            component_id="runtime:test",
-            component_version="1.0.0",
-            timestamp="2024-01-01T00:00:00Z",
-        )
+        correlation = make_correlation()
 
         with pytest.raises(ValueError, match="High-cardinality identifiers"):
             helper.to_metric_value(
@@ -256,7 +237,7 @@ class TestMetricsHelper:
                 "counter",
                 1.0,
                 correlation,
-                labels={"run_id": run_id},
+                labels={"run_id": correlation.run_id},
             )
 
     def test_get_metrics_helper_returns_helper(self, meter_provider):
@@ -267,23 +248,13 @@ class TestMetricsHelper:
 
         assert isinstance(helper, MetricsHelper)
 
-    def test_metrics_helper_allows_valid_labels(self, meter_provider):
+    def test_metrics_helper_allows_valid_labels(self, meter_provider, make_correlation):
         """Test that metrics helper allows valid low-cardinality labels."""
         provider, reader = meter_provider
         meter = metrics.get_meter(__name__)
         helper = MetricsHelper(meter=meter)
 
-        run_id = generate_run_id()
-        correlation_id = generate_correlation_id()
-
-        correlation = CorrelationFields(
-            run_id=run_id,
-            correlation_id=correlation_id,
-            component_type=ComponentType.FLOW,
-            component_id="flow:test_flow",
-            component_version="1.0.0",
-            timestamp="2024-01-01T00:00:00Z",
-        )
+        correlation = make_correlation(ComponentType.FLOW, "flow:test_flow")
 
         # Valid labels should not raise errors
         helper.emit_metric(
@@ -299,3 +270,79 @@ class TestMetricsHelper:
         )
 
         provider.force_flush()
+
+    def test_emit_metric_reuses_instrument(self, make_correlation):
+        """Test that instruments are created once per metric name and type."""
+        meter = RecordingMeter()
+        helper = MetricsHelper(meter=meter)
+        correlation = make_correlation()
+
+        helper.emit_metric("runtime.calls", "counter", 1.0, correlation)
+        helper.emit_metric("runtime.calls", "counter", 2.0, correlation)
+
+        assert meter.created == ["runtime.calls"]
+
+    def test_emit_metric_without_labels_passes_no_attributes(self, make_correlation):
+        """Test that labelless metrics are recorded with attributes=None."""
+        meter = RecordingMeter()
+        helper = MetricsHelper(meter=meter)
+        correlation = make_correlation()
+
+        helper.emit_metric("runtime.calls", "counter", 1.0, correlation)
+        helper.emit_metric("runtime.calls", "counter", 2.0, correlation, labels={})
+        helper.emit_metric("runtime.calls", "counter", 3.0, correlation, labels={"a": "b"})
+
+        assert meter.recorded == [
+            ("runtime.calls", 1.0, None),
+            ("runtime.calls", 2.0, None),
+            ("runtime.calls", 3.0, {"a": "b"}),
+        ]
+
+    def test_emit_many_groups_additive_metrics(self, make_correlation):
+        """Test that emit_many sums counters per label set and keeps histogram samples."""
+        meter = RecordingMeter()
+        helper = MetricsHelper(meter=meter)
+        correlation = make_correlation()
+
+        helper.emit_many(
+            [
+                ("calls", "counter", 1.0, correlation, {"status": "ok"}),
+                ("latency", "histogram", 5.0, correlation, None),
+                ("calls", "counter", 2.0, correlation, {"status": "ok"}),
+                ("calls", "counter", 1.0, correlation, {"status": "error"}),
+                ("latency", "histogram", 7.0, correlation, None),
+                ("inflight", "gauge", 1.0, correlation, None),
+                ("inflight", "gauge", -1.0, correlation, {}),
+            ]
+        )
+
+        assert meter.recorded == [
+            ("calls", 3.0, {"status": "ok"}),
+            ("calls", 1.0, {"status": "error"}),
+            ("inflight", 0.0, None),
+            ("latency", 5.0, None),
+            ("latency", 7.0, None),
+        ]
+
+    def test_emit_many_validates_before_recording(self, make_correlation):
+        """Test that an invalid record prevents the whole batch from being recorded."""
+        meter = RecordingMeter()
+        helper = MetricsHelper(meter=meter)
+        correlation = make_correlation()
+
+        with pytest.raises(ValueError, match="High-cardinality identifiers"):
+            helper.emit_many(
+                [
+                    ("batch.metric", "counter", 1.0, correlation, None),
+                    ("batch.metric", "counter", 1.0, correlation, {"run_id": correlation.run_id}),
+                ]
+            )
+        with pytest.raises(ValueError, match="Invalid metric_type"):
+            helper.emit_many(
+                [
+                    ("batch.metric", "counter", 1.0, correlation, None),
+                    ("batch.metric", "summary", 1.0, correlation, None),
+                ]
+            )
+
+        assert meter.recorded == []
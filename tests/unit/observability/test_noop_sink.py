@@ -9,7 +9,7 @@ from agent_core.contracts.observability import (
     MetricValue,
     TraceSpan,
 )
-from agent_core.observability.noop import NoOpObservabilitySink
+from agent_core.observability.noop import NOOP_SINK, NoOpObservabilitySink
 from agent_core.utils.ids import generate_correlation_id, generate_run_id
 
 
@@ -174,3 +174,7 @@ class TestNoOpObservabilitySink:
         sink.emit_trace(span)
         sink.emit_metric(metric)
         sink.emit_audit(audit_event)
+
+    def test_noop_sink_singleton(self):
+        """Test that the shared NOOP_SINK is a NoOpObservabilitySink."""
+        assert isinstance(NOOP_SINK, NoOpObservabilitySink)
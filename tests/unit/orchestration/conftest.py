@@ -0,0 +1,30 @@
+"""Shared fixtures for orchestration tests."""
+
+from pathlib import Path
+
+import pytest
+import yaml
+
+# Prefer the libyaml-backed dumper when PyYAML provides it
+_Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+@pytest.fixture(scope="session")
+def valid_flow_yaml_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write a minimal valid flow definition once per session and return its path.
+
+    Tests only read the file, so it is shared rather than recreated per test.
+    """
+    flow_data = {
+        "flow_id": "test_flow",
+        "version": "1.0.0",
+        "entrypoint": "start",
+        "nodes": {
+            "start": {"type": "agent", "agent_id": "agent1"},
+        },
+        "transitions": [],
+    }
+    path = tmp_path_factory.mktemp("flows") / "valid.yaml"
+    with open(path, "w", encoding="utf-8") as f:
+        yaml.dump(flow_data, f, Dumper=_Dumper)
+    return path
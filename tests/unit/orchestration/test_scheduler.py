@@ -2,6 +2,8 @@
 
 import threading
 import time
+from collections import deque
+from functools import partial
 
 import pytest
 
@@ -11,6 +13,11 @@ from agent_core.observability.noop import NoOpObservabilitySink
 from agent_core.orchestration.scheduler import Scheduler
 from agent_core.utils.ids import generate_correlation_id, generate_run_id
 
+# Upper bound for every blocking wait. Each test owns its Scheduler and no
+# wait is unbounded, so tests can run in any order or worker process and a
+# scheduler bug fails the test instead of hanging the run.
+WAIT_TIMEOUT = 2.0
+
 
 def create_test_config(concurrency: int = 2) -> AgentCoreConfig:
     """Create a test configuration with specified concurrency."""
@@ -44,9 +51,11 @@ class TestScheduler:
         scheduler = Scheduler(config)
 
         assert scheduler.max_concurrency == 3
-        assert scheduler.get_status()["max_concurrency"] == 3
-        assert scheduler.get_status()["running_count"] == 0
-        assert scheduler.get_status()["queued_count"] == 0
+        status = scheduler.get_status()
+        assert status["max_concurrency"] == 3
+        assert status["running_count"] == 0
+        assert status["queued_count"] == 0
+        assert status["running_tasks"] == []
 
     def test_scheduler_requires_runtime_config(self):
         """Test that scheduler requires runtime configuration."""
@@ -59,10 +68,7 @@ class TestScheduler:
         config = create_test_config(concurrency=1)
         scheduler = Scheduler(config)
 
-        result_container = {"value": None}
-
         def task_fn():
-            result_container["value"] = "completed"
             return "task_result"
 
         context = create_test_context()
@@ -74,8 +80,7 @@ class TestScheduler:
         )
 
         # Wait for completion
-        assert completion_event.wait(timeout=2.0)
-        assert result_container["value"] == "completed"
+        assert completion_event.wait(timeout=WAIT_TIMEOUT)
         assert scheduler.get_result("task-1") == "task_result"
         assert scheduler.get_status()["running_count"] == 0
 
@@ -84,45 +89,60 @@ class TestScheduler:
         config = create_test_config(concurrency=2)
         scheduler = Scheduler(config)
 
-        execution_order = []
-        lock = threading.Lock()
+        # deque.append is thread-safe, so task threads need no extra lock
+        execution_order = deque()
+        started = threading.Semaphore(0)
+        release = threading.Event()
 
-        def task_fn(task_id: str, delay: float):
-            with lock:
-                execution_order.append(f"start-{task_id}")
-            time.sleep(delay)
-            with lock:
-                execution_order.append(f"end-{task_id}")
+        def task_fn(task_id: str):
+            execution_order.append(f"start-{task_id}")
+            started.release()
+            assert release.wait(timeout=WAIT_TIMEOUT)
+            execution_order.append(f"end-{task_id}")
 
         context = create_test_context()
 
         # Schedule 3 tasks (only 2 should run concurrently)
-        scheduler.schedule(
-            task_id="task-1",
-            execute_fn=lambda: task_fn("task-1", 0.1),
-            context=context,
-            priority=0,
-        )
-        scheduler.schedule(
-            task_id="task-2",
-            execute_fn=lambda: task_fn("task-2", 0.1),
-            context=context,
-            priority=0,
-        )
-        scheduler.schedule(
-            task_id="task-3",
-            execute_fn=lambda: task_fn("task-3", 0.1),
-            context=context,
-            priority=0,
-        )
+        events = [
+            scheduler.schedule(
+                task_id="task-1",
+                execute_fn=partial(task_fn, "task-1"),
+                context=context,
+                priority=0,
+            ),
+            scheduler.schedule(
+                task_id="task-2",
+                execute_fn=partial(task_fn, "task-2"),
+                context=context,
+                priority=0,
+            ),
+            scheduler.schedule(
+                task_id="task-3",
+                execute_fn=partial(task_fn, "task-3"),
+                context=context,
+                priority=0,
+            ),
+        ]
 
-        # Wait for all tasks to complete
-        time.sleep(0.5)
+        # Two tasks run while the third waits in the queue
+        assert started.acquire(timeout=WAIT_TIMEOUT)
+        assert started.acquire(timeout=WAIT_TIMEOUT)
+        status = scheduler.get_status()
+        assert status["running_count"] == 2
+        assert status["queued_count"] == 1
+        assert "start-task-3" not in execution_order
+
+        # Let the tasks finish and wait for all of them
+        release.set()
+        for event in events:
+            assert event.wait(timeout=WAIT_TIMEOUT)
 
-        # Verify concurrency limit was respected
         status = scheduler.get_status()
         assert status["running_count"] == 0  # All tasks completed
         assert len(execution_order) == 6  # 3 starts + 3 ends
+        # The queued task only started once a running task had finished
+        first_end = min(i for i, entry in enumerate(execution_order) if entry.startswith("end-"))
+        assert execution_order.index("start-task-3") > first_end
 
     def test_priority_ordering(self):
         """Test that higher priority tasks execute before lower priority ones."""
@@ -137,27 +157,30 @@ class TestScheduler:
         context = create_test_context()
 
         # Schedule tasks with different priorities (lower priority first)
-        scheduler.schedule(
-            task_id="low-priority",
-            execute_fn=lambda: task_fn("low-priority"),
-            context=context,
-            priority=0,
-        )
-        scheduler.schedule(
-            task_id="high-priority",
-            execute_fn=lambda: task_fn("high-priority"),
-            context=context,
-            priority=10,
-        )
-        scheduler.schedule(
-            task_id="medium-priority",
-            execute_fn=lambda: task_fn("medium-priority"),
-            context=context,
-            priority=5,
-        )
+        events = [
+            scheduler.schedule(
+                task_id="low-priority",
+                execute_fn=partial(task_fn, "low-priority"),
+                context=context,
+                priority=0,
+            ),
+            scheduler.schedule(
+                task_id="high-priority",
+                execute_fn=partial(task_fn, "high-priority"),
+                context=context,
+                priority=10,
+            ),
+            scheduler.schedule(
+                task_id="medium-priority",
+                execute_fn=partial(task_fn, "medium-priority"),
+                context=context,
+                priority=5,
+            ),
+        ]
 
         # Wait for all tasks to complete
-        time.sleep(0.5)
+        for event in events:
+            assert event.wait(timeout=WAIT_TIMEOUT)
 
         # Verify priority ordering: high-priority should execute first
         assert execution_order[0] == "low-priority"  # First scheduled, starts immediately
@@ -181,16 +204,19 @@ class TestScheduler:
         context = create_test_context()
 
         # Schedule multiple tasks with same priority
-        for i in range(5):
+        events = [
             scheduler.schedule(
                 task_id=f"task-{i}",
-                execute_fn=lambda idx=i: task_fn(f"task-{idx}"),
+                execute_fn=partial(task_fn, f"task-{i}"),
                 context=context,
                 priority=0,
             )
+            for i in range(5)
+        ]
 
         # Wait for all tasks to complete
-        time.sleep(0.5)
+        for event in events:
+            assert event.wait(timeout=WAIT_TIMEOUT)
 
         # Verify all tasks executed (fairness)
         assert len(execution_order) == 5
@@ -212,9 +238,8 @@ class TestScheduler:
             priority=0,
         )
 
-        completion_event.wait(timeout=2.0)
-        result = scheduler.get_result("task-1")
-        assert result == {"result": "success", "value": 42}
+        assert completion_event.wait(timeout=WAIT_TIMEOUT)
+        assert scheduler.get_result("task-1") == {"result": "success", "value": 42}
 
     def test_task_error_handling(self):
         """Test that task errors are properly handled."""
@@ -232,7 +257,7 @@ class TestScheduler:
             priority=0,
         )
 
-        completion_event.wait(timeout=2.0)
+        assert completion_event.wait(timeout=WAIT_TIMEOUT)
 
         # Error should be raised when getting result
         with pytest.raises(ValueError, match="Task error"):
@@ -247,7 +272,7 @@ class TestScheduler:
             return "result"
 
         context = create_test_context()
-        scheduler.schedule(
+        completion_event = scheduler.schedule(
             task_id="task-1",
             execute_fn=task_fn,
             context=context,
@@ -255,7 +280,7 @@ class TestScheduler:
         )
 
         # Wait for first task to complete
-        time.sleep(0.2)
+        assert completion_event.wait(timeout=WAIT_TIMEOUT)
 
         # Try to schedule same task ID again
         with pytest.raises(ValueError, match="already scheduled or completed"):
@@ -272,7 +297,7 @@ class TestScheduler:
         scheduler = Scheduler(config)
 
         def task_fn():
-            time.sleep(0.1)
+            time.sleep(0.005)
             return "result"
 
         context = create_test_context()
@@ -284,19 +309,22 @@ class TestScheduler:
         )
 
         # Wait should return True when task completes
-        assert scheduler.wait_for_completion("task-1", timeout=2.0) is True
+        assert scheduler.wait_for_completion("task-1", timeout=WAIT_TIMEOUT) is True
 
     def test_wait_for_completion_timeout(self):
         """Test waiting for task completion with timeout."""
         config = create_test_config(concurrency=1)
         scheduler = Scheduler(config)
 
+        release = threading.Event()
+
         def task_fn():
-            time.sleep(1.0)  # Long-running task
+            # Long-running until released
+            assert release.wait(timeout=WAIT_TIMEOUT)
             return "result"
 
         context = create_test_context()
-        scheduler.schedule(
+        completion_event = scheduler.schedule(
             task_id="task-1",
             execute_fn=task_fn,
             context=context,
@@ -304,46 +332,49 @@ class TestScheduler:
         )
 
         # Wait should return False on timeout
-        assert scheduler.wait_for_completion("task-1", timeout=0.1) is False
+        assert scheduler.wait_for_completion("task-1", timeout=0.02) is False
+
+        release.set()
+        assert completion_event.wait(timeout=WAIT_TIMEOUT)
 
     def test_get_status(self):
         """Test getting scheduler status."""
         config = create_test_config(concurrency=2)
         scheduler = Scheduler(config)
 
+        started = threading.Semaphore(0)
+        release = threading.Event()
+
         def task_fn():
-            time.sleep(0.2)
+            started.release()
+            assert release.wait(timeout=WAIT_TIMEOUT)
             return "result"
 
         context = create_test_context()
 
         # Schedule tasks
-        scheduler.schedule(
-            task_id="task-1",
-            execute_fn=task_fn,
-            context=context,
-            priority=0,
-        )
-        scheduler.schedule(
-            task_id="task-2",
-            execute_fn=task_fn,
-            context=context,
-            priority=0,
-        )
-        scheduler.schedule(
-            task_id="task-3",
-            execute_fn=task_fn,
-            context=context,
-            priority=0,
-        )
+        events = [
+            scheduler.schedule(
+                task_id=f"task-{i}",
+                execute_fn=task_fn,
+                context=context,
+                priority=0,
+            )
+            for i in range(1, 4)
+        ]
 
-        # Check status immediately (should show running and queued tasks)
-        time.sleep(0.05)  # Give tasks time to start
+        # Hold the first two tasks in the running state
+        assert started.acquire(timeout=WAIT_TIMEOUT)
+        assert started.acquire(timeout=WAIT_TIMEOUT)
         status = scheduler.get_status()
         assert status["max_concurrency"] == 2
-        assert status["running_count"] <= 2
-        assert status["queued_count"] >= 0
-        assert len(status["running_tasks"]) <= 2
+        assert status["running_count"] == 2
+        assert status["queued_count"] == 1
+        assert sorted(status["running_tasks"]) == ["task-1", "task-2"]
+
+        release.set()
+        for event in events:
+            assert event.wait(timeout=WAIT_TIMEOUT)
 
     def test_scheduler_with_observability_sink(self):
         """Test that scheduler works with observability sink."""
@@ -362,5 +393,5 @@ class TestScheduler:
             priority=5,
         )
 
-        completion_event.wait(timeout=2.0)
+        assert completion_event.wait(timeout=WAIT_TIMEOUT)
         assert scheduler.get_result("task-1") == "result"
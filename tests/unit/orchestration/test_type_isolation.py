@@ -4,15 +4,69 @@ These tests ensure that LangGraph types do not leak outside the
 orchestration package and that the implementation remains replaceable.
 """
 
+import ast
+import functools
+import importlib
 import importlib.util
-import sys
+from pathlib import Path
+from types import ModuleType
 
 import pytest
 
+_HAS_LANGGRAPH = importlib.util.find_spec("langgraph") is not None
 
+# Objects can only originate from langgraph when it is installed; without it
+# these checks cannot fail, so they are skipped rather than run
+requires_langgraph = pytest.mark.skipif(not _HAS_LANGGRAPH, reason="LangGraph not installed")
+
+_CONTRACT_MODULES = (
+    "agent_core.contracts.agent",
+    "agent_core.contracts.errors",
+    "agent_core.contracts.execution_context",
+    "agent_core.contracts.flow",
+    "agent_core.contracts.observability",
+    "agent_core.contracts.service",
+    "agent_core.contracts.tool",
+)
+
+
+def _langgraph_names(module: ModuleType) -> list[str]:
+    """Return names in a module's namespace whose objects come from LangGraph.
+
+    Inspects the already-imported module instead of reading its source, so
+    no file I/O or text scanning is needed.
+    """
+    leaks = []
+    for name, value in vars(module).items():
+        # Modules carry their origin in __name__, other objects in __module__
+        origin = getattr(value, "__module__", None) or getattr(value, "__name__", "")
+        if isinstance(origin, str) and origin.split(".")[0] == "langgraph":
+            leaks.append(name)
+    return leaks
+
+
+@functools.cache
+def _imports_of(path: Path) -> frozenset[str]:
+    """Return the top-level package names a source file imports.
+
+    Relative imports are skipped; they stay within the file's own package.
+    Docstrings and comments mentioning a package do not count as imports.
+    """
+    tree = ast.parse(path.read_bytes(), filename=str(path))
+    names: set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name.split(".")[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names.add(node.module.split(".")[0])
+    return frozenset(names)
+
+
+@pytest.mark.xdist_group("orchestration")
 class TestLangGraphTypeIsolation:
     """Test that LangGraph types are isolated to orchestration package."""
 
+    @requires_langgraph
     def test_langgraph_types_not_in_public_api(self):
         """Test that LangGraph types are not exposed in public API."""
         # Import the orchestration package
@@ -54,27 +108,32 @@ class TestLangGraphTypeIsolation:
             # (it means LangGraph is truly optional)
             pass
 
+    @requires_langgraph
     def test_no_langgraph_in_core_contracts(self):
         """Test that no LangGraph types appear in core contracts."""
-        # Import core contracts
-
-        # Check that no LangGraph types are referenced
-        _ = sys.modules["agent_core.contracts"]  # Verify module exists
-        source_code = importlib.util.find_spec("agent_core.contracts")
-        if source_code and source_code.origin:
-            with open(source_code.origin) as f:
-                content = f.read()
-                # Check for LangGraph imports
-                if "langgraph" in content.lower() or "from langgraph" in content:
-                    pytest.fail("LangGraph types found in core contracts")
+        # The contracts package re-exports nothing, so each contract module
+        # is checked; import_module returns the sys.modules entry once loaded
+        for module_name in _CONTRACT_MODULES:
+            leaks = _langgraph_names(importlib.import_module(module_name))
+            if leaks:
+                pytest.fail(f"LangGraph types found in {module_name}: {leaks}")
 
+    @requires_langgraph
     def test_no_langgraph_in_runtime(self):
         """Test that no LangGraph types appear in runtime."""
+        import agent_core.runtime
+
+        leaks = _langgraph_names(agent_core.runtime)
+        if leaks:
+            pytest.fail(f"LangGraph found in runtime module: {leaks}")
+
+    @pytest.mark.parametrize("package_name", ["agent_core.contracts", "agent_core.runtime"])
+    def test_core_sources_do_not_import_langgraph(self, package_name):
+        """Test that no contracts or runtime source file imports LangGraph.
 
-        # Check runtime module doesn't import LangGraph
-        runtime_module = sys.modules["agent_core.runtime"]
-        if hasattr(runtime_module, "__file__") and runtime_module.__file__:
-            with open(runtime_module.__file__) as f:
-                content = f.read()
-                if "langgraph" in content.lower():
-                    pytest.fail("LangGraph found in runtime module")
+        Unlike the origin checks above, this does not need LangGraph installed.
+        """
+        package = importlib.import_module(package_name)
+        for path in sorted(Path(package.__file__).parent.rglob("*.py")):
+            if "langgraph" in _imports_of(path):
+                pytest.fail(f"LangGraph imported in {path.name} of {package_name}")
@@ -1,10 +1,6 @@
 """Unit tests for YAML flow loader."""
 
-import tempfile
-from pathlib import Path
-
 import pytest
-import yaml
 
 from agent_core.orchestration.yaml_loader import (
     FlowLoadError,
@@ -12,7 +8,34 @@ from agent_core.orchestration.yaml_loader import (
     load_flow_from_yaml,
 )
 
+# Documents rejected by the YAML parser itself, covering scanner, parser
+# and composer errors
+MALFORMED_YAML = (
+    "invalid: yaml: content: [",
+    "key: [unclosed",
+    "{unbalanced: 1",
+    "flow_id: a\n\tversion: b",
+    'flow_id: "unterminated',
+    "- item\nkey: value",
+    "&anchor a: *missing",
+)
+
+
+@pytest.fixture(scope="module")
+def scratch_yaml_path(tmp_path_factory):
+    """Path reused by tests that rewrite its content for each case."""
+    return tmp_path_factory.mktemp("flows") / "scratch.yaml"
+
+
+@pytest.fixture(scope="module")
+def empty_yaml_path(tmp_path_factory):
+    """Empty YAML file, written once per module."""
+    path = tmp_path_factory.mktemp("flows") / "empty.yaml"
+    path.touch()
+    return path
 
+
+@pytest.mark.xdist_group("orchestration")
 class TestYamlLoader:
     """Test YAML flow loader."""
 
@@ -41,55 +64,33 @@ class TestYamlLoader:
         with pytest.raises(FlowLoadError):
             load_flow_from_dict(flow_data)
 
-    def test_load_flow_from_yaml(self):
+    def test_load_flow_from_yaml(self, valid_flow_yaml_path):
         """Test loading flow from YAML file."""
-        flow_data = {
-            "flow_id": "test_flow",
-            "version": "1.0.0",
-            "entrypoint": "start",
-            "nodes": {
-                "start": {"type": "agent", "agent_id": "agent1"},
-            },
-            "transitions": [],
-        }
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(flow_data, f)
-            yaml_path = f.name
+        flow_config = load_flow_from_yaml(valid_flow_yaml_path)
 
-        try:
-            flow_config = load_flow_from_yaml(yaml_path)
-
-            assert flow_config.flow_id == "test_flow"
-            assert flow_config.version == "1.0.0"
-            assert flow_config.entrypoint == "start"
-        finally:
-            Path(yaml_path).unlink()
+        assert flow_config.flow_id == "test_flow"
+        assert flow_config.version == "1.0.0"
+        assert flow_config.entrypoint == "start"
 
-    def test_load_flow_from_yaml_missing_file(self):
+    def test_load_flow_from_yaml_missing_file(self, tmp_path):
         """Test loading flow from non-existent YAML file."""
         with pytest.raises(FlowLoadError, match="not found"):
-            load_flow_from_yaml("/nonexistent/flow.yaml")
+            load_flow_from_yaml(tmp_path / "missing.yaml")
+
+    def test_load_flow_from_yaml_not_a_file(self, tmp_path):
+        """Test loading flow from a directory path."""
+        with pytest.raises(FlowLoadError, match="not a file"):
+            load_flow_from_yaml(tmp_path)
 
-    def test_load_flow_from_yaml_invalid_yaml(self):
+    @pytest.mark.parametrize("content", MALFORMED_YAML)
+    def test_load_flow_from_yaml_invalid_yaml(self, scratch_yaml_path, content):
         """Test loading invalid YAML file."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write("invalid: yaml: content: [")
-            yaml_path = f.name
+        scratch_yaml_path.write_text(content, encoding="utf-8")
 
-        try:
-            with pytest.raises(FlowLoadError, match="Failed to parse"):
-                load_flow_from_yaml(yaml_path)
-        finally:
-            Path(yaml_path).unlink()
+        with pytest.raises(FlowLoadError, match="Failed to parse"):
+            load_flow_from_yaml(scratch_yaml_path)
 
-    def test_load_flow_from_yaml_empty_file(self):
+    def test_load_flow_from_yaml_empty_file(self, empty_yaml_path):
         """Test loading empty YAML file."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml_path = f.name
-
-        try:
-            with pytest.raises(FlowLoadError, match="empty"):
-                load_flow_from_yaml(yaml_path)
-        finally:
-            Path(yaml_path).unlink()
+        with pytest.raises(FlowLoadError, match="empty"):
+            load_flow_from_yaml(empty_yaml_path)
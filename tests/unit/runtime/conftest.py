@@ -0,0 +1,50 @@
+"""Shared fixtures for runtime tests."""
+
+import pytest
+
+from agent_core.configuration.schemas import AgentCoreConfig, RuntimeConfig
+from agent_core.runtime.runtime import Runtime
+
+
+class FakeSleep:
+    """Stand-in for the ``time`` module used by retry backoff.
+
+    Records requested delays instead of blocking.
+    """
+
+    def __init__(self) -> None:
+        self.delays: list[float] = []
+
+    def sleep(self, seconds: float) -> None:
+        self.delays.append(seconds)
+
+
+@pytest.fixture(autouse=True)
+def fake_sleep(monkeypatch: pytest.MonkeyPatch) -> FakeSleep:
+    """Replace the retry policy's clock so backoff never sleeps for real."""
+    clock = FakeSleep()
+    monkeypatch.setattr("agent_core.runtime.retry_policy.time", clock)
+    return clock
+
+
+@pytest.fixture(scope="module")
+def runtime_config() -> AgentCoreConfig:
+    """Runtime configuration validated once per module.
+
+    Runtime only reads its configuration, so tests share the instance.
+    """
+    return AgentCoreConfig(runtime=RuntimeConfig(runtime_id="test-runtime"))
+
+
+@pytest.fixture(scope="module")
+def fr_runtime_config() -> AgentCoreConfig:
+    """Runtime configuration with a non-default locale, validated once per module."""
+    return AgentCoreConfig(
+        runtime=RuntimeConfig(runtime_id="test-runtime", default_locale="fr-FR"),
+    )
+
+
+@pytest.fixture
+def runtime(runtime_config: AgentCoreConfig) -> Runtime:
+    """Fresh Runtime with no registered agents, built on the shared configuration."""
+    return Runtime(runtime_config)
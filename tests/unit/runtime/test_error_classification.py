@@ -1,5 +1,7 @@
 """Unit tests for error classification."""
 
+import pytest
+
 from agent_core.configuration.loader import ConfigurationError
 from agent_core.contracts.errors import ErrorCategory, ErrorSeverity
 from agent_core.governance.audit import AuditEmissionError
@@ -12,127 +14,135 @@ from agent_core.runtime.action_execution import ActionExecutionError
 from agent_core.runtime.error_classification import ErrorClassifier
 from agent_core.runtime.routing import RoutingError
 
-
-class TestErrorClassifier:
-    """Test error classification functionality."""
-
-    def test_classify_permission_error(self):
-        """Test classification of PermissionError."""
-        error = PermissionError(
+# (error, source, expected category, expected severity, expected retryable,
+# expected metadata subset)
+ERROR_CASES = (
+    (
+        PermissionError(
             "Permission denied",
             required_permissions=["read", "write"],
             available_permissions={"read": True},
-        )
-        classified = ErrorClassifier.classify(error, source="tool:test_tool")
-
-        assert classified.error_type == ErrorCategory.PERMISSION_ERROR
-        assert classified.severity == ErrorSeverity.HIGH
-        assert classified.retryable is False
-        assert classified.source == "tool:test_tool"
-        assert "required_permissions" in classified.metadata
-        assert classified.metadata["required_permissions"] == ["read", "write"]
+        ),
+        "tool:test_tool",
+        ErrorCategory.PERMISSION_ERROR,
+        ErrorSeverity.HIGH,
+        False,
+        {"required_permissions": ["read", "write"]},
+    ),
+    (
+        BudgetExhaustedError("Budget exhausted", budget_type="time", limit=60.0, consumed=65.0),
+        "runtime:test",
+        ErrorCategory.BUDGET_EXCEEDED,
+        ErrorSeverity.HIGH,
+        False,
+        {"budget_type": "time"},
+    ),
+    (
+        ConfigurationError("Invalid configuration"),
+        "config:loader",
+        ErrorCategory.VALIDATION_ERROR,
+        ErrorSeverity.MEDIUM,
+        False,
+        {},
+    ),
+    (
+        RoutingError("Agent not found"),
+        "runtime:router",
+        ErrorCategory.VALIDATION_ERROR,
+        ErrorSeverity.MEDIUM,
+        False,
+        {},
+    ),
+    (
+        FlowLoadError("Failed to load flow"),
+        "orchestration:yaml_loader",
+        ErrorCategory.VALIDATION_ERROR,
+        ErrorSeverity.MEDIUM,
+        False,
+        {},
+    ),
+    (
+        FlowExecutionError("Flow execution failed"),
+        "orchestration:flow_engine",
+        ErrorCategory.EXECUTION_FAILURE,
+        ErrorSeverity.HIGH,
+        True,
+        {},
+    ),
+    (
+        ActionExecutionError("Action execution failed"),
+        "runtime:action_executor",
+        ErrorCategory.EXECUTION_FAILURE,
+        ErrorSeverity.HIGH,
+        True,
+        {},
+    ),
+    (
+        PolicyError("Policy violation"),
+        "governance:policy",
+        ErrorCategory.PERMISSION_ERROR,
+        ErrorSeverity.HIGH,
+        False,
+        {},
+    ),
+    (
+        AuditEmissionError("Audit emission failed"),
+        "governance:audit",
+        ErrorCategory.EXECUTION_FAILURE,
+        ErrorSeverity.HIGH,
+        True,
+        {},
+    ),
+    (
+        TimeoutError("Operation timed out"),
+        "runtime:timeout",
+        ErrorCategory.TIMEOUT,
+        ErrorSeverity.MEDIUM,
+        True,
+        {},
+    ),
+    (
+        ValueError("Unknown error"),
+        "runtime:unknown",
+        ErrorCategory.EXECUTION_FAILURE,
+        ErrorSeverity.HIGH,
+        True,
+        {"exception_type": "ValueError"},
+    ),
+)
+
+
+@pytest.mark.xdist_group("runtime")
+class TestErrorClassifier:
+    """Test error classification functionality."""
 
-    def test_classify_budget_exhausted_error(self):
-        """Test classification of BudgetExhaustedError."""
-        error = BudgetExhaustedError(
-            "Budget exhausted",
-            budget_type="time",
-            limit=60.0,
-            consumed=65.0,
-        )
-        classified = ErrorClassifier.classify(error, source="runtime:test")
+    @pytest.mark.parametrize(
+        ("error", "source", "category", "severity", "retryable", "metadata"),
+        ERROR_CASES,
+        ids=[type(case[0]).__name__ for case in ERROR_CASES],
+    )
+    def test_classify(self, error, source, category, severity, retryable, metadata):
+        """Test classification of each known exception type and the fallback."""
+        classified = ErrorClassifier.classify(error, source=source)
 
-        assert classified.error_type == ErrorCategory.BUDGET_EXCEEDED
-        assert classified.severity == ErrorSeverity.HIGH
-        assert classified.retryable is False
-        assert classified.source == "runtime:test"
-        assert "budget_type" in classified.metadata
-        assert classified.metadata["budget_type"] == "time"
+        assert classified.error_type == category
+        assert classified.severity == severity
+        assert classified.retryable is retryable
+        assert classified.source == source
+        for key, value in metadata.items():
+            assert classified.metadata[key] == value
 
-    def test_classify_configuration_error(self):
-        """Test classification of ConfigurationError."""
-        error = ConfigurationError("Invalid configuration")
-        classified = ErrorClassifier.classify(error, source="config:loader")
+    def test_classify_subclass_uses_base_handler(self):
+        """Test that subclasses of known errors are classified like their base."""
 
-        assert classified.error_type == ErrorCategory.VALIDATION_ERROR
-        assert classified.severity == ErrorSeverity.MEDIUM
-        assert classified.retryable is False
-        assert classified.source == "config:loader"
+        class CustomRoutingError(RoutingError):
+            pass
 
-    def test_classify_routing_error(self):
-        """Test classification of RoutingError."""
-        error = RoutingError("Agent not found")
-        classified = ErrorClassifier.classify(error, source="runtime:router")
+        classified = ErrorClassifier.classify(CustomRoutingError("No route"), source="test:source")
 
         assert classified.error_type == ErrorCategory.VALIDATION_ERROR
-        assert classified.severity == ErrorSeverity.MEDIUM
         assert classified.retryable is False
-        assert classified.source == "runtime:router"
-
-    def test_classify_flow_load_error(self):
-        """Test classification of FlowLoadError."""
-        error = FlowLoadError("Failed to load flow")
-        classified = ErrorClassifier.classify(error, source="orchestration:yaml_loader")
-
-        assert classified.error_type == ErrorCategory.VALIDATION_ERROR
-        assert classified.severity == ErrorSeverity.MEDIUM
-        assert classified.retryable is False
-
-    def test_classify_flow_execution_error(self):
-        """Test classification of FlowExecutionError."""
-        error = FlowExecutionError("Flow execution failed")
-        classified = ErrorClassifier.classify(error, source="orchestration:flow_engine")
-
-        assert classified.error_type == ErrorCategory.EXECUTION_FAILURE
-        assert classified.severity == ErrorSeverity.HIGH
-        assert classified.retryable is True
-
-    def test_classify_action_execution_error(self):
-        """Test classification of ActionExecutionError."""
-        error = ActionExecutionError("Action execution failed")
-        classified = ErrorClassifier.classify(error, source="runtime:action_executor")
-
-        assert classified.error_type == ErrorCategory.EXECUTION_FAILURE
-        assert classified.severity == ErrorSeverity.HIGH
-        assert classified.retryable is True
-
-    def test_classify_policy_error(self):
-        """Test classification of PolicyError."""
-        error = PolicyError("Policy violation")
-        classified = ErrorClassifier.classify(error, source="governance:policy")
-
-        assert classified.error_type == ErrorCategory.PERMISSION_ERROR
-        assert classified.severity == ErrorSeverity.HIGH
-        assert classified.retryable is False
-
-    def test_classify_audit_emission_error(self):
-        """Test classification of AuditEmissionError."""
-        error = AuditEmissionError("Audit emission failed")
-        classified = ErrorClassifier.classify(error, source="governance:audit")
-
-        assert classified.error_type == ErrorCategory.EXECUTION_FAILURE
-        assert classified.severity == ErrorSeverity.HIGH
-        assert classified.retryable is True
-
-    def test_classify_timeout_error(self):
-        """Test classification of TimeoutError."""
-        error = TimeoutError("Operation timed out")
-        classified = ErrorClassifier.classify(error, source="runtime:timeout")
-
-        assert classified.error_type == ErrorCategory.TIMEOUT
-        assert classified.severity == ErrorSeverity.MEDIUM
-        assert classified.retryable is True
-
-    def test_classify_unknown_error(self):
-        """Test classification of unknown exceptions."""
-        error = ValueError("Unknown error")
-        classified = ErrorClassifier.classify(error, source="runtime:unknown")
-
-        assert classified.error_type == ErrorCategory.EXECUTION_FAILURE
-        assert classified.severity == ErrorSeverity.HIGH
-        assert classified.retryable is True
-        assert "exception_type" in classified.metadata
-        assert classified.metadata["exception_type"] == "ValueError"
+        assert classified.metadata["exception_type"] == "CustomRoutingError"
 
     def test_all_errors_conform_to_contract(self):
         """Test that all classified errors conform to the Error contract."""
@@ -1,5 +1,7 @@
 """Unit tests for ExecutionContext creation and propagation."""
 
+import uuid
+
 import pytest
 from pydantic import ValidationError
 
@@ -12,6 +14,19 @@ from agent_core.runtime.execution_context import (
 )
 
 
+def _assert_frozen(context: ExecutionContext, fields: tuple[str, ...] = ("run_id",)) -> None:
+    """Assert that assigning to each field is rejected as a frozen instance."""
+    for field in fields:
+        with pytest.raises(ValidationError, match="frozen"):
+            setattr(context, field, "new-value")
+
+
+@pytest.fixture(scope="module")
+def de_runtime_config():
+    """Runtime config with a German default locale, shared read-only."""
+    return RuntimeConfig(runtime_id="test-runtime", default_locale="de-DE")
+
+
 class TestCreateExecutionContext:
     """Test create_execution_context function."""
 
@@ -47,31 +62,21 @@ class TestCreateExecutionContext:
         assert context.observability == {"trace_id": "trace-123"}
         assert context.metadata == {"custom": "value"}
 
-    def test_create_execution_context_with_runtime_config(self):
+    def test_create_execution_context_with_runtime_config(self, de_runtime_config):
         """Test creating ExecutionContext with runtime config defaults."""
-        runtime_config = RuntimeConfig(
-            runtime_id="test-runtime",
-            default_locale="de-DE",
-        )
-
         context = create_execution_context(
             initiator="user:test",
-            runtime_config=runtime_config,
+            runtime_config=de_runtime_config,
         )
 
         assert context.locale == "de-DE"  # From runtime config
 
-    def test_create_execution_context_locale_override(self):
+    def test_create_execution_context_locale_override(self, de_runtime_config):
         """Test that explicit locale overrides runtime config default."""
-        runtime_config = RuntimeConfig(
-            runtime_id="test-runtime",
-            default_locale="de-DE",
-        )
-
         context = create_execution_context(
             initiator="user:test",
             locale="es-ES",
-            runtime_config=runtime_config,
+            runtime_config=de_runtime_config,
         )
 
         assert context.locale == "es-ES"  # Explicit override
@@ -89,21 +94,15 @@ class TestCreateExecutionContext:
         context = create_execution_context(initiator="user:test")
 
         # Attempting to modify should raise ValidationError
-        with pytest.raises(ValidationError):
-            context.run_id = "new-id"
-
-        with pytest.raises(ValidationError):
-            context.initiator = "new-initiator"
+        _assert_frozen(context, ("run_id", "initiator"))
 
     def test_create_execution_context_preserves_correlation_fields(self):
         """Test that correlation fields are properly set."""
         context = create_execution_context(initiator="user:test")
 
-        # Verify UUID format
-        import uuid
-
-        uuid.UUID(context.run_id)
-        uuid.UUID(context.correlation_id)
+        # Verify UUID v4 format
+        assert uuid.UUID(context.run_id).version == 4
+        assert uuid.UUID(context.correlation_id).version == 4
 
         # Verify they are different (correlation_id is separate from run_id)
         assert context.run_id != context.correlation_id
@@ -112,9 +111,9 @@ class TestCreateExecutionContext:
 class TestPropagateExecutionContext:
     """Test propagate_execution_context function."""
 
-    def test_propagate_execution_context_preserves_correlation_fields(self):
+    def test_propagate_execution_context_preserves_correlation_fields(self, make_context):
         """Test that propagation preserves correlation fields."""
-        original = create_execution_context(
+        original = make_context(
             initiator="user:test",
             permissions={"read": True},
             budget={"time_limit": 60},
@@ -134,9 +133,9 @@ class TestPropagateExecutionContext:
         assert propagated.observability == original.observability
         assert propagated.metadata == original.metadata
 
-    def test_propagate_execution_context_updates_metadata(self):
+    def test_propagate_execution_context_updates_metadata(self, make_context):
         """Test that propagation can update metadata."""
-        original = create_execution_context(
+        original = make_context(
             initiator="user:test",
             metadata={"key1": "value1", "key2": "value2"},
         )
@@ -152,9 +151,9 @@ class TestPropagateExecutionContext:
             "key3": "new",  # Added
         }
 
-    def test_propagate_execution_context_with_empty_metadata_updates(self):
+    def test_propagate_execution_context_with_empty_metadata_updates(self, make_context):
         """Test that propagation with empty updates preserves metadata."""
-        original = create_execution_context(
+        original = make_context(
             initiator="user:test",
             metadata={"key": "value"},
         )
@@ -163,9 +162,9 @@ class TestPropagateExecutionContext:
 
         assert propagated.metadata == original.metadata
 
-    def test_propagate_execution_context_creates_new_instance(self):
+    def test_propagate_execution_context_creates_new_instance(self, make_context):
         """Test that propagation creates a new immutable instance."""
-        original = create_execution_context(
+        original = make_context(
             initiator="user:test",
             metadata={"key": "value"},
         )
@@ -182,36 +181,35 @@ class TestPropagateExecutionContext:
         assert original.metadata == {"key": "value"}
         assert propagated.metadata == {"key": "value", "new": "data"}
 
-    def test_propagate_execution_context_is_immutable(self):
+    def test_propagate_execution_context_is_immutable(self, make_context):
         """Test that propagated context is immutable."""
-        original = create_execution_context(initiator="user:test")
+        original = make_context()
         propagated = propagate_execution_context(original)
 
-        with pytest.raises(ValidationError):
-            propagated.run_id = "new-id"
+        _assert_frozen(propagated)
 
 
 class TestEnsureImmutable:
     """Test ensure_immutable function."""
 
-    def test_ensure_immutable_with_valid_context(self):
+    def test_ensure_immutable_with_valid_context(self, make_context):
         """Test that ensure_immutable accepts valid immutable context."""
-        context = create_execution_context(initiator="user:test")
+        context = make_context()
 
         result = ensure_immutable(context)
 
         assert result is context  # Should return same instance
 
-    def test_ensure_immutable_verifies_frozen(self):
+    def test_ensure_immutable_verifies_frozen(self, make_context):
         """Test that ensure_immutable verifies context is frozen."""
-        context = create_execution_context(initiator="user:test")
+        context = make_context()
 
         # Should not raise since ExecutionContext is always frozen
         ensure_immutable(context)
 
-    def test_ensure_immutable_preserves_context(self):
+    def test_ensure_immutable_preserves_context(self, make_context):
         """Test that ensure_immutable doesn't modify context."""
-        context = create_execution_context(
+        context = make_context(
             initiator="user:test",
             metadata={"key": "value"},
         )
@@ -225,26 +223,9 @@ class TestEnsureImmutable:
 class TestExecutionContextPropagationInvariants:
     """Test invariants for ExecutionContext propagation."""
 
-    def test_correlation_fields_always_present(self):
-        """Test that correlation fields are always present in created contexts."""
-        context = create_execution_context(initiator="user:test")
-
-        assert context.run_id is not None
-        assert context.correlation_id is not None
-        assert len(context.run_id) > 0
-        assert len(context.correlation_id) > 0
-
-    def test_correlation_fields_preserved_through_propagation(self):
-        """Test that correlation fields are preserved through propagation."""
-        original = create_execution_context(initiator="user:test")
-        propagated = propagate_execution_context(original)
-
-        assert propagated.run_id == original.run_id
-        assert propagated.correlation_id == original.correlation_id
-
-    def test_multiple_propagations_preserve_correlation(self):
+    def test_multiple_propagations_preserve_correlation(self, make_context):
         """Test that multiple propagations preserve correlation fields."""
-        original = create_execution_context(initiator="user:test")
+        original = make_context()
         propagated1 = propagate_execution_context(original, {"step": 1})
         propagated2 = propagate_execution_context(propagated1, {"step": 2})
 
@@ -258,15 +239,5 @@ class TestExecutionContextPropagationInvariants:
         propagated = propagate_execution_context(context, {"update": True})
 
         # Both should be immutable
-        with pytest.raises(ValidationError):
-            context.run_id = "new"
-        with pytest.raises(ValidationError):
-            propagated.run_id = "new"
-
-    def test_different_contexts_have_different_ids(self):
-        """Test that different execution contexts have different IDs."""
-        context1 = create_execution_context(initiator="user:test1")
-        context2 = create_execution_context(initiator="user:test2")
-
-        assert context1.run_id != context2.run_id
-        assert context1.correlation_id != context2.correlation_id
+        _assert_frozen(context)
+        _assert_frozen(propagated)
@@ -3,180 +3,152 @@
 import pytest
 
 from agent_core.contracts.errors import Error, ErrorCategory, ErrorSeverity
-from agent_core.contracts.execution_context import ExecutionContext
 from agent_core.governance.budget import BudgetEnforcer, BudgetTracker
 from agent_core.runtime.retry_policy import RetryPolicy
-from agent_core.utils.ids import generate_correlation_id, generate_run_id
-
-
-def create_test_context() -> ExecutionContext:
-    """Create a test execution context."""
-    return ExecutionContext(
-        run_id=generate_run_id(),
-        correlation_id=generate_correlation_id(),
-        initiator="test:user",
-        permissions={},
-        budget={},
-        locale="en-US",
-        observability={},
-    )
 
 
-class TestRetryPolicy:
-    """Test retry policy functionality."""
-
-    def test_should_retry_retryable_error(self):
-        """Test that retryable errors are retried."""
-        policy = RetryPolicy(max_attempts=3)
-        error = Error(
-            error_id=generate_run_id(),
-            error_type=ErrorCategory.TIMEOUT,
-            message="Timeout",
-            severity=ErrorSeverity.MEDIUM,
-            retryable=True,
+@pytest.fixture(scope="module")
+def error_factory(fresh_id):
+    """Return a factory for Errors passed to should_retry.
+
+    Inputs are statically valid, so Errors are built without validation.
+    """
+
+    def factory(
+        category: ErrorCategory = ErrorCategory.TIMEOUT,
+        retryable: bool = True,
+        severity: ErrorSeverity = ErrorSeverity.MEDIUM,
+    ) -> Error:
+        return Error.model_construct(
+            error_id=fresh_id(),
+            error_type=category,
+            message=category.value,
+            severity=severity,
+            retryable=retryable,
             source="test:source",
         )
 
-        assert policy.should_retry(error, attempt=1, is_idempotent=True) is True
-        assert policy.should_retry(error, attempt=2, is_idempotent=True) is True
-        assert policy.should_retry(error, attempt=3, is_idempotent=True) is False  # Max attempts
+    return factory
 
-    def test_should_retry_non_retryable_error(self):
-        """Test that non-retryable errors are not retried."""
-        policy = RetryPolicy(max_attempts=3)
-        error = Error(
-            error_id=generate_run_id(),
-            error_type=ErrorCategory.PERMISSION_ERROR,
-            message="Permission denied",
-            severity=ErrorSeverity.HIGH,
-            retryable=False,
-            source="test:source",
-        )
 
-        assert policy.should_retry(error, attempt=1, is_idempotent=True) is False
+@pytest.fixture(scope="module")
+def default_policy():
+    """RetryPolicy with default settings; should_retry only reads it."""
+    return RetryPolicy(max_attempts=3)
 
-    def test_should_retry_non_idempotent_operation(self):
-        """Test that non-idempotent operations are not retried."""
-        policy = RetryPolicy(max_attempts=3)
-        error = Error(
-            error_id=generate_run_id(),
-            error_type=ErrorCategory.TIMEOUT,
-            message="Timeout",
-            severity=ErrorSeverity.MEDIUM,
-            retryable=True,
-            source="test:source",
-        )
 
-        assert policy.should_retry(error, attempt=1, is_idempotent=False) is False
-
-    def test_should_retry_validation_error(self):
-        """Test that validation errors are never retried."""
-        policy = RetryPolicy(max_attempts=3)
-        error = Error(
-            error_id=generate_run_id(),
-            error_type=ErrorCategory.VALIDATION_ERROR,
-            message="Validation failed",
-            severity=ErrorSeverity.MEDIUM,
-            retryable=True,  # Even if marked retryable, validation errors should not retry
-            source="test:source",
-        )
+@pytest.fixture(scope="module")
+def backoff_policy():
+    """RetryPolicy with round backoff parameters; get_retry_delay only reads it."""
+    return RetryPolicy(max_attempts=3, initial_delay=1.0, max_delay=10.0, exponential_base=2.0)
 
-        assert policy.should_retry(error, attempt=1, is_idempotent=True) is False
-
-    def test_should_retry_permission_error(self):
-        """Test that permission errors are never retried."""
-        policy = RetryPolicy(max_attempts=3)
-        error = Error(
-            error_id=generate_run_id(),
-            error_type=ErrorCategory.PERMISSION_ERROR,
-            message="Permission denied",
-            severity=ErrorSeverity.HIGH,
-            retryable=True,  # Even if marked retryable, permission errors should not retry
-            source="test:source",
-        )
 
-        assert policy.should_retry(error, attempt=1, is_idempotent=True) is False
-
-    def test_should_retry_budget_exceeded_error(self):
-        """Test that budget exceeded errors are never retried."""
-        policy = RetryPolicy(max_attempts=3)
-        error = Error(
-            error_id=generate_run_id(),
-            error_type=ErrorCategory.BUDGET_EXCEEDED,
-            message="Budget exceeded",
-            severity=ErrorSeverity.HIGH,
-            retryable=True,  # Even if marked retryable, budget errors should not retry
-            source="test:source",
-        )
+@pytest.fixture(scope="module")
+def exhausted_budget(shared_context):
+    """Budget tracker and enforcer whose cost limit is already exceeded.
 
-        assert policy.should_retry(error, attempt=1, is_idempotent=True) is False
+    Retry decisions only check the budget, so the pair is shared read-only.
+    """
+    budget_tracker = BudgetTracker(shared_context)
+    budget_tracker.cost_limit = 100.0
+    budget_tracker.record_cost(150.0)  # Exceed budget
+    return budget_tracker, BudgetEnforcer(budget_tracker, governance_config=None)
 
-    def test_should_retry_budget_exhausted(self):
-        """Test that retries are prevented when budget is exhausted."""
-        context = create_test_context()
-        budget_tracker = BudgetTracker(context)
-        budget_tracker.cost_limit = 100.0
-        budget_tracker.record_cost(150.0)  # Exceed budget
 
-        budget_enforcer = BudgetEnforcer(budget_tracker, governance_config=None)
+@pytest.fixture(scope="module")
+def exhausted_policy(exhausted_budget):
+    """RetryPolicy wired to the exhausted budget; never allows a retry."""
+    budget_tracker, budget_enforcer = exhausted_budget
+    return RetryPolicy(
+        max_attempts=3,
+        budget_tracker=budget_tracker,
+        budget_enforcer=budget_enforcer,
+    )
 
-        policy = RetryPolicy(
-            max_attempts=3,
-            budget_tracker=budget_tracker,
-            budget_enforcer=budget_enforcer,
-        )
 
-        error = Error(
-            error_id=generate_run_id(),
-            error_type=ErrorCategory.TIMEOUT,
-            message="Timeout",
-            severity=ErrorSeverity.MEDIUM,
-            retryable=True,
-            source="test:source",
-        )
+def _succeed():
+    """Operation that succeeds on the first attempt."""
+    return "success"
 
-        # Should not retry because budget is exhausted
-        assert policy.should_retry(error, attempt=1, is_idempotent=True) is False
-
-    def test_get_retry_delay(self):
-        """Test retry delay calculation."""
-        policy = RetryPolicy(
-            max_attempts=3,
-            initial_delay=1.0,
-            max_delay=10.0,
-            exponential_base=2.0,
-        )
 
-        delay1 = policy.get_retry_delay(attempt=1)
-        delay2 = policy.get_retry_delay(attempt=2)
-        delay3 = policy.get_retry_delay(attempt=3)
+def _time_out():
+    """Operation that always fails with a retryable error."""
+    raise TimeoutError("Timeout")
 
-        # Delays should increase exponentially
-        assert delay1 > 0
-        assert delay2 > delay1
-        assert delay3 > delay2
 
-        # Delays should be capped at max_delay
-        assert delay1 <= 10.0
-        assert delay2 <= 10.0
-        assert delay3 <= 10.0
+def _deny_permission():
+    """Operation that always fails with a non-retryable error."""
+    raise PermissionError("Permission denied")
 
-    def test_execute_with_retry_success(self):
-        """Test successful execution without retries."""
-        policy = RetryPolicy(max_attempts=3)
 
-        def operation():
-            return "success"
+class TestRetryPolicy:
+    """Test retry policy functionality."""
+
+    @pytest.mark.parametrize(
+        ("category", "retryable", "expected"),
+        [
+            (ErrorCategory.TIMEOUT, True, True),
+            (ErrorCategory.PERMISSION_ERROR, False, False),
+            # Even if marked retryable, these categories are never retried
+            (ErrorCategory.VALIDATION_ERROR, True, False),
+            (ErrorCategory.PERMISSION_ERROR, True, False),
+            (ErrorCategory.BUDGET_EXCEEDED, True, False),
+        ],
+        ids=["retryable", "non_retryable", "validation", "permission", "budget_exceeded"],
+    )
+    def test_should_retry_by_category(
+        self, error_factory, default_policy, category, retryable, expected
+    ):
+        """Test retry decisions by error category and retryable flag."""
+        error = error_factory(category, retryable=retryable)
+
+        assert default_policy.should_retry(error, attempt=1, is_idempotent=True) is expected
+
+    def test_should_retry_stops_at_max_attempts(self, error_factory, default_policy):
+        """Test that retryable errors are retried until max attempts."""
+        error = error_factory()
+
+        assert default_policy.should_retry(error, attempt=2, is_idempotent=True) is True
+        assert default_policy.should_retry(error, attempt=3, is_idempotent=True) is False
 
-        context = create_test_context()
-        result = policy.execute_with_retry(operation, context, is_idempotent=True)
+    def test_should_retry_non_idempotent_operation(self, error_factory, default_policy):
+        """Test that non-idempotent operations are not retried."""
+        error = error_factory()
+
+        assert default_policy.should_retry(error, attempt=1, is_idempotent=False) is False
+
+    def test_should_retry_budget_exhausted(self, error_factory, exhausted_policy):
+        """Test that retries are prevented when budget is exhausted."""
+        error = error_factory()
+
+        # Should not retry because budget is exhausted
+        assert exhausted_policy.should_retry(error, attempt=1, is_idempotent=True) is False
+
+    @pytest.mark.parametrize(
+        ("attempt", "base_delay"),
+        [
+            (1, 1.0),
+            (2, 2.0),
+            (3, 4.0),
+            (5, 10.0),  # 16.0 capped at max_delay
+        ],
+    )
+    def test_get_retry_delay(self, backoff_policy, attempt, base_delay):
+        """Test exponential backoff, capping, and the up-to-10% jitter."""
+        delay = backoff_policy.get_retry_delay(attempt=attempt)
+
+        assert base_delay <= delay <= base_delay * 1.1
+
+    def test_execute_with_retry_success(self, shared_context, default_policy):
+        """Test successful execution without retries."""
+        result = default_policy.execute_with_retry(_succeed, shared_context, is_idempotent=True)
 
         assert result == "success"
 
-    def test_execute_with_retry_succeeds_after_retries(self):
+    def test_execute_with_retry_succeeds_after_retries(
+        self, fake_sleep, shared_context, default_policy
+    ):
         """Test execution that succeeds after retries."""
-        policy = RetryPolicy(max_attempts=3, initial_delay=0.1)
-
         attempt_count = {"count": 0}
 
         def operation():
@@ -185,85 +157,48 @@ class TestRetryPolicy:
                 raise TimeoutError("Timeout")
             return "success"
 
-        context = create_test_context()
-        result = policy.execute_with_retry(operation, context, is_idempotent=True)
+        result = default_policy.execute_with_retry(operation, shared_context, is_idempotent=True)
 
         assert result == "success"
         assert attempt_count["count"] == 3
+        # One backoff before each retry, growing exponentially
+        assert len(fake_sleep.delays) == 2
+        assert fake_sleep.delays[1] > fake_sleep.delays[0]
 
-    def test_execute_with_retry_exhausts_retries(self):
+    def test_execute_with_retry_exhausts_retries(self, fake_sleep, shared_context, default_policy):
         """Test execution that exhausts all retries."""
-        policy = RetryPolicy(max_attempts=3, initial_delay=0.1)
-
-        def operation():
-            raise TimeoutError("Timeout")
-
-        context = create_test_context()
-
         with pytest.raises(TimeoutError, match="Timeout"):
-            policy.execute_with_retry(operation, context, is_idempotent=True)
+            default_policy.execute_with_retry(_time_out, shared_context, is_idempotent=True)
 
-    def test_execute_with_retry_non_retryable_error(self):
-        """Test that non-retryable errors are not retried."""
-        policy = RetryPolicy(max_attempts=3)
-
-        def operation():
-            raise PermissionError("Permission denied")
-
-        context = create_test_context()
+        # No backoff after the final attempt
+        assert len(fake_sleep.delays) == 2
 
+    def test_execute_with_retry_non_retryable_error(self, shared_context, default_policy):
+        """Test that non-retryable errors are not retried."""
         with pytest.raises(PermissionError, match="Permission denied"):
-            policy.execute_with_retry(operation, context, is_idempotent=True)
+            default_policy.execute_with_retry(_deny_permission, shared_context, is_idempotent=True)
 
-    def test_execute_with_retry_non_idempotent_operation(self):
+    def test_execute_with_retry_non_idempotent_operation(
+        self, fake_sleep, shared_context, default_policy
+    ):
         """Test that non-idempotent operations are not retried."""
-        policy = RetryPolicy(max_attempts=3)
-
-        def operation():
-            raise TimeoutError("Timeout")
-
-        context = create_test_context()
-
         with pytest.raises(TimeoutError, match="Timeout"):
-            policy.execute_with_retry(operation, context, is_idempotent=False)
-
-    def test_execute_with_retry_respects_budget(self):
-        """Test that retries respect budget constraints."""
-        context = create_test_context()
-        budget_tracker = BudgetTracker(context)
-        budget_tracker.cost_limit = 100.0
-        budget_tracker.record_cost(150.0)  # Exceed budget
-
-        budget_enforcer = BudgetEnforcer(budget_tracker, governance_config=None)
-
-        policy = RetryPolicy(
-            max_attempts=3,
-            budget_tracker=budget_tracker,
-            budget_enforcer=budget_enforcer,
-        )
+            default_policy.execute_with_retry(_time_out, shared_context, is_idempotent=False)
 
-        def operation():
-            raise TimeoutError("Timeout")
+        assert fake_sleep.delays == []
 
+    def test_execute_with_retry_respects_budget(self, shared_context, exhausted_policy):
+        """Test that retries respect budget constraints."""
         # Should not retry due to budget exhaustion
         with pytest.raises(TimeoutError, match="Timeout"):
-            policy.execute_with_retry(operation, context, is_idempotent=True)
+            exhausted_policy.execute_with_retry(_time_out, shared_context, is_idempotent=True)
 
-    def test_retry_policy_deterministic(self):
+    def test_retry_policy_deterministic(self, error_factory, default_policy):
         """Test that retry policy behavior is deterministic."""
-        policy = RetryPolicy(max_attempts=3, initial_delay=1.0)
-
-        error = Error(
-            error_id=generate_run_id(),
-            error_type=ErrorCategory.TIMEOUT,
-            message="Timeout",
-            severity=ErrorSeverity.MEDIUM,
-            retryable=True,
-            source="test:source",
-        )
+        error = error_factory()
 
         # Same inputs should produce same results
-        result1 = policy.should_retry(error, attempt=1, is_idempotent=True)
-        result2 = policy.should_retry(error, attempt=1, is_idempotent=True)
+        result1 = default_policy.should_retry(error, attempt=1, is_idempotent=True)
+        result2 = default_policy.should_retry(error, attempt=1, is_idempotent=True)
 
         assert result1 == result2
@@ -1,128 +1,142 @@
 """Unit tests for deterministic routing."""
 
+import re
+from collections.abc import Callable
+
 import pytest
 
 from agent_core.contracts.agent import AgentInput, AgentResult
 from agent_core.contracts.execution_context import ExecutionContext
 from agent_core.runtime.routing import Router, RoutingError
 
+# RoutingError messages, compiled once for pytest.raises(match=...)
+_NO_IMPLICIT = re.compile("No implicit routing is allowed")
+_NOT_REGISTERED = re.compile("is not registered")
+_NO_CAPABILITY_MATCH = re.compile("No agent found with required capabilities")
 
-class MockAgent:
-    """Mock agent for testing."""
-
-    def __init__(self, agent_id: str, version: str, capabilities: list[str]):
-        """Initialize mock agent."""
-        self._agent_id = agent_id
-        self._version = version
-        self._capabilities = capabilities
-
-    @property
-    def agent_id(self) -> str:
-        """Agent identifier."""
-        return self._agent_id
+# Default MockAgent result, validated once. AgentResult is mutable (the
+# runtime appends action errors to it), so each run returns a deep copy.
+_SUCCESS_RESULT = AgentResult(status="success", output={"result": "test"})
 
-    @property
-    def agent_version(self) -> str:
-        """Agent version."""
-        return self._version
 
-    @property
-    def capabilities(self) -> list[str]:
-        """Agent capabilities."""
-        return self._capabilities
+class MockAgent:
+    """Mock agent for testing.
+
+    Identity fields are plain slot attributes. Slots leave no instance dict
+    to rebind ``run`` on, so tests that need a custom behaviour pass it as
+    ``run`` instead.
+    """
+
+    __slots__ = ("agent_id", "agent_version", "capabilities", "_run")
+
+    def __init__(
+        self,
+        agent_id: str,
+        version: str,
+        capabilities: list[str],
+        run: Callable[[AgentInput, ExecutionContext], AgentResult] | None = None,
+    ):
+        """Initialize mock agent."""
+        self.agent_id = agent_id
+        self.agent_version = version
+        self.capabilities = capabilities
+        self._run = run
 
     def run(self, input_data: AgentInput, context: ExecutionContext) -> AgentResult:
         """Execute agent."""
-        return AgentResult(status="success", output={"result": "test"})
-
-
-class TestRouter:
-    """Test Router."""
-
-    def test_select_agent_by_id(self):
-        """Test selecting agent by explicit ID."""
-        agent1 = MockAgent("agent1", "1.0.0", ["cap1", "cap2"])
-        agent2 = MockAgent("agent2", "1.0.0", ["cap3"])
-
-        router = Router({"agent1": agent1, "agent2": agent2})
-
-        selected = router.select_agent(agent_id="agent1")
-        assert selected.agent_id == "agent1"
-
-    def test_select_agent_by_capabilities(self):
-        """Test selecting agent by required capabilities."""
-        agent1 = MockAgent("agent1", "1.0.0", ["cap1", "cap2"])
-        agent2 = MockAgent("agent2", "1.0.0", ["cap3"])
+        if self._run is not None:
+            return self._run(input_data, context)
+        return _SUCCESS_RESULT.model_copy(deep=True)
 
-        router = Router({"agent1": agent1, "agent2": agent2})
 
-        selected = router.select_agent(required_capabilities=["cap1"])
-        assert selected.agent_id == "agent1"
+@pytest.fixture(scope="module")
+def router():
+    """Router over three agents, registered out of alphabetical order.
 
-    def test_select_agent_by_capabilities_multiple_match(self):
-        """Test that multiple matching agents are resolved deterministically."""
-        agent1 = MockAgent("agent_a", "1.0.0", ["cap1", "cap2"])
-        agent2 = MockAgent("agent_b", "1.0.0", ["cap1", "cap3"])
+    Selection only reads the router, so tests share one instance.
+    """
+    return Router(
+        {
+            "agent_b": MockAgent("agent_b", "1.0.0", ["cap1", "cap3"]),
+            "agent_a": MockAgent("agent_a", "1.0.0", ["cap1", "cap2"]),
+            "agent_c": MockAgent("agent_c", "1.0.0", ["cap4"]),
+        }
+    )
 
-        router = Router({"agent_b": agent2, "agent_a": agent1})
 
-        # Should select deterministically (alphabetical by agent_id)
-        selected = router.select_agent(required_capabilities=["cap1"])
-        assert selected.agent_id == "agent_a"  # Alphabetically first
-
-    def test_select_agent_no_criteria_raises_error(self):
-        """Test that selection without criteria raises error."""
-        agent1 = MockAgent("agent1", "1.0.0", ["cap1"])
-        router = Router({"agent1": agent1})
-
-        with pytest.raises(RoutingError, match="No implicit routing is allowed"):
-            router.select_agent()
-
-    def test_select_agent_not_found_raises_error(self):
-        """Test that selecting non-existent agent raises error."""
-        agent1 = MockAgent("agent1", "1.0.0", ["cap1"])
-        router = Router({"agent1": agent1})
-
-        with pytest.raises(RoutingError, match="is not registered"):
-            router.select_agent(agent_id="nonexistent")
-
-    def test_select_agent_no_capability_match_raises_error(self):
-        """Test that no capability match raises error."""
-        agent1 = MockAgent("agent1", "1.0.0", ["cap1"])
-        router = Router({"agent1": agent1})
-
-        with pytest.raises(RoutingError, match="No agent found with required capabilities"):
-            router.select_agent(required_capabilities=["cap2"])
+class TestRouter:
+    """Test Router."""
 
-    def test_list_agents(self):
+    @pytest.mark.parametrize(
+        ("kwargs", "expected"),
+        [
+            ({"agent_id": "agent_b"}, "agent_b"),
+            ({"required_capabilities": ["cap4"]}, "agent_c"),
+            # Multiple matches resolve alphabetically by agent_id
+            ({"required_capabilities": ["cap1"]}, "agent_a"),
+            # Only agent_b has both capabilities
+            ({"required_capabilities": frozenset({"cap1", "cap3"})}, "agent_b"),
+        ],
+        ids=["by_id", "by_capabilities", "multiple_match", "requires_all"],
+    )
+    def test_select_agent(self, router, kwargs, expected):
+        """Test deterministic selection by ID and by required capabilities."""
+        assert router.select_agent(**kwargs).agent_id == expected
+
+    @pytest.mark.parametrize(
+        ("kwargs", "match"),
+        [
+            ({}, _NO_IMPLICIT),
+            ({"agent_id": "nonexistent"}, _NOT_REGISTERED),
+            ({"required_capabilities": ["cap5"]}, _NO_CAPABILITY_MATCH),
+            # No agent has all three capabilities
+            ({"required_capabilities": frozenset({"cap1", "cap2", "cap3"})}, _NO_CAPABILITY_MATCH),
+            ({"required_capabilities": [1]}, _NO_CAPABILITY_MATCH),
+        ],
+        ids=[
+            "no_criteria",
+            "not_registered",
+            "no_capability_match",
+            "requires_all",
+            "non_str_capability",
+        ],
+    )
+    def test_select_agent_raises_error(self, router, kwargs, match):
+        """Test that failed selections raise RoutingError."""
+        with pytest.raises(RoutingError, match=match):
+            router.select_agent(**kwargs)
+
+    def test_no_capability_match_message_lists_sorted_capabilities(self, router):
+        """Test that the error lists required capabilities in a stable order."""
+        with pytest.raises(RoutingError) as exc_info:
+            router.select_agent(required_capabilities=frozenset({"cap9", "cap5"}))
+
+        assert str(exc_info.value).endswith("['cap5', 'cap9']")
+
+    def test_non_str_agent_capabilities_are_indexed(self):
+        """Test that non-str agent capabilities do not break router construction."""
+        router = Router({"agent1": MockAgent("agent1", "1.0.0", [1, "cap1"])})
+
+        assert router.select_agent(required_capabilities=["cap1"]).agent_id == "agent1"
+
+    def test_router_agents_are_a_read_only_snapshot(self):
+        """Test that the router cannot drift from the agents it indexed."""
+        agents = {"agent1": MockAgent("agent1", "1.0.0", ["cap1"])}
+        router = Router(agents)
+
+        agents["agent2"] = MockAgent("agent2", "1.0.0", ["cap2"])
+
+        assert router.get_agent("agent2") is None
+        with pytest.raises(RoutingError, match=_NOT_REGISTERED):
+            router.select_agent(agent_id="agent2")
+        with pytest.raises(TypeError):
+            router.agents["agent2"] = agents["agent2"]  # type: ignore[index]
+
+    def test_list_agents(self, router):
         """Test listing all registered agents."""
-        agent1 = MockAgent("agent1", "1.0.0", ["cap1"])
-        agent2 = MockAgent("agent2", "1.0.0", ["cap2"])
+        assert router.list_agents() == ["agent_a", "agent_b", "agent_c"]
 
-        router = Router({"agent1": agent1, "agent2": agent2})
-
-        agent_ids = router.list_agents()
-        assert set(agent_ids) == {"agent1", "agent2"}
-
-    def test_get_agent(self):
+    def test_get_agent(self, router):
         """Test getting agent by ID."""
-        agent1 = MockAgent("agent1", "1.0.0", ["cap1"])
-        router = Router({"agent1": agent1})
-
-        assert router.get_agent("agent1") == agent1
+        assert router.get_agent("agent_a") is router.agents["agent_a"]
         assert router.get_agent("nonexistent") is None
-
-    def test_capability_matching_requires_all(self):
-        """Test that capability matching requires all capabilities."""
-        agent1 = MockAgent("agent1", "1.0.0", ["cap1", "cap2"])
-        agent2 = MockAgent("agent2", "1.0.0", ["cap1"])
-
-        router = Router({"agent1": agent1, "agent2": agent2})
-
-        # Should match agent1 which has both capabilities
-        selected = router.select_agent(required_capabilities=["cap1", "cap2"])
-        assert selected.agent_id == "agent1"
-
-        # Should not match agent2 which only has cap1
-        with pytest.raises(RoutingError):
-            router.select_agent(required_capabilities=["cap1", "cap2", "cap3"])
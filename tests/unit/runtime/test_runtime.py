@@ -1,29 +1,32 @@
 """Unit tests for main Runtime class."""
 
+import re
+from types import MappingProxyType
+
 import pytest
 
-from agent_core.configuration.schemas import AgentCoreConfig, RuntimeConfig
+from agent_core.configuration.schemas import AgentCoreConfig
 from agent_core.contracts.agent import AgentInput, AgentResult
 from agent_core.contracts.execution_context import ExecutionContext
-from agent_core.runtime.execution_context import create_execution_context
-from agent_core.runtime.lifecycle import LifecycleEvent
+from agent_core.runtime.lifecycle import LifecycleEvent, LifecycleManager, LifecycleState
 from agent_core.runtime.routing import RoutingError
 from agent_core.runtime.runtime import Runtime
 from tests.unit.runtime.test_routing import MockAgent
 
+# RoutingError messages, compiled once for pytest.raises(match=...)
+_NO_IMPLICIT = re.compile("No implicit routing is allowed")
+_NOT_REGISTERED = re.compile("is not registered")
+
+# Shared agent input; read-only so no test can alter it for the others
+_TEST_INPUT = MappingProxyType({"test": "data"})
+
 
 class TestRuntime:
     """Test Runtime class."""
 
-    def test_runtime_initialization(self):
+    def test_runtime_initialization(self, runtime, runtime_config):
         """Test runtime initialization."""
-        config = AgentCoreConfig(
-            runtime=RuntimeConfig(runtime_id="test-runtime"),
-        )
-
-        runtime = Runtime(config)
-
-        assert runtime.config == config
+        assert runtime.config == runtime_config
         assert len(runtime.agents) == 0
 
     def test_runtime_initialization_requires_runtime_config(self):
@@ -33,63 +36,43 @@ class TestRuntime:
         with pytest.raises(ValueError, match="Runtime configuration is required"):
             Runtime(config)
 
-    def test_register_agent(self):
+    def test_register_agent(self, runtime):
         """Test registering an agent."""
-        config = AgentCoreConfig(
-            runtime=RuntimeConfig(runtime_id="test-runtime"),
-        )
-        runtime = Runtime(config)
-
         agent = MockAgent("agent1", "1.0.0", ["cap1"])
         runtime.register_agent(agent)
 
         assert "agent1" in runtime.agents
         assert runtime.agents["agent1"] == agent
 
-    def test_execute_agent_by_id(self):
-        """Test executing an agent by ID."""
-        config = AgentCoreConfig(
-            runtime=RuntimeConfig(runtime_id="test-runtime"),
-        )
-        runtime = Runtime(config)
-
-        agent = MockAgent("agent1", "1.0.0", ["cap1"])
-        runtime.register_agent(agent)
+    @pytest.mark.parametrize(
+        "selection",
+        [{"agent_id": "agent1"}, {"required_capabilities": ["cap1"]}],
+        ids=["by_id", "by_capabilities"],
+    )
+    def test_execute_agent(self, runtime, selection):
+        """Test executing an agent selected by ID or by capabilities."""
+        runtime.register_agent(MockAgent("agent1", "1.0.0", ["cap1", "cap2"]))
 
         result = runtime.execute_agent(
-            agent_id="agent1",
-            input_data={"test": "data"},
+            input_data=_TEST_INPUT,
             initiator="user:test",
+            **selection,
         )
 
         assert result.status == "success"
         assert result.output == {"result": "test"}
 
-    def test_execute_agent_by_capabilities(self):
-        """Test executing an agent by capabilities."""
-        config = AgentCoreConfig(
-            runtime=RuntimeConfig(runtime_id="test-runtime"),
-        )
-        runtime = Runtime(config)
-
-        agent = MockAgent("agent1", "1.0.0", ["cap1", "cap2"])
-        runtime.register_agent(agent)
-
-        result = runtime.execute_agent(
-            required_capabilities=["cap1"],
-            input_data={"test": "data"},
-        )
+    def test_register_agent_updates_capability_routing(self, runtime):
+        """Test that agents registered after a capability lookup are routed to."""
+        runtime.register_agent(MockAgent("agent_b", "1.0.0", ["cap1"]))
+        assert runtime.router.select_agent(required_capabilities=["cap1"]).agent_id == "agent_b"
 
-        assert result.status == "success"
+        runtime.register_agent(MockAgent("agent_a", "1.0.0", ["cap1"]))
+        assert runtime.router.select_agent(required_capabilities=["cap1"]).agent_id == "agent_a"
 
-    def test_execute_agent_creates_context_if_not_provided(self):
+    def test_execute_agent_creates_context_if_not_provided(self, fr_runtime_config):
         """Test that runtime creates context if not provided."""
-        config = AgentCoreConfig(
-            runtime=RuntimeConfig(runtime_id="test-runtime", default_locale="fr-FR"),
-        )
-        runtime = Runtime(config)
-
-        agent = MockAgent("agent1", "1.0.0", ["cap1"])
+        runtime = Runtime(fr_runtime_config)
 
         def check_context(input_data: AgentInput, context: ExecutionContext) -> AgentResult:
             """Agent that checks context."""
@@ -97,24 +80,14 @@ class TestRuntime:
             assert context.initiator == "user:test"
             return AgentResult(status="success", output={})
 
-        agent.run = check_context
+        agent = MockAgent("agent1", "1.0.0", ["cap1"], run=check_context)
         runtime.register_agent(agent)
 
         runtime.execute_agent(agent_id="agent1", initiator="user:test")
 
-    def test_execute_agent_with_provided_context(self):
+    def test_execute_agent_with_provided_context(self, runtime, make_context):
         """Test executing with provided context."""
-        config = AgentCoreConfig(
-            runtime=RuntimeConfig(runtime_id="test-runtime"),
-        )
-        runtime = Runtime(config)
-
-        context = create_execution_context(
-            initiator="user:custom",
-            locale="de-DE",
-        )
-
-        agent = MockAgent("agent1", "1.0.0", ["cap1"])
+        context = make_context(initiator="user:custom", locale="de-DE")
 
         def check_context(input_data: AgentInput, ctx: ExecutionContext) -> AgentResult:
             """Agent that checks context."""
@@ -122,57 +95,36 @@ class TestRuntime:
             assert ctx.initiator == "user:custom"
             return AgentResult(status="success", output={})
 
-        agent.run = check_context
+        agent = MockAgent("agent1", "1.0.0", ["cap1"], run=check_context)
         runtime.register_agent(agent)
 
         runtime.execute_agent(agent_id="agent1", context=context)
 
-    def test_execute_agent_routing_error(self):
-        """Test that routing errors are raised."""
-        config = AgentCoreConfig(
-            runtime=RuntimeConfig(runtime_id="test-runtime"),
-        )
-        runtime = Runtime(config)
-
-        with pytest.raises(RoutingError):
-            runtime.execute_agent(agent_id="nonexistent")
-
-    def test_execute_agent_no_selection_criteria(self):
-        """Test that execution without selection criteria fails."""
-        config = AgentCoreConfig(
-            runtime=RuntimeConfig(runtime_id="test-runtime"),
-        )
-        runtime = Runtime(config)
-
-        with pytest.raises(RoutingError, match="No implicit routing is allowed"):
-            runtime.execute_agent()
-
-    def test_execute_agent_handles_agent_errors(self):
+    @pytest.mark.parametrize(
+        ("selection", "match"),
+        [({"agent_id": "nonexistent"}, _NOT_REGISTERED), ({}, _NO_IMPLICIT)],
+        ids=["not_registered", "no_selection_criteria"],
+    )
+    def test_execute_agent_routing_error(self, runtime, selection, match):
+        """Test that routing errors are raised, including for missing criteria."""
+        with pytest.raises(RoutingError, match=match):
+            runtime.execute_agent(**selection)
+
+    def test_execute_agent_handles_agent_errors(self, runtime):
         """Test that agent errors are handled."""
-        config = AgentCoreConfig(
-            runtime=RuntimeConfig(runtime_id="test-runtime"),
-        )
-        runtime = Runtime(config)
-
-        agent = MockAgent("agent1", "1.0.0", ["cap1"])
 
         def failing_agent(input_data: AgentInput, context: ExecutionContext) -> AgentResult:
             """Agent that raises an error."""
             raise ValueError("Agent error")
 
-        agent.run = failing_agent
+        agent = MockAgent("agent1", "1.0.0", ["cap1"], run=failing_agent)
         runtime.register_agent(agent)
 
         with pytest.raises(RuntimeError, match="Runtime execution failed"):
             runtime.execute_agent(agent_id="agent1")
 
-    def test_execute_agent_synchronous(self):
+    def test_execute_agent_synchronous(self, runtime):
         """Test that execution is synchronous (v1 constraint)."""
-        config = AgentCoreConfig(
-            runtime=RuntimeConfig(runtime_id="test-runtime"),
-        )
-        runtime = Runtime(config)
-
         agent = MockAgent("agent1", "1.0.0", ["cap1"])
         runtime.register_agent(agent)
 
@@ -180,23 +132,13 @@ class TestRuntime:
         result = runtime.execute_agent(agent_id="agent1")
         assert result.status == "success"
 
-    def test_get_lifecycle_events_returns_empty_before_execution(self):
-        """Test that get_lifecycle_events returns empty list before execution."""
-        config = AgentCoreConfig(
-            runtime=RuntimeConfig(runtime_id="test-runtime"),
-        )
-        runtime = Runtime(config)
-
+    def test_get_lifecycle_events_returns_empty_before_execution(self, runtime):
+        """Test that get_lifecycle_events returns an empty tuple before execution."""
         events = runtime.get_lifecycle_events()
-        assert events == []
+        assert events == ()
 
-    def test_get_lifecycle_events_returns_events_after_execution(self):
+    def test_get_lifecycle_events_returns_events_after_execution(self, runtime):
         """Test that get_lifecycle_events returns events after execution."""
-        config = AgentCoreConfig(
-            runtime=RuntimeConfig(runtime_id="test-runtime"),
-        )
-        runtime = Runtime(config)
-
         agent = MockAgent("agent1", "1.0.0", ["cap1"])
         runtime.register_agent(agent)
 
@@ -215,13 +157,8 @@ class TestRuntime:
         # TERMINATION_STARTED may or may not be present depending on whether
         # execution transitions through TERMINATED (COMPLETED is terminal)
 
-    def test_get_lifecycle_events_includes_metadata(self):
+    def test_get_lifecycle_events_includes_metadata(self, runtime):
         """Test that lifecycle events include metadata."""
-        config = AgentCoreConfig(
-            runtime=RuntimeConfig(runtime_id="test-runtime"),
-        )
-        runtime = Runtime(config)
-
         agent = MockAgent("agent1", "1.0.0", ["cap1"])
         runtime.register_agent(agent)
 
@@ -236,13 +173,8 @@ class TestRuntime:
         for _, metadata in events:
             assert isinstance(metadata, dict)
 
-    def test_get_lifecycle_events_accessible_after_completion(self):
+    def test_get_lifecycle_events_accessible_after_completion(self, runtime):
         """Test that lifecycle events are accessible after execution completes."""
-        config = AgentCoreConfig(
-            runtime=RuntimeConfig(runtime_id="test-runtime"),
-        )
-        runtime = Runtime(config)
-
         agent = MockAgent("agent1", "1.0.0", ["cap1"])
         runtime.register_agent(agent)
 
@@ -256,13 +188,46 @@ class TestRuntime:
             len(events) >= 3
         )  # At least INITIALIZATION_COMPLETED, EXECUTION_STARTED, EXECUTION_COMPLETED
 
-    def test_get_lifecycle_events_tracks_multiple_executions(self):
-        """Test that lifecycle events are tracked per execution."""
-        config = AgentCoreConfig(
-            runtime=RuntimeConfig(runtime_id="test-runtime"),
-        )
-        runtime = Runtime(config)
+    def test_get_lifecycle_events_published_when_termination_fails(self, runtime, monkeypatch):
+        """Test that events are published even if the final transition raises."""
+        runtime.register_agent(MockAgent("agent1", "1.0.0", ["cap1"]))
+        original_transition = LifecycleManager.transition_to
 
+        def failing_transition(self, new_state, metadata=None):
+            if new_state == LifecycleState.TERMINATED:
+                raise RuntimeError("transition failed")
+            original_transition(self, new_state, metadata)
+
+        # Force the terminal transition in the finally block and make it fail
+        monkeypatch.setattr(LifecycleManager, "is_terminal", lambda self: False)
+        monkeypatch.setattr(LifecycleManager, "transition_to", failing_transition)
+
+        with pytest.raises(RuntimeError, match="transition failed"):
+            runtime.execute_agent(agent_id="agent1")
+
+        event_types = [event for event, _ in runtime.get_lifecycle_events()]
+        assert LifecycleEvent.EXECUTION_COMPLETED in event_types
+
+    def test_get_lifecycle_events_published_when_correlation_fails(self, runtime, monkeypatch):
+        """Test that a failure before the agent runs replaces the previous events."""
+        runtime.register_agent(MockAgent("agent1", "1.0.0", ["cap1"]))
+        runtime.execute_agent(agent_id="agent1")
+        previous_events = runtime.get_lifecycle_events()
+
+        def failing_correlation(**fields):
+            raise ValueError("correlation failed")
+
+        monkeypatch.setattr("agent_core.runtime.runtime.CorrelationFields", failing_correlation)
+
+        with pytest.raises(ValueError, match="correlation failed"):
+            runtime.execute_agent(agent_id="agent1")
+
+        events = runtime.get_lifecycle_events()
+        assert events is not previous_events
+        assert LifecycleEvent.EXECUTION_COMPLETED not in [event for event, _ in events]
+
+    def test_get_lifecycle_events_tracks_multiple_executions(self, runtime):
+        """Test that lifecycle events are tracked per execution."""
         agent = MockAgent("agent1", "1.0.0", ["cap1"])
         runtime.register_agent(agent)
 
@@ -4,9 +4,16 @@ import pytest
 
 from agent_core.contracts.execution_context import ExecutionContext
 from agent_core.contracts.tool import ToolInput, ToolResult
-from agent_core.runtime.execution_context import create_execution_context
 from agent_core.tools.base import BaseTool
 
+# ConcreteTool result, validated once; ToolResult is mutable, so each call
+# returns a deep copy
+_TOOL_SUCCESS = ToolResult(
+    status="success",
+    output={"result": "test"},
+    metrics={"latency_ms": 10.0},
+)
+
 
 class ConcreteTool(BaseTool):
     """Concrete tool implementation for testing."""
@@ -34,11 +41,7 @@ class ConcreteTool(BaseTool):
 
     def execute(self, input_data: ToolInput, context: ExecutionContext) -> ToolResult:
         """Execute tool."""
-        return ToolResult(
-            status="success",
-            output={"result": "test"},
-            metrics={"latency_ms": 10.0},
-        )
+        return _TOOL_SUCCESS.model_copy(deep=True)
 
 
 class TestBaseTool:
@@ -57,13 +60,12 @@ class TestBaseTool:
         assert tool.tool_version == "1.0.0"
         assert tool.permissions_required == ["read", "write"]
 
-    def test_concrete_tool_execute(self):
+    def test_concrete_tool_execute(self, shared_context):
         """Test that concrete tool can execute."""
         tool = ConcreteTool("tool1", "1.0.0", ["read"])
-        context = create_execution_context(initiator="user:test")
         input_data = ToolInput(payload={"test": "data"})
 
-        result = tool.execute(input_data, context)
+        result = tool.execute(input_data, shared_context)
 
         assert result.status == "success"
         assert result.output == {"result": "test"}